@@ -67,14 +67,23 @@ import subprocess
 import sys
 import logging
 import math
+import multiprocessing
 import re
 import os
 import uuid
+import functools
+import gc
+import hashlib
+import pickle
+import time
 import shutil
-from collections import defaultdict, OrderedDict
+import tempfile
+import threading
+from collections import defaultdict, deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Future
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Set, List, Tuple, Optional, NamedTuple, Callable
+from typing import Dict, Set, FrozenSet, List, Tuple, Optional, NamedTuple, Callable, Iterable, Sequence
 import textwrap
 
 # 尝试导入 oracledb，如果失败则提示安装
@@ -114,27 +123,74 @@ RemapRules = Dict[str, str]
 SourceObjectMap = Dict[str, Set[str]]  # {'OWNER.OBJ': {'TYPE1', 'TYPE2'}}
 FullObjectMapping = Dict[str, Dict[str, str]]  # {'OWNER.OBJ': {'TYPE': 'TGT_OWNER.OBJ'}}
 MasterCheckList = List[Tuple[str, str, str]]  # [(src_name, tgt_name, type)]
+# adjust_ddl_for_object 的替换查找表: ({(SRC_SCHEMA, SRC_NAME): (TGT_SCHEMA, TGT_NAME)}, {SRC_SCHEMA: {SRC_NAME: 'TGT.NAME'}})
+ReplacementLookups = Tuple[Dict[Tuple[str, str], Tuple[str, str]], Dict[str, Dict[str, str]]]
 ReportResults = Dict[str, List]
 # object_counts_summary keys: oracle/oceanbase/missing/extra -> {OBJECT_TYPE: count}
 ObjectCountSummary = Dict[str, Dict[str, int]]
 
-# --- 全局 obclient timeout（秒），由配置初始化 ---
+# --- obclient 默认超时（秒）；实际值由 load_config 写入 ob_cfg['timeout']，调用时也可单独指定 ---
 OBC_TIMEOUT: int = 60
 
+# OB 元数据转储时同时运行的 obclient 进程数默认值（可由 ob_dump_parallelism 覆盖）
+OB_DUMP_MAX_WORKERS: int = 8
+
+# 目标表数量低于该值时，在 OB 表级元数据查询中追加 TABLE_NAME IN 过滤（同时避免超长 IN 列表）
+OB_TABLE_NAME_FILTER_LIMIT: int = 1000
+
+# OB 元数据查询中 OWNER IN (...) 每批的 schema 数；schema 很多时按批拆分为多条查询并发执行，
+# 避免超长 IN 列表导致优化器放弃按 owner 走索引
+OB_OWNER_CHUNK_SIZE: int = 64
+
+# 单次 obclient -e 多语句脚本的字符上限（Linux 单参数上限为 128KB，保留余量）
+OBC_MAX_SCRIPT_CHARS: int = 100000
+
+# 单个多语句脚本最多合并的语句数；脚本内语句串行执行，超时按语句数放大，脚本之间仍并发
+OB_SCRIPT_MAX_STATEMENTS: int = 4
+
+# OB 元数据 pickle 缓存的结构版本：ObMetadata 内部结构变化时递增，旧缓存自动失效
+OB_META_CACHE_FORMAT: int = 3
+
+# Oracle 源对象清单 pickle 缓存的结构版本：SourceObjectMap 结构或指纹口径变化时递增
+SOURCE_OBJECTS_CACHE_FORMAT: int = 1
+
 # --- 模型定义 ---
+class ObColumnInfo(NamedTuple):
+    """目标端列只参与“列名集合 + VARCHAR 长度”比对；每列一个元组，代替逐列构造的小 dict。"""
+    data_type: str
+    char_length: Optional[int]
+
+
+class IndexInfo(NamedTuple):
+    """两端共用的索引记录；columns 在读取 IND_COLUMNS 后按列位置顺序原地追加。"""
+    uniqueness: str
+    columns: List[str]
+
+
+class ConstraintInfo(NamedTuple):
+    """两端共用的约束记录；外键引用信息仅源端 Oracle 提供。"""
+    type: str
+    columns: List[str]
+    r_owner: Optional[str] = None
+    r_constraint: Optional[str] = None
+    ref_table_owner: Optional[str] = None
+    ref_table_name: Optional[str] = None
+
+
 class ObMetadata(NamedTuple):
     """
     一次性从 OceanBase dump 出来的元数据，用于本地对比。
     """
     objects_by_type: Dict[str, Set[str]]                 # OBJECT_TYPE -> {OWNER.OBJ}
-    tab_columns: Dict[Tuple[str, str], Dict[str, Dict]]   # (OWNER, TABLE_NAME) -> {COLUMN_NAME: {type, length, etc.}}
-    indexes: Dict[Tuple[str, str], Dict[str, Dict]]      # (OWNER, TABLE_NAME) -> {INDEX_NAME: {uniqueness, columns[list]}}
-    constraints: Dict[Tuple[str, str], Dict[str, Dict]]  # (OWNER, TABLE_NAME) -> {CONS_NAME: {type, columns[list]}}
+    tab_columns: Dict[Tuple[str, str], Dict[str, ObColumnInfo]]  # (OWNER, TABLE_NAME) -> {COLUMN_NAME: ObColumnInfo}
+    indexes: Dict[Tuple[str, str], Dict[str, IndexInfo]]           # (OWNER, TABLE_NAME) -> {INDEX_NAME: IndexInfo}
+    constraints: Dict[Tuple[str, str], Dict[str, ConstraintInfo]]  # (OWNER, TABLE_NAME) -> {CONS_NAME: ConstraintInfo}
     triggers: Dict[Tuple[str, str], Dict[str, Dict]]     # (OWNER, TABLE_NAME) -> {TRG_NAME: {event, status}}
     sequences: Dict[str, Set[str]]                       # SEQUENCE_OWNER -> {SEQUENCE_NAME}
     table_comments: Dict[Tuple[str, str], Optional[str]] # (OWNER, TABLE_NAME) -> COMMENT
     column_comments: Dict[Tuple[str, str], Dict[str, Optional[str]]]  # (OWNER, TABLE_NAME) -> {COLUMN_NAME: COMMENT}
     comments_complete: bool                              # 元数据是否完整加载（两端失败则跳过注释校验）
+    tables_by_owner: Dict[str, FrozenSet[str]]           # OWNER -> {TABLE_NAME}，表存在性检查直接按 (owner, table) 探测
 
 
 class OracleMetadata(NamedTuple):
@@ -142,8 +198,8 @@ class OracleMetadata(NamedTuple):
     源端 Oracle 的元数据缓存，避免在循环中重复查询。
     """
     table_columns: Dict[Tuple[str, str], Dict[str, Dict]]   # (OWNER, TABLE_NAME) -> 列定义
-    indexes: Dict[Tuple[str, str], Dict[str, Dict]]        # (OWNER, TABLE_NAME) -> 索引
-    constraints: Dict[Tuple[str, str], Dict[str, Dict]]    # (OWNER, TABLE_NAME) -> 约束
+    indexes: Dict[Tuple[str, str], Dict[str, IndexInfo]]          # (OWNER, TABLE_NAME) -> 索引（uniqueness 已大写）
+    constraints: Dict[Tuple[str, str], Dict[str, ConstraintInfo]] # (OWNER, TABLE_NAME) -> 约束（type 已大写）
     triggers: Dict[Tuple[str, str], Dict[str, Dict]]       # (OWNER, TABLE_NAME) -> 触发器
     sequences: Dict[str, Set[str]]                         # OWNER -> {SEQUENCE_NAME}
     table_comments: Dict[Tuple[str, str], Optional[str]]   # (OWNER, TABLE_NAME) -> COMMENT
@@ -194,6 +250,7 @@ PRIMARY_OBJECT_TYPES: Tuple[str, ...] = (
     'TYPE',
     'TYPE BODY'
 )
+PRIMARY_OBJECT_TYPE_SET: FrozenSet[str] = frozenset(PRIMARY_OBJECT_TYPES)
 
 # 主对象中除 TABLE 外均做存在性验证
 PRIMARY_EXISTENCE_ONLY_TYPES: Tuple[str, ...] = tuple(
@@ -218,9 +275,34 @@ EXTRA_OBJECT_CHECK_TYPES: Tuple[str, ...] = (
     'TRIGGER'
 )
 
+# 只读的空集合，用作 dict.get 的默认值，避免每次探测都新建 set()
+EMPTY_FROZENSET: FrozenSet[str] = frozenset()
+
 # 注释比对时批量 IN 子句的大小，避免 ORA-01795
 COMMENT_BATCH_SIZE = 200
 
+# 显式开启多进程 (extra_check_workers != 1) 后，扩展对象校验的表数达到该值时才真正 fork；
+# 每个子进程任务处理的表数
+EXTRA_CHECK_PARALLEL_MIN_TABLES = 2000
+EXTRA_CHECK_CHUNK_SIZE = 256
+
+# DBMS_METADATA 兜底导出 DDL 时每条 SQL 批量获取的对象数
+ORACLE_DDL_BATCH_SIZE = 100
+
+# 修补脚本固定的文件头提示（预先编码）
+FIXUP_HEADER_NOTICE = "-- 本文件由校验工具自动生成，请在 OceanBase 执行前仔细审核。\n\n".encode('utf-8')
+
+# Oracle 元数据查询的单次 fetch 行数（同时用于 prefetchrows），减少网络往返次数
+ORACLE_FETCH_ARRAYSIZE = 5000
+
+# 并发加载 Oracle 元数据时 session pool 的最大会话数
+ORACLE_METADATA_MAX_SESSIONS = 8
+
+# 待校验表不超过该数量时，Oracle 表级元数据按 (OWNER, TABLE_NAME) 在 SQL 端过滤，
+# 否则按 owner 整体拉取再在客户端过滤；每批 IN 列表的表数需低于 ORA-01795 的 1000 上限
+ORACLE_TABLE_FILTER_MAX_TABLES = 2000
+ORACLE_TABLE_FILTER_BATCH_SIZE = 500
+
 # OceanBase 目标端自动生成且需在列对比中忽略的 OMS 列
 IGNORED_OMS_COLUMNS: Tuple[str, ...] = (
     "OMS_OBJECT_NUMBER",
@@ -229,6 +311,9 @@ IGNORED_OMS_COLUMNS: Tuple[str, ...] = (
     "OMS_ROW_NUMBER",
 )
 
+# 同一名单的 SQL 字面量形式，用于在列查询中直接下推过滤
+IGNORED_OMS_COLUMNS_SQL = ",".join(f"'{col}'" for col in IGNORED_OMS_COLUMNS)
+
 
 def is_ignored_oms_column(col_name: Optional[str], col_meta: Optional[Dict] = None) -> bool:
     """
@@ -302,34 +387,79 @@ def chunk_list(items: List[str], size: int) -> List[List[str]]:
     return [items[i:i + size] for i in range(0, len(items), size)]
 
 
+def open_fetch_cursor(connection):
+    """
+    打开一个调大 arraysize/prefetchrows 的 Oracle 游标。
+    默认 arraysize=100 时每 100 行一次网络往返，大 schema 下元数据拉取会被 RTT 拖慢。
+    必须在 execute() 之前设置才会生效。
+    """
+    cursor = connection.cursor()
+    cursor.arraysize = ORACLE_FETCH_ARRAYSIZE
+    cursor.prefetchrows = ORACLE_FETCH_ARRAYSIZE + 1
+    return cursor
+
+
+def iter_cursor_rows(cursor):
+    """按 arraysize 批量 fetchmany，逐行产出结果。"""
+    while True:
+        rows = cursor.fetchmany()
+        if not rows:
+            break
+        yield from rows
+
+
+# owner 列表以集合类型整体绑定：`IN (SELECT COLUMN_VALUE FROM TABLE(:owners))`
+ORACLE_NAME_LIST_TYPE = "SYS.ODCIVARCHAR2LIST"
+ORACLE_OWNER_LIST_FILTER = "(SELECT COLUMN_VALUE FROM TABLE(:owners))"
+
+
+def prepare_list_binds(connection, binds):
+    """
+    将命名绑定中的 list 值转换为 SYS.ODCIVARCHAR2LIST 集合对象，位置绑定 (list) 原样返回。
+    集合绑定让 SQL 文本与 owner 个数无关，可复用语句缓存；同名绑定变量可在 SQL 中多次引用。
+    """
+    if not isinstance(binds, dict):
+        return binds
+    list_type = None
+    prepared = {}
+    for name, value in binds.items():
+        if isinstance(value, list):
+            if list_type is None:
+                list_type = connection.gettype(ORACLE_NAME_LIST_TYPE)
+            value = list_type.newobject(value)
+        prepared[name] = value
+    return prepared
+
+
 # --- 扩展检查结果结构 ---
+# 缺失/多余名称在比对阶段排序一次并存为元组，报告与修补脚本直接按序使用
 class IndexMismatch(NamedTuple):
     table: str
-    missing_indexes: Set[str]
-    extra_indexes: Set[str]
+    missing_indexes: Tuple[str, ...]
+    extra_indexes: Tuple[str, ...]
     detail_mismatch: List[str]
 
 
 class ConstraintMismatch(NamedTuple):
     table: str
-    missing_constraints: Set[str]
-    extra_constraints: Set[str]
+    missing_constraints: Tuple[str, ...]
+    extra_constraints: Tuple[str, ...]
     detail_mismatch: List[str]
 
 
 class SequenceMismatch(NamedTuple):
     src_schema: str
     tgt_schema: str
-    missing_sequences: Set[str]
-    extra_sequences: Set[str]
+    missing_sequences: Tuple[str, ...]
+    extra_sequences: Tuple[str, ...]
     note: Optional[str] = None
     missing_mappings: List[Tuple[str, str]] = []
 
 
 class TriggerMismatch(NamedTuple):
     table: str
-    missing_triggers: Set[str]
-    extra_triggers: Set[str]
+    missing_triggers: Tuple[str, ...]
+    extra_triggers: Tuple[str, ...]
     detail_mismatch: List[str]
     missing_mappings: List[Tuple[str, str]] = []
 
@@ -345,9 +475,18 @@ class CommentMismatch(NamedTuple):
 ExtraCheckResults = Dict[str, List]
 
 
-def normalize_column_sequence(columns: Optional[List[str]]) -> Tuple[str, ...]:
+def normalize_column_sequence(columns: Optional[Sequence[str]]) -> Tuple[str, ...]:
     if not columns:
-        return tuple()
+        return ()
+    return _normalize_column_tuple(tuple(columns))
+
+
+@functools.lru_cache(maxsize=65536)
+def _normalize_column_tuple(columns: Tuple[Optional[str], ...]) -> Tuple[str, ...]:
+    """
+    大写并按首次出现去重。索引/约束列序列高度重复（同一列组合会在索引、PK/UK、FK
+    与两端元数据间反复出现），按元组缓存后重复调用只需一次字典命中。
+    """
     seen: Set[str] = set()
     normalized: List[str] = []
     for col in columns:
@@ -440,7 +579,8 @@ DBCAT_OUTPUT_DIR_HINTS: Dict[str, Tuple[str, ...]] = {
 def load_config(config_file: str) -> Tuple[OraConfig, ObConfig, Dict]:
     """读取 config.ini 配置文件"""
     log.info(f"正在加载配置文件: {config_file}")
-    config = configparser.ConfigParser()
+    # 配置项均为字面值（口令等可能包含 '%'），关闭插值：既避免误解析报错，也省去每次取值时的插值处理
+    config = configparser.ConfigParser(interpolation=None)
     if not config.read(config_file):
         log.error(f"严重错误: 配置文件 {config_file} 未找到或无法读取。")
         sys.exit(1)
@@ -459,8 +599,9 @@ def load_config(config_file: str) -> Tuple[OraConfig, ObConfig, Dict]:
 
         # fixup 脚本目录
         settings.setdefault('fixup_dir', 'fixup_scripts')
-        # obclient 超时时间 (秒)
+        # obclient 超时时间 (秒)；列元数据查询最大，可单独放宽，留空则为 obclient_timeout 的 5 倍
         settings.setdefault('obclient_timeout', '60')
+        settings.setdefault('obclient_timeout_columns', '')
         # 报告输出目录
         settings.setdefault('report_dir', 'main_reports')
         # Oracle Instant Client 目录 (Thick Mode)
@@ -478,6 +619,17 @@ def load_config(config_file: str) -> Tuple[OraConfig, ObConfig, Dict]:
         settings.setdefault('check_comments', 'true')
         settings.setdefault('infer_schema_mapping', 'true')
         settings.setdefault('dbcat_chunk_size', '150')
+        # 扩展对象校验的进程数：0 表示按 CPU 核数自动，1 表示串行
+        settings.setdefault('extra_check_workers', '1')
+        # 修补脚本各段的并行线程数：1 表示串行（默认），0 表示每段一个线程
+        settings.setdefault('fixup_workers', '1')
+        # OB 元数据转储时同时运行的 obclient 进程数
+        settings.setdefault('ob_dump_parallelism', str(OB_DUMP_MAX_WORKERS))
+        # OB 元数据本地缓存：ttl 单位秒，0 表示不使用缓存
+        settings.setdefault('metadata_cache_dir', '.cache/ob_meta')
+        settings.setdefault('ob_meta_cache_ttl', '0')
+        # Oracle 源对象清单本地缓存：ttl 单位秒，0 表示不使用缓存；命中前会校验源端对象指纹
+        settings.setdefault('source_objects_cache_ttl', '0')
 
         enabled_primary_types = parse_type_list(
             settings.get('check_primary_types', ''),
@@ -507,15 +659,42 @@ def load_config(config_file: str) -> Tuple[OraConfig, ObConfig, Dict]:
             settings['dbcat_chunk_size'] = int(settings.get('dbcat_chunk_size', '150'))
         except ValueError:
             settings['dbcat_chunk_size'] = 150
+        try:
+            settings['extra_check_workers'] = max(0, int(settings.get('extra_check_workers', '1')))
+        except ValueError:
+            settings['extra_check_workers'] = 1
+        try:
+            settings['fixup_workers'] = max(0, int(settings.get('fixup_workers', '1')))
+        except ValueError:
+            settings['fixup_workers'] = 1
+        try:
+            settings['ob_dump_parallelism'] = max(1, int(settings.get('ob_dump_parallelism', OB_DUMP_MAX_WORKERS)))
+        except ValueError:
+            settings['ob_dump_parallelism'] = OB_DUMP_MAX_WORKERS
+        try:
+            settings['ob_meta_cache_ttl'] = max(0, int(settings.get('ob_meta_cache_ttl', '0')))
+        except ValueError:
+            settings['ob_meta_cache_ttl'] = 0
+        try:
+            settings['source_objects_cache_ttl'] = max(0, int(settings.get('source_objects_cache_ttl', '0')))
+        except ValueError:
+            settings['source_objects_cache_ttl'] = 0
 
-        global OBC_TIMEOUT
         try:
-            OBC_TIMEOUT = int(settings['obclient_timeout'])
+            settings['obclient_timeout'] = int(settings['obclient_timeout'])
         except ValueError:
-            OBC_TIMEOUT = 60
+            settings['obclient_timeout'] = OBC_TIMEOUT
+        try:
+            settings['obclient_timeout_columns'] = int(settings['obclient_timeout_columns'])
+        except ValueError:
+            settings['obclient_timeout_columns'] = settings['obclient_timeout'] * 5
+        ob_cfg['timeout'] = settings['obclient_timeout']
 
         log.info(f"成功加载配置，将扫描 {len(schemas_list)} 个源 schema。")
-        log.info(f"obclient 超时时间: {OBC_TIMEOUT} 秒")
+        log.info(
+            "obclient 超时时间: %s 秒 (列元数据查询: %s 秒)",
+            settings['obclient_timeout'], settings['obclient_timeout_columns']
+        )
         log.warning(
             "注意：程序将从 DBA_* 视图读取 Oracle/OceanBase 元数据，请确保运行账号具备 DBA/SELECT ANY DICTIONARY/SELECT_CATALOG_ROLE 等等价权限，否则结果将不完整。"
         )
@@ -593,7 +772,7 @@ def run_config_wizard(config_path: Path) -> None:
         log.error("交互式向导需要可用的标准输入/终端。请在可交互环境运行或直接编辑 config.ini。")
         sys.exit(1)
 
-    cfg = configparser.ConfigParser()
+    cfg = configparser.ConfigParser(interpolation=None)
     if config_path.exists():
         cfg.read(config_path, encoding="utf-8")
         log.info("已加载现有配置，将检查缺失/无效项后写回: %s", config_path)
@@ -825,31 +1004,31 @@ def run_config_wizard(config_path: Path) -> None:
     log.info("配置已保存: %s", config_path)
 
 
+# remap 规则行：SRC = TGT；源端不能以 '#'/'=' 开头，两侧空白由模式本身吞掉
+REMAP_LINE_PATTERN = re.compile(r'^\s*([^#=\s][^=]*?)\s*=\s*(.*?)\s*$')
+
+
 def load_remap_rules(file_path: str) -> RemapRules:
     """从 txt 文件加载 remap 规则"""
     log.info(f"正在加载 Remap 规则文件: {file_path}")
     rules: RemapRules = {}
+    match_line = REMAP_LINE_PATTERN.match
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
             for i, line in enumerate(f):
-                line = line.strip()
-                if not line or line.startswith('#'):
+                m = match_line(line)
+                if m is None:
+                    stripped = line.strip()
+                    if stripped and not stripped.startswith('#'):
+                        log.warning("  [规则警告] 第 %d 行格式错误，已跳过: %s", i + 1, stripped)
                     continue
 
-                if '=' not in line:
-                    log.warning(f"  [规则警告] 第 {i+1} 行格式错误，已跳过: {line}")
+                src_obj = m.group(1).upper()
+                tgt_obj = m.group(2).upper()
+                if not tgt_obj or '.' not in src_obj or '.' not in tgt_obj:
+                    log.warning("  [规则警告] 第 %d 行格式无效 (必须为 'SCHEMA.OBJ')，已跳过: %s", i + 1, line.strip())
                     continue
-
-                try:
-                    src_obj, tgt_obj = line.split('=', 1)
-                    src_obj = src_obj.strip().upper()
-                    tgt_obj = tgt_obj.strip().upper()
-                    if not src_obj or not tgt_obj or '.' not in src_obj or '.' not in tgt_obj:
-                        log.warning(f"  [规则警告] 第 {i+1} 行格式无效 (必须为 'SCHEMA.OBJ')，已跳过: {line}")
-                        continue
-                    rules[src_obj] = tgt_obj
-                except Exception:
-                    log.warning(f"  [规则警告] 第 {i+1} 行解析失败，已跳过: {line}")
+                rules[src_obj] = tgt_obj
 
     except FileNotFoundError:
         log.warning(f"  [警告] Remap 文件 {file_path} 未找到。将按 1:1 规则继续。")
@@ -894,79 +1073,66 @@ def get_source_objects(ora_cfg: OraConfig, schemas_list: List[str]) -> SourceObj
       SYNONYM / JOB / SCHEDULE / TYPE / TYPE BODY / TRIGGER / SEQUENCE / INDEX
     """
     log.info(f"正在连接 Oracle 源端: {ora_cfg['dsn']}...")
+    try:
+        with oracledb.connect(
+            user=ora_cfg['user'],
+            password=ora_cfg['password'],
+            dsn=ora_cfg['dsn']
+        ) as connection:
+            log.info("Oracle 连接成功。正在查询源对象列表...")
+            return _query_source_objects(connection, schemas_list)
+    except oracledb.Error as e:
+        log.error(f"严重错误: 连接或查询 Oracle 失败: {e}")
+        sys.exit(1)
+
 
-    placeholders = ','.join([f":{i+1}" for i in range(len(schemas_list))])
+def _query_source_objects(connection, schemas_list: List[str]) -> SourceObjectMap:
+    """在已建立的连接上查询源对象清单；get_source_objects 与源对象缓存共用，oracledb.Error 由调用方处理。"""
     object_types_clause = ",".join(f"'{obj}'" for obj in ALL_TRACKED_OBJECT_TYPES)
 
+    # 对象清单与物化视图清单合并为一条 UNION ALL，首列标记来源，一次执行/一组 fetch 即可取回；
+    # 名称的去空白/大写在 SQL 端完成，逐行解析不再调用 strip()/upper()
     sql = f"""
-        SELECT OWNER, OBJECT_NAME, OBJECT_TYPE
+        SELECT 'O', UPPER(TRIM(OWNER)), UPPER(TRIM(OBJECT_NAME)), UPPER(TRIM(OBJECT_TYPE))
         FROM DBA_OBJECTS
-        WHERE OWNER IN ({placeholders})
+        WHERE OWNER IN {ORACLE_OWNER_LIST_FILTER}
           AND OBJECT_TYPE IN (
               {object_types_clause}
           )
+        UNION ALL
+        SELECT 'M', UPPER(TRIM(OWNER)), UPPER(TRIM(MVIEW_NAME)), NULL
+        FROM DBA_MVIEWS
+        WHERE OWNER IN {ORACLE_OWNER_LIST_FILTER}
     """
 
     source_objects: SourceObjectMap = defaultdict(set)
     mview_pairs: Set[Tuple[str, str]] = set()
-    table_pairs: Set[Tuple[str, str]] = set()
 
-    try:
-        with oracledb.connect(
-            user=ora_cfg['user'],
-            password=ora_cfg['password'],
-            dsn=ora_cfg['dsn']
-        ) as connection:
-            log.info("Oracle 连接成功。正在查询源对象列表...")
-            with connection.cursor() as cursor:
-                cursor.execute(sql, schemas_list)
-                for row in cursor:
-                    owner = (row[0] or '').strip().upper()
-                    obj_name = (row[1] or '').strip().upper()
-                    obj_type = (row[2] or '').strip().upper()
-                    if not owner or not obj_name or not obj_type:
-                        continue
-                    full_name = f"{owner}.{obj_name}"
-                    source_objects[full_name].add(obj_type)
-            # 精确认定物化视图集合，避免误删真实表
-            with connection.cursor() as cursor:
-                cursor.execute(
-                    f"SELECT OWNER, MVIEW_NAME FROM DBA_MVIEWS WHERE OWNER IN ({placeholders})",
-                    schemas_list
-                )
-                for row in cursor:
-                    owner = (row[0] or '').strip().upper()
-                    name = (row[1] or '').strip().upper()
-                    if owner and name:
-                        mview_pairs.add((owner, name))
-            with connection.cursor() as cursor:
-                cursor.execute(
-                    f"SELECT OWNER, TABLE_NAME FROM DBA_TABLES WHERE OWNER IN ({placeholders})",
-                    schemas_list
-                )
-                for row in cursor:
-                    owner = (row[0] or '').strip().upper()
-                    name = (row[1] or '').strip().upper()
-                    if owner and name:
-                        table_pairs.add((owner, name))
-    except oracledb.Error as e:
-        log.error(f"严重错误: 连接或查询 Oracle 失败: {e}")
-        sys.exit(1)
+    with open_fetch_cursor(connection) as cursor:
+        cursor.execute(sql, prepare_list_binds(connection, {"owners": list(schemas_list)}))
+        for row in iter_cursor_rows(cursor):
+            owner = row[1]
+            obj_name = row[2]
+            if not owner or not obj_name:
+                continue
+            if row[0] == 'M':
+                # 精确认定物化视图集合，避免误删真实表
+                mview_pairs.add((owner, obj_name))
+                continue
+            obj_type = row[3]
+            if not obj_type:
+                continue
+            full_name = f"{owner}.{obj_name}"
+            source_objects[full_name].add(obj_type)
 
     # Materialized View 在 DBA_OBJECTS 中通常会同时作为 TABLE 出现，去重以避免误将 MV 当成 TABLE 校验/抽取。
+    # 只有确定存在于 DBA_MVIEWS 的对象才移除 TABLE 标记：直接遍历物化视图集合，无需扫描全部源对象（键在插入时已大写）
     mview_dedup = 0
-    pure_tables = table_pairs - mview_pairs  # DBA_TABLES 也包含 MVIEW，这里只保留真实 TABLE
-    for full_name, types in source_objects.items():
-        if 'MATERIALIZED VIEW' in types and 'TABLE' in types:
-            try:
-                owner, name = full_name.split('.', 1)
-            except ValueError:
-                continue
-            key = (owner.upper(), name.upper())
-            # 只有确定该对象存在于 DBA_MVIEWS 且不在“纯表”列表时，才移除 TABLE 标记
-            if key in mview_pairs and key not in pure_tables:
-                types.discard('TABLE')
-                mview_dedup += 1
+    for owner, name in mview_pairs:
+        types = source_objects.get(f"{owner}.{name}")
+        if types and 'MATERIALIZED VIEW' in types and 'TABLE' in types:
+            types.discard('TABLE')
+            mview_dedup += 1
     if mview_dedup:
         log.info(
             "检测到 %d 个 MATERIALIZED VIEW 同时出现在 TABLE 列表中，已移除重复的 TABLE 类型以使用 --mview 处理。",
@@ -981,6 +1147,81 @@ def get_source_objects(ora_cfg: OraConfig, schemas_list: List[str]) -> SourceObj
     return dict(source_objects)
 
 
+def get_source_objects_fingerprint(connection, schemas_list: List[str]) -> Optional[Tuple[int, str]]:
+    """
+    以一次聚合查询取源端对象的数量与最近 DDL 时间，作为源对象缓存的有效性指纹。
+    新建/删除/重建对象通常会改变其中之一；LAST_DDL_TIME 只精确到秒，同一秒内删除并重建
+    且总数不变的情况无法察觉。查询失败时返回 None（视为不可缓存）。
+    """
+    sql = f"""
+        SELECT COUNT(*), TO_CHAR(MAX(LAST_DDL_TIME), 'YYYY-MM-DD HH24:MI:SS')
+        FROM DBA_OBJECTS
+        WHERE OWNER IN {ORACLE_OWNER_LIST_FILTER}
+    """
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(sql, prepare_list_binds(connection, {"owners": list(schemas_list)}))
+            row = cursor.fetchone()
+    except oracledb.Error as e:
+        log.warning("查询 Oracle 源对象指纹失败，本次不使用源对象缓存: %s", e)
+        return None
+    if not row:
+        return None
+    return int(row[0] or 0), row[1] or ''
+
+
+def load_source_objects_cached(
+    ora_cfg: OraConfig,
+    schemas_list: List[str],
+    cache_dir: str,
+    ttl_seconds: int,
+    refresh: bool = False
+) -> SourceObjectMap:
+    """
+    带本地缓存的 get_source_objects。缓存键包含缓存格式、连接目标、schema 列表、受管类型与源端对象指纹，
+    源端 DDL 变化会使旧缓存失效；ttl 为 0 时直接查询。refresh=True 时跳过读取但仍写回缓存。
+    指纹查询与未命中时的全量查询共用同一个连接。
+    """
+    if ttl_seconds <= 0:
+        return get_source_objects(ora_cfg, schemas_list)
+
+    log.info(f"正在连接 Oracle 源端: {ora_cfg['dsn']}...")
+    cache_path: Optional[Path] = None
+    try:
+        with oracledb.connect(
+            user=ora_cfg['user'],
+            password=ora_cfg['password'],
+            dsn=ora_cfg['dsn']
+        ) as connection:
+            fingerprint = get_source_objects_fingerprint(connection, schemas_list)
+            if fingerprint is not None:
+                cache_key = make_cache_key(
+                    SOURCE_OBJECTS_CACHE_FORMAT,
+                    ora_cfg.get('dsn'), ora_cfg.get('user'),
+                    sorted(schemas_list),
+                    ALL_TRACKED_OBJECT_TYPES,
+                    fingerprint
+                )
+                cache_path = Path(cache_dir) / f"source_objects_{cache_key}.pkl"
+                if not refresh:
+                    cached = load_pickle_cache(cache_path, ttl_seconds)
+                    if cached is not None:
+                        log.info(
+                            "使用缓存的 Oracle 源对象清单 (%d 个对象，源端指纹未变化)。",
+                            sum(len(types) for types in cached.values())
+                        )
+                        return cached
+            log.info("Oracle 连接成功。正在查询源对象列表...")
+            source_objects = _query_source_objects(connection, schemas_list)
+    except oracledb.Error as e:
+        log.error(f"严重错误: 连接或查询 Oracle 失败: {e}")
+        sys.exit(1)
+
+    if cache_path is not None:
+        save_pickle_cache(cache_path, source_objects)
+    return source_objects
+
+
 def validate_remap_rules(
     remap_rules: RemapRules,
     source_objects: SourceObjectMap,
@@ -988,56 +1229,55 @@ def validate_remap_rules(
 ) -> List[str]:
     """检查 remap 规则中的源对象是否存在于 Oracle source_objects 中，并清洗无效条目。"""
     log.info("正在验证 Remap 规则...")
-    remap_keys = set(remap_rules.keys())
-    source_keys = set(source_objects.keys())
-    body_aliases = {
-        f"{name} BODY"
-        for name, obj_types in source_objects.items()
-        if any(obj_type.upper() == 'PACKAGE BODY' for obj_type in obj_types)
-    }
-    source_keys_with_alias = source_keys | body_aliases
-
-    extraneous_keys = sorted(list(remap_keys - source_keys_with_alias))
-
-    if extraneous_keys:
-        log.warning(f"  [规则警告] 在 remap_rules.txt 中发现了 {len(extraneous_keys)} 个无效的源对象。")
-        log.warning("  (这些对象在源端 Oracle (config.ini 中配置的 schema) 中未找到)")
-        for key in extraneous_keys:
-            log.warning(f"    - 无效条目: {key}")
-        # 将无效规则另存，不修改原始 remap 文件
-        if remap_file_path:
-            remap_path = Path(remap_file_path).expanduser()
-            try:
-                raw_lines = remap_path.read_text(encoding="utf-8").splitlines()
-            except OSError as exc:
-                log.warning("  [规则警告] 无法读取 remap 文件以清洗无效条目: %s", exc)
-            else:
-                removed: List[str] = []
-                extra_set = set(extraneous_keys)
-                for line in raw_lines:
-                    stripped = line.strip()
-                    if not stripped or stripped.startswith("#") or "=" not in stripped:
-                        continue
-                    src_part = stripped.split("=", 1)[0].strip().upper()
-                    if src_part in extra_set:
-                        removed.append(line)
+    # dict 键视图直接做集合差，不再先构造两份完整 set；
+    # "SCHEMA.PKG BODY" 别名只需在差集中回查，无需为全部源对象生成别名集合
+    extraneous_set = remap_rules.keys() - source_objects.keys()
+    for key in [k for k in extraneous_set if k.endswith(' BODY')]:
+        obj_types = source_objects.get(key[:-5])
+        if obj_types and 'PACKAGE BODY' in obj_types:
+            extraneous_set.discard(key)
+
+    if not extraneous_set:
+        log.info("Remap 规则验证通过，所有规则中的源对象均存在。")
+        return []
+
+    # 只有需要输出告警时才排序
+    extraneous_keys = sorted(extraneous_set)
+    log.warning(f"  [规则警告] 在 remap_rules.txt 中发现了 {len(extraneous_keys)} 个无效的源对象。")
+    log.warning("  (这些对象在源端 Oracle (config.ini 中配置的 schema) 中未找到)")
+    for key in extraneous_keys:
+        log.warning("    - 无效条目: %s", key)
+    # 将无效规则另存，不修改原始 remap 文件
+    if remap_file_path:
+        remap_path = Path(remap_file_path).expanduser()
+        try:
+            raw_lines = remap_path.read_text(encoding="utf-8").splitlines()
+        except OSError as exc:
+            log.warning("  [规则警告] 无法读取 remap 文件以清洗无效条目: %s", exc)
+        else:
+            removed: List[str] = []
+            for line in raw_lines:
+                stripped = line.strip()
+                if not stripped or stripped.startswith("#") or "=" not in stripped:
+                    continue
+                src_part = stripped.split("=", 1)[0].strip().upper()
+                if src_part in extraneous_set:
+                    removed.append(line)
 
-                if removed:
-                    invalid_path = remap_path.with_name(
-                        f"{remap_path.stem}_invalid{remap_path.suffix or '.txt'}"
+            if removed:
+                invalid_path = remap_path.with_name(
+                    f"{remap_path.stem}_invalid{remap_path.suffix or '.txt'}"
+                )
+                try:
+                    invalid_path.write_text("\n".join(removed) + "\n", encoding="utf-8")
+                except OSError as exc:
+                    log.warning("  [规则警告] 写入无效 remap 条目文件失败: %s", exc)
+                else:
+                    log.warning(
+                        "  [规则警告] 检出 %d 条无效 remap 规则并保存到: %s (原 remap_rules 未修改)",
+                        len(removed),
+                        invalid_path
                     )
-                    try:
-                        invalid_path.write_text("\n".join(removed) + "\n", encoding="utf-8")
-                    except OSError as exc:
-                        log.warning("  [规则警告] 写入无效 remap 条目文件失败: %s", exc)
-                    else:
-                        log.warning(
-                            "  [规则警告] 检出 %d 条无效 remap 规则并保存到: %s (原 remap_rules 未修改)",
-                            len(removed),
-                            invalid_path
-                        )
-    else:
-        log.info("Remap 规则验证通过，所有规则中的源对象均存在。")
 
     # 从内存映射中移除无效规则，避免后续继续使用
     for key in extraneous_keys:
@@ -1065,7 +1305,7 @@ def derive_schema_mapping_from_rules(remap_rules: RemapRules) -> Dict[str, str]:
             continue
         src_schema, _ = src_full.split('.', 1)
         tgt_schema, _ = tgt_full.split('.', 1)
-        schema_targets[src_schema.upper()].add(tgt_schema.upper())
+        schema_targets[src_schema].add(tgt_schema)
 
     schema_mapping: Dict[str, str] = {}
     for src_schema, tgt_set in schema_targets.items():
@@ -1080,20 +1320,20 @@ def resolve_remap_target(
     remap_rules: RemapRules,
     schema_mapping: Optional[Dict[str, str]] = None
 ) -> Optional[str]:
-    obj_type_u = obj_type.upper()
+    # 源对象名/类型、remap 规则与 schema 映射在加载时均已大写，这里直接比较
     candidate_keys: List[str] = [src_name]
-    if obj_type_u == 'PACKAGE BODY':
+    if obj_type == 'PACKAGE BODY':
         candidate_keys.insert(0, f"{src_name} BODY")
     for key in candidate_keys:
         if key in remap_rules:
             tgt = remap_rules[key].strip()
-            if obj_type_u == 'PACKAGE BODY':
+            if obj_type == 'PACKAGE BODY':
                 return strip_body_suffix(tgt)
             return tgt
 
-    if schema_mapping and '.' in src_name and obj_type_u != 'TABLE':
+    if schema_mapping and '.' in src_name and obj_type != 'TABLE':
         src_schema, src_obj = src_name.split('.', 1)
-        tgt_schema = schema_mapping.get(src_schema.upper())
+        tgt_schema = schema_mapping.get(src_schema)
         if tgt_schema:
             return f"{tgt_schema}.{src_obj}"
     return None
@@ -1115,37 +1355,33 @@ def generate_master_list(
 
     target_tracker: Dict[Tuple[str, str], str] = {}
 
-    allowed_primary = enabled_primary_types or set(PRIMARY_OBJECT_TYPES)
-
-    for src_name, obj_types in source_objects.items():
-        src_name_u = src_name.upper()
-        for obj_type in sorted(obj_types):
-            obj_type_u = obj_type.upper()
-            if obj_type_u not in allowed_primary:
-                continue
+    allowed_primary = enabled_primary_types or PRIMARY_OBJECT_TYPE_SET
+    _intern = sys.intern
 
+    # 源对象名/类型在 get_source_objects 中已大写：先与主对象类型求交集，只对需要的类型排序
+    for src_name_u, obj_types in source_objects.items():
+        for obj_type_u in sorted(obj_types & allowed_primary):
             if precomputed_mapping and src_name_u in precomputed_mapping:
-                tgt_name = precomputed_mapping[src_name_u].get(obj_type_u, src_name_u)
+                tgt_name_u = precomputed_mapping[src_name_u].get(obj_type_u, src_name_u)
             else:
-                tgt_name = resolve_remap_target(
+                tgt_name_u = resolve_remap_target(
                     src_name_u, obj_type_u, remap_rules, schema_mapping
                 ) or src_name_u
-            tgt_name_u = tgt_name.upper()
 
+            # 回退后的 1:1 目标同样登记到 tracker，后续对象映射到该名称时也能检测到冲突
             key = (tgt_name_u, obj_type_u)
-            if key in target_tracker:
-                existing_src = target_tracker[key]
-                if existing_src != src_name_u:
-                    log.warning(
-                        "检测到多对一映射: 目标 %s (类型 %s) 已由 %s 映射，当前 %s 将回退为 1:1 映射。",
-                        tgt_name_u, obj_type_u, existing_src, src_name_u
-                    )
-                    tgt_name_u = src_name_u
-                    tgt_name = src_name_u
-                    key = (tgt_name_u, obj_type_u)
+            existing_src = target_tracker.get(key)
+            if existing_src is not None and existing_src != src_name_u:
+                log.warning(
+                    "检测到多对一映射: 目标 %s (类型 %s) 已由 %s 映射，当前 %s 将回退为 1:1 映射。",
+                    tgt_name_u, obj_type_u, existing_src, src_name_u
+                )
+                tgt_name_u = src_name_u
+                key = (tgt_name_u, obj_type_u)
 
             target_tracker[key] = src_name_u
-            master_list.append((src_name_u, tgt_name_u, obj_type_u))
+            # 名称已统一大写，intern 后下游各比对函数直接以其作为元数据字典键，不再逐次 upper()
+            master_list.append((_intern(src_name_u), _intern(tgt_name_u), obj_type_u))
 
     log.info(f"主校验清单生成完毕，共 {len(master_list)} 个待校验项。")
     return master_list
@@ -1162,24 +1398,26 @@ def build_full_object_mapping(
     """
     mapping: FullObjectMapping = {}
     target_tracker: Dict[Tuple[str, str], str] = {}
-    for src_name, obj_types in source_objects.items():
-        src_name_u = src_name.upper()
-        for obj_type in obj_types:
-            obj_type_u = obj_type.upper()
-            tgt_name = resolve_remap_target(
+    # 源对象名/类型与 remap 目标在加载时均已大写，无需逐项 upper()
+    for src_name_u, obj_types in source_objects.items():
+        if not obj_types:
+            continue
+        type_map: Dict[str, str] = {}
+        mapping[src_name_u] = type_map
+        for obj_type_u in obj_types:
+            tgt_name_u = resolve_remap_target(
                 src_name_u, obj_type_u, remap_rules, schema_mapping
             ) or src_name_u
-            tgt_name_u = tgt_name.upper()
             key = (tgt_name_u, obj_type_u)
-            existing_src = target_tracker.get(key)
-            if existing_src and existing_src != src_name_u:
+            # 只记录每个 (目标, 类型) 的首个源对象，一次 setdefault 完成查找与登记
+            existing_src = target_tracker.setdefault(key, src_name_u)
+            if existing_src != src_name_u:
                 log.warning(
                     "检测到多对一映射: 目标 %s (类型 %s) 已由 %s 映射，当前 %s 回退为 1:1 映射。",
                     tgt_name_u, obj_type_u, existing_src, src_name_u
                 )
                 tgt_name_u = src_name_u
-            target_tracker[key] = src_name_u
-            mapping.setdefault(src_name_u, {})[obj_type_u] = tgt_name_u
+            type_map[obj_type_u] = tgt_name_u
     return mapping
 
 
@@ -1208,20 +1446,6 @@ def ensure_mapping_entry(
     full_object_mapping.setdefault(src_key, {})[obj_type_u] = tgt_full
 
 
-def find_source_by_target(
-    full_object_mapping: FullObjectMapping,
-    tgt_full_name: str,
-    obj_type: str
-) -> Optional[str]:
-    obj_type_u = obj_type.upper()
-    tgt_u = tgt_full_name.upper()
-    for src_name, type_map in full_object_mapping.items():
-        target = type_map.get(obj_type_u)
-        if target and target.upper() == tgt_u:
-            return src_name
-    return None
-
-
 def collect_table_pairs(master_list: MasterCheckList, use_target: bool = False) -> Set[Tuple[str, str]]:
     """
     提取 master_list 中的 (schema, table) 集合。
@@ -1229,40 +1453,51 @@ def collect_table_pairs(master_list: MasterCheckList, use_target: bool = False)
     """
     pairs: Set[Tuple[str, str]] = set()
     for src_name, tgt_name, obj_type in master_list:
-        if obj_type.upper() != 'TABLE':
+        if obj_type != 'TABLE':
             continue
         name = tgt_name if use_target else src_name
         if '.' not in name:
             continue
+        # master_list 中的名称与类型已统一大写
         schema, table = name.split('.', 1)
-        pairs.add((schema.upper(), table.upper()))
+        pairs.add((schema, table))
     return pairs
 
 
+@functools.lru_cache(maxsize=None)
+def split_object_name(full_name: str) -> Optional[Tuple[str, str]]:
+    """
+    将 master_list 中的 'SCHEMA.OBJECT' 拆分为 (SCHEMA, OBJECT)，不是恰好一个 '.' 时返回 None。
+    同一名称会在主对象/扩展对象/注释/修补等多轮遍历中反复拆分，故缓存结果。
+    """
+    parts = full_name.split('.')
+    if len(parts) != 2:
+        return None
+    return sys.intern(parts[0]), sys.intern(parts[1])
+
+
 def build_schema_mapping(master_list: MasterCheckList) -> Dict[str, str]:
     """
     基于 master_list 中 TABLE 映射，推导 schema 映射：
       如果同一 src_schema 只映射到唯一一个 tgt_schema，则使用该映射；
       否则 (映射到多个目标 schema)，退回 src_schema 本身 (1:1)。
     """
-    mapping_tmp: Dict[str, Set[str]] = {}
+    # 单遍扫描：首次出现记录目标 schema，出现不同目标时置为 None 表示“一对多”
+    mapping_tmp: Dict[str, Optional[str]] = {}
     for src_name, tgt_name, obj_type in master_list:
-        if obj_type.upper() != 'TABLE':
+        if obj_type != 'TABLE':
             continue
-        try:
-            src_schema, _ = src_name.split('.')
-            tgt_schema, _ = tgt_name.split('.')
-        except ValueError:
+        src_schema, sep, _ = src_name.partition('.')
+        tgt_schema, tgt_sep, _ = tgt_name.partition('.')
+        if not sep or not tgt_sep:
             continue
-        mapping_tmp.setdefault(src_schema.upper(), set()).add(tgt_schema.upper())
+        current = mapping_tmp.get(src_schema, tgt_schema)
+        mapping_tmp[src_schema] = current if current == tgt_schema else None
 
-    final_mapping: Dict[str, str] = {}
-    for src_schema, tgt_set in mapping_tmp.items():
-        if len(tgt_set) == 1:
-            final_mapping[src_schema] = next(iter(tgt_set))
-        else:
-            final_mapping[src_schema] = src_schema
-    return final_mapping
+    return {
+        src_schema: tgt_schema if tgt_schema is not None else src_schema
+        for src_schema, tgt_schema in mapping_tmp.items()
+    }
 
 
 def compute_schema_coverage(
@@ -1277,7 +1512,7 @@ def compute_schema_coverage(
       说明：目标端可能是“超集”，因此不检查“额外 schema”或“目标缺失 schema”。
     """
     cfg_src_set = {s.upper() for s in configured_source_schemas}
-    src_seen = {name.split('.')[0].upper() for name in source_objects.keys() if '.' in name}
+    src_seen = {name.split('.')[0] for name in source_objects.keys() if '.' in name}
     source_missing = sorted(cfg_src_set - src_seen)
 
     return {
@@ -1298,18 +1533,14 @@ def compute_object_counts(
     基于“期望对象集合”统计各类型的：源端数量、目标端命中数量、缺失数量、额外数量。
     目标端数量仅统计“期望对象”的命中数，避免“缺 1 张表 + 额外 1 张表”被误判为数量一致。
     """
+    # full_object_mapping 的类型/目标名在建立时已统一大写，OB 对象名在解析 dump 时已大写，
+    # 这里直接按原值分组、直接引用 OB 端集合，不再逐个 upper() 复制
     expected_by_type: Dict[str, Set[str]] = {t.upper(): set() for t in monitored_types}
-    for _src, type_map in full_object_mapping.items():
+    for type_map in full_object_mapping.values():
         for obj_type, tgt_name in type_map.items():
-            obj_type_u = obj_type.upper()
-            if obj_type_u not in expected_by_type:
-                continue
-            expected_by_type[obj_type_u].add(tgt_name.upper())
-
-    actual_by_type: Dict[str, Set[str]] = {
-        t.upper(): {name.upper() for name in ob_meta.objects_by_type.get(t.upper(), set())}
-        for t in monitored_types if t != 'CONSTRAINT'
-    }
+            bucket = expected_by_type.get(obj_type)
+            if bucket is not None:
+                bucket.add(tgt_name)
 
     summary: ObjectCountSummary = {
         "oracle": {},
@@ -1321,22 +1552,6 @@ def compute_object_counts(
     issue_types: List[str] = []
     for obj_type in monitored_types:
         obj_type_u = obj_type.upper()
-        
-        if obj_type_u == 'CONSTRAINT':
-            # Constraints are not in DBA_OBJECTS, so they need special handling
-            expected_set = {
-                cons_name
-                for cons_map in oracle_meta.constraints.values()
-                for cons_name in cons_map
-            }
-            actual_set = {
-                cons_name
-                for cons_map in ob_meta.constraints.values()
-                for cons_name in cons_map
-            }
-        else:
-            expected_set = expected_by_type.get(obj_type_u, set())
-            actual_set = actual_by_type.get(obj_type_u, set())
 
         # For constraints and indexes, names can be system-generated. A simple name comparison is not enough.
         # This count is a rough estimation. The detailed mismatch is more important.
@@ -1357,16 +1572,19 @@ def compute_object_counts(
                 issue_types.append(obj_type_u)
             continue
 
-        matched = expected_set & actual_set
-        missing_set = expected_set - actual_set
-        extra_set = actual_set - expected_set
+        expected_set = expected_by_type[obj_type_u]
+        actual_set = ob_meta.objects_by_type.get(obj_type_u, EMPTY_FROZENSET)
+        # 只需要数量：交集大小即可推出缺失/多余个数，无需再构建差集
+        matched = len(expected_set & actual_set)
+        missing_count = len(expected_set) - matched
+        extra_count = len(actual_set) - matched
 
         summary["oracle"][obj_type_u] = len(expected_set)
-        summary["oceanbase"][obj_type_u] = len(matched)
-        summary["missing"][obj_type_u] = len(missing_set)
-        summary["extra"][obj_type_u] = len(extra_set)
+        summary["oceanbase"][obj_type_u] = matched
+        summary["missing"][obj_type_u] = missing_count
+        summary["extra"][obj_type_u] = extra_count
 
-        if missing_set or extra_set:
+        if missing_count or extra_count:
             issue_types.append(obj_type_u)
 
     if issue_types:
@@ -1384,9 +1602,9 @@ def compute_object_counts(
 
 # ====================== obclient + 一次性元数据转储 ======================
 
-def obclient_run_sql(ob_cfg: ObConfig, sql_query: str) -> Tuple[bool, str, str]:
-    """运行 obclient CLI 命令并返回 (Success, stdout, stderr)，带 timeout。"""
-    command_args = [
+def build_obclient_command(ob_cfg: ObConfig, sql_query: str) -> List[str]:
+    """构造 obclient 静默模式执行 SQL 的命令行参数。"""
+    return [
         ob_cfg['executable'],
         '-h', ob_cfg['host'],
         '-P', ob_cfg['port'],
@@ -1396,6 +1614,16 @@ def obclient_run_sql(ob_cfg: ObConfig, sql_query: str) -> Tuple[bool, str, str]:
         '-e', sql_query
     ]
 
+
+def obclient_run_sql(
+    ob_cfg: ObConfig,
+    sql_query: str,
+    timeout: Optional[int] = None
+) -> Tuple[bool, str, str]:
+    """运行 obclient CLI 命令并返回 (Success, stdout, stderr)，带 timeout（默认取 ob_cfg['timeout']）。"""
+    command_args = build_obclient_command(ob_cfg, sql_query)
+    timeout = timeout or ob_cfg.get('timeout', OBC_TIMEOUT)
+
     try:
         result = subprocess.run(
             command_args,
@@ -1403,17 +1631,17 @@ def obclient_run_sql(ob_cfg: ObConfig, sql_query: str) -> Tuple[bool, str, str]:
             text=True,
             encoding='utf-8',
             errors='ignore',
-            timeout=OBC_TIMEOUT
+            timeout=timeout
         )
 
         if result.returncode != 0 or (result.stderr and "Warning" not in result.stderr):
-            log.error(f"  [OBClient 错误] SQL: {sql_query.strip()} | 错误: {result.stderr.strip()}")
+            log.error("  [OBClient 错误] SQL: %s | 错误: %s", sql_query.strip(), result.stderr.strip())
             return False, "", result.stderr.strip()
 
         return True, result.stdout.strip(), ""
 
     except subprocess.TimeoutExpired:
-        log.error(f"严重错误: obclient 执行超时 (>{OBC_TIMEOUT} 秒)。请检查网络/OB 状态或调大 obclient_timeout。")
+        log.error(f"严重错误: obclient 执行超时 (>{timeout} 秒)。请检查网络/OB 状态或调大 obclient_timeout。")
         return False, "", "TimeoutExpired"
     except FileNotFoundError:
         log.error(f"严重错误: 未找到 obclient 可执行文件: {ob_cfg['executable']}")
@@ -1424,6 +1652,134 @@ def obclient_run_sql(ob_cfg: ObConfig, sql_query: str) -> Tuple[bool, str, str]:
         return False, "", str(e)
 
 
+def obclient_stream_sql(
+    ob_cfg: ObConfig,
+    sql_query: str,
+    on_line: Callable[[bytes], None],
+    timeout: Optional[int] = None
+) -> Tuple[bool, str]:
+    """
+    流式运行 obclient：逐行读取 stdout 并交给 on_line 解析，返回 (Success, stderr)。
+    相比 capture_output + splitlines，不再同时持有整段输出和行列表两份副本，
+    解析也与 obclient 输出并行进行。超时由 threading.Timer 结束子进程。
+    stdout 以 bytes 交给 on_line，不做整段 utf-8 解码，由解析方按字段解码。
+    """
+    command_args = build_obclient_command(ob_cfg, sql_query)
+    timeout = timeout or ob_cfg.get('timeout', OBC_TIMEOUT)
+    timed_out = threading.Event()
+
+    try:
+        with tempfile.TemporaryFile() as err_buf:
+            proc = subprocess.Popen(
+                command_args,
+                stdout=subprocess.PIPE,
+                stderr=err_buf
+            )
+
+            def _kill_on_timeout() -> None:
+                timed_out.set()
+                proc.kill()
+
+            timer = threading.Timer(timeout, _kill_on_timeout)
+            timer.start()
+            try:
+                for line in proc.stdout:
+                    line = line.rstrip(b'\r\n')
+                    if line:
+                        on_line(line)
+                returncode = proc.wait()
+            finally:
+                timer.cancel()
+                if proc.poll() is None:
+                    proc.kill()
+                    proc.wait()
+                proc.stdout.close()
+
+            err_buf.seek(0)
+            stderr = err_buf.read().decode('utf-8', errors='ignore').strip()
+
+    except FileNotFoundError:
+        log.error(f"严重错误: 未找到 obclient 可执行文件: {ob_cfg['executable']}")
+        log.error("请检查 config.ini 中的 [OCEANBASE_TARGET] -> executable 路径。")
+        sys.exit(1)
+    except Exception as e:
+        log.error(f"严重错误: 执行 subprocess 时发生未知错误: {e}")
+        return False, str(e)
+
+    if timed_out.is_set():
+        log.error(f"严重错误: obclient 执行超时 (>{timeout} 秒)。请检查网络/OB 状态或调大 obclient_timeout。")
+        return False, "TimeoutExpired"
+
+    if returncode != 0 or (stderr and "Warning" not in stderr):
+        log.error("  [OBClient 错误] SQL: %s | 错误: %s", sql_query.strip(), stderr)
+        return False, stderr
+
+    return True, ""
+
+
+def group_sql_statements(
+    statements: List[str],
+    max_chars: int = OBC_MAX_SCRIPT_CHARS,
+    max_statements: int = OB_SCRIPT_MAX_STATEMENTS
+) -> List[Tuple[str, int]]:
+    """
+    将多条 SELECT 拼接为 ';' 分隔的多语句脚本，供单个 obclient -e 执行，返回 [(脚本, 语句数)]。
+    按字符数分组，避免单个命令行参数超过内核 MAX_ARG_STRLEN (128KB)；
+    同时限制每个脚本的语句数，脚本内串行执行的耗时不至于无限累加到同一个超时上。
+    """
+    scripts: List[Tuple[str, int]] = []
+    current: List[str] = []
+    current_len = 0
+    for stmt in statements:
+        stmt = stmt.strip().rstrip(';')
+        if not stmt:
+            continue
+        if current and (current_len + len(stmt) + 2 > max_chars or len(current) >= max_statements):
+            scripts.append((";\n".join(current) + ";", len(current)))
+            current = []
+            current_len = 0
+        current.append(stmt)
+        current_len += len(stmt) + 2
+    if current:
+        scripts.append((";\n".join(current) + ";", len(current)))
+    return scripts
+
+
+def make_cache_key(*parts) -> str:
+    """基于任意可 repr 的参数生成短缓存键。"""
+    return hashlib.sha256(repr(parts).encode('utf-8')).hexdigest()[:16]
+
+
+def load_pickle_cache(cache_path: Path, ttl_seconds: int):
+    """读取未过期的 pickle 缓存；不存在、已过期或损坏时返回 None。"""
+    if ttl_seconds <= 0 or not cache_path.is_file():
+        return None
+    try:
+        age = time.time() - cache_path.stat().st_mtime
+        if age > ttl_seconds:
+            log.info("缓存 %s 已过期 (%.0f 秒 > %d 秒)，将重新加载。", cache_path, age, ttl_seconds)
+            return None
+        with cache_path.open('rb') as f:
+            data = pickle.load(f)
+        log.info("命中本地缓存 %s (生成于 %.0f 秒前)。", cache_path, age)
+        return data
+    except Exception as exc:
+        log.warning("读取缓存 %s 失败，将重新加载: %s", cache_path, exc)
+        return None
+
+
+def save_pickle_cache(cache_path: Path, data) -> None:
+    """写入 pickle 缓存（先写临时文件再替换，避免中断留下半个文件）。"""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(cache_path.suffix + '.tmp')
+        with tmp_path.open('wb') as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except Exception as exc:
+        log.warning("写入缓存 %s 失败: %s", cache_path, exc)
+
+
 def dump_ob_metadata(
     ob_cfg: ObConfig,
     target_schemas: Set[str],
@@ -1434,7 +1790,9 @@ def dump_ob_metadata(
     include_triggers: bool = True,
     include_sequences: bool = True,
     include_comments: bool = True,
-    target_table_pairs: Optional[Set[Tuple[str, str]]] = None
+    target_table_pairs: Optional[Set[Tuple[str, str]]] = None,
+    columns_timeout: Optional[int] = None,
+    max_workers: int = OB_DUMP_MAX_WORKERS
 ) -> ObMetadata:
     """
     一次性从 OceanBase dump 所有需要的元数据，返回 ObMetadata。
@@ -1451,357 +1809,445 @@ def dump_ob_metadata(
             sequences={},
             table_comments={},
             column_comments={},
-            comments_complete=False
+            comments_complete=False,
+            tables_by_owner={}
         )
 
-    owners_in = ",".join(f"'{s}'" for s in sorted(target_schemas))
+    def _owner_chunks(owners) -> List[str]:
+        return [
+            ",".join(f"'{s}'" for s in chunk)
+            for chunk in chunk_list(sorted(owners), OB_OWNER_CHUNK_SIZE)
+        ]
+
+    owners_in_chunks = _owner_chunks(target_schemas)
+
+    # 表级视图（列/索引/约束/触发器）只需覆盖校验清单中的目标表：
+    # owner 收敛到实际有表的 schema，表数量不大时再下推 TABLE_NAME IN 过滤。
+    table_owners_in_chunks = owners_in_chunks
+    table_names_in = ""
+    if target_table_pairs is not None:
+        table_owners = {owner for owner, _ in target_table_pairs} & set(target_schemas)
+        if not table_owners:
+            include_tab_columns = include_indexes = include_constraints = include_triggers = False
+        else:
+            table_owners_in_chunks = _owner_chunks(table_owners)
+            table_names = sorted({table for _, table in target_table_pairs})
+            if len(table_names) < OB_TABLE_NAME_FILTER_LIMIT:
+                table_names_in = ",".join(f"'{t}'" for t in table_names)
+
+    def _per_owner_chunk(template: str) -> List[str]:
+        return [template.format(owners_in=chunk) for chunk in owners_in_chunks]
+
+    def _per_table_chunk(template: str, owner_col: str) -> List[str]:
+        statements = []
+        for chunk in table_owners_in_chunks:
+            clause = f"{owner_col} IN ({chunk})"
+            if table_names_in:
+                clause += f" AND TABLE_NAME IN ({table_names_in})"
+            statements.append(template.format(scope=clause))
+        return statements
+
+    # 各视图查询相互独立：先构造全部 SQL 并提交到线程池并发执行 obclient，
+    # 输出在工作线程内边读边解析，主线程再按原有顺序检查结果并合并。
+    # 每个视图对应一组语句（按 owner 分批 / 注释多语句脚本），各批按 owner 划分互不重叠，
+    # 可同时写入同一结构。
+    queries: Dict[str, List[str]] = {}
 
-    # --- 1. DBA_OBJECTS ---
-    objects_by_type: Dict[str, Set[str]] = {}
     object_types_filter = tracked_object_types or set(ALL_TRACKED_OBJECT_TYPES)
     if not object_types_filter:
         object_types_filter = {'TABLE'}
     object_types_clause = ",".join(f"'{obj}'" for obj in sorted(object_types_filter))
 
-    sql = f"""
+    queries['objects'] = _per_owner_chunk(f"""
         SELECT OWNER, OBJECT_NAME, OBJECT_TYPE
         FROM DBA_OBJECTS
-        WHERE OWNER IN ({owners_in})
+        WHERE OWNER IN ({{owners_in}})
           AND OBJECT_TYPE IN (
               {object_types_clause}
           )
-    """
-    ok, out, err = obclient_run_sql(ob_cfg, sql)
-    if not ok:
-        log.error("无法从 OB 读取 DBA_OBJECTS，程序退出。")
-        sys.exit(1)
-
-    if out:
-        for line in out.splitlines():
-            parts = line.split('\t')
-            if len(parts) < 3:
-                continue
-            owner, name, obj_type = parts[0].strip().upper(), parts[1].strip().upper(), parts[2].strip().upper()
-            full = f"{owner}.{name}"
-            objects_by_type.setdefault(obj_type, set()).add(full)
-
+    """)
     # 补充 DBA_TYPES (部分 OB 环境中 TYPE/TYPE BODY 不出现在 DBA_OBJECTS)
     if 'TYPE' in object_types_filter or 'TYPE BODY' in object_types_filter:
-        sql_types = f"""
+        queries['types'] = _per_owner_chunk("""
             SELECT OWNER, TYPE_NAME, TYPECODE
             FROM DBA_TYPES
             WHERE OWNER IN ({owners_in})
-        """
-        ok, out, err = obclient_run_sql(ob_cfg, sql_types)
-        if not ok:
-            log.warning("读取 DBA_TYPES 失败，TYPE / TYPE BODY 检查可能不完整: %s", err)
-        elif out:
-            for line in out.splitlines():
-                parts = line.split('\t')
-                if len(parts) < 3:
-                    continue
-                owner, name, typecode = parts[0].strip().upper(), parts[1].strip().upper(), parts[2].strip().upper()
-                full = f"{owner}.{name}"
-                objects_by_type.setdefault('TYPE', set()).add(full)
-                if typecode == 'OBJECT':
-                    objects_by_type.setdefault('TYPE BODY', set()).add(full)
-
-    # --- 2. DBA_TAB_COLUMNS ---
-    sql_cols = f"""
-        SELECT OWNER, TABLE_NAME, COLUMN_NAME, DATA_TYPE, CHAR_LENGTH, NULLABLE, DATA_DEFAULT
-        FROM DBA_TAB_COLUMNS
-        WHERE OWNER IN ({owners_in})
-    """
-
-    tab_columns: Dict[Tuple[str, str], Dict[str, Dict]] = {}
+        """)
     if include_tab_columns:
-        ok, out, err = obclient_run_sql(ob_cfg, sql_cols)
-        if not ok:
-            log.error("无法从 OB 读取 DBA_TAB_COLUMNS，程序退出。")
-            sys.exit(1)
+        queries['tab_columns'] = _per_table_chunk(f"""
+            SELECT OWNER, TABLE_NAME, COLUMN_NAME, DATA_TYPE, CHAR_LENGTH
+            FROM DBA_TAB_COLUMNS
+            WHERE {{scope}}
+              AND COLUMN_NAME NOT IN ({IGNORED_OMS_COLUMNS_SQL})
+        """, 'OWNER')
+
+    target_pairs = target_table_pairs or set()
+    if include_comments and target_pairs:
+        comment_keys = sorted(f"{owner}.{table}" for owner, table in target_pairs)
+        tab_cmt_sqls: List[str] = []
+        col_cmt_sqls: List[str] = []
+        for chunk in chunk_list(comment_keys, COMMENT_BATCH_SIZE):
+            key_clause = ",".join(f"'{val}'" for val in chunk)
+            tab_cmt_sqls.append(f"""
+                SELECT OWNER, TABLE_NAME,
+                       REPLACE(REPLACE(REPLACE(COMMENTS, CHR(10), ' '), CHR(13), ' '), CHR(9), ' ') AS COMMENTS
+                FROM DBA_TAB_COMMENTS
+                WHERE OWNER||'.'||TABLE_NAME IN ({key_clause})
+            """)
+            col_cmt_sqls.append(f"""
+                SELECT OWNER, TABLE_NAME, COLUMN_NAME,
+                       REPLACE(REPLACE(REPLACE(COMMENTS, CHR(10), ' '), CHR(13), ' '), CHR(9), ' ') AS COMMENTS
+                FROM DBA_COL_COMMENTS
+                WHERE OWNER||'.'||TABLE_NAME IN ({key_clause})
+            """)
+        # 同类注释查询的结果列一致，下面与其他视图一样合并为多语句脚本在同一个 obclient 进程内执行，
+        # 避免每个批次都重新 fork + 建连 + 认证。
+        queries['tab_comments'] = tab_cmt_sqls
+        queries['col_comments'] = col_cmt_sqls
 
-        if out:
-            for line in out.splitlines():
-                parts = line.split('\t')
-                if len(parts) < 7:
-                    continue
-                owner = parts[0].strip().upper()
-                table = parts[1].strip().upper()
-                col = parts[2].strip().upper()
-                dtype = parts[3].strip().upper()
-                char_len = parts[4].strip()
-                nullable = parts[5].strip()
-                default = parts[6].strip()
-                key = (owner, table)
-                tab_columns.setdefault(key, {})[col] = {
-                    "data_type": dtype,
-                    "char_length": int(char_len) if char_len.isdigit() else None,
-                    "nullable": nullable,
-                    "data_default": default,
-                    "hidden": False
-                }
-
-    # --- 2.b 注释 (DBA_TAB_COMMENTS / DBA_COL_COMMENTS) ---
-    table_comments: Dict[Tuple[str, str], Optional[str]] = {}
-    column_comments: Dict[Tuple[str, str], Dict[str, Optional[str]]] = {}
-    comments_complete = False
-    if include_comments:
-        target_pairs = target_table_pairs or set()
-        if not target_pairs:
-            comments_complete = True
-        else:
-            comment_keys = sorted(f"{owner}.{table}" for owner, table in target_pairs)
-            comments_complete = True
-
-            for chunk in chunk_list(comment_keys, COMMENT_BATCH_SIZE):
-                key_clause = ",".join(f"'{val}'" for val in chunk)
-                sql_tab_cmt = f"""
-                    SELECT OWNER, TABLE_NAME,
-                           REPLACE(REPLACE(REPLACE(COMMENTS, CHR(10), ' '), CHR(13), ' '), CHR(9), ' ') AS COMMENTS
-                    FROM DBA_TAB_COMMENTS
-                    WHERE OWNER||'.'||TABLE_NAME IN ({key_clause})
-                """
-                ok, out, err = obclient_run_sql(ob_cfg, sql_tab_cmt)
-                if not ok:
-                    log.warning("无法从 OB 读取 DBA_TAB_COMMENTS，注释比对将跳过：%s", err)
-                    comments_complete = False
-                    break
-                if out:
-                    for line in out.splitlines():
-                        parts = line.split('\t')
-                        if len(parts) < 3:
-                            continue
-                        owner = parts[0].strip().upper()
-                        table = parts[1].strip().upper()
-                        comment = parts[2].strip() if len(parts) >= 3 else None
-                        table_comments[(owner, table)] = comment
-
-            if comments_complete:
-                for chunk in chunk_list(comment_keys, COMMENT_BATCH_SIZE):
-                    key_clause = ",".join(f"'{val}'" for val in chunk)
-                    sql_col_cmt = f"""
-                        SELECT OWNER, TABLE_NAME, COLUMN_NAME,
-                               REPLACE(REPLACE(REPLACE(COMMENTS, CHR(10), ' '), CHR(13), ' '), CHR(9), ' ') AS COMMENTS
-                        FROM DBA_COL_COMMENTS
-                        WHERE OWNER||'.'||TABLE_NAME IN ({key_clause})
-                    """
-                    ok, out, err = obclient_run_sql(ob_cfg, sql_col_cmt)
-                    if not ok:
-                        log.warning("无法从 OB 读取 DBA_COL_COMMENTS，注释比对将跳过：%s", err)
-                        comments_complete = False
-                        break
-                    if out:
-                        for line in out.splitlines():
-                            parts = line.split('\t')
-                            if len(parts) < 4:
-                                continue
-                            owner = parts[0].strip().upper()
-                            table = parts[1].strip().upper()
-                            column = parts[2].strip().upper()
-                            comment = parts[3].strip() if len(parts) >= 4 else None
-                            column_comments.setdefault((owner, table), {})[column] = comment
-            if comments_complete and target_pairs and not table_comments and not column_comments:
-                log.warning("OB 端注释查询未返回任何记录，可能缺少权限，注释比对将跳过。")
-                comments_complete = False
-
-    # --- 3. DBA_INDEXES ---
-    indexes: Dict[Tuple[str, str], Dict[str, Dict]] = {}
     if include_indexes:
-        sql = f"""
+        queries['indexes'] = _per_table_chunk("""
             SELECT TABLE_OWNER, TABLE_NAME, INDEX_NAME, UNIQUENESS
             FROM DBA_INDEXES
-            WHERE TABLE_OWNER IN ({owners_in})
-        """
-        ok, out, err = obclient_run_sql(ob_cfg, sql)
-        if not ok:
-            log.error("无法从 OB 读取 DBA_INDEXES，程序退出。")
-            sys.exit(1)
-
-        if out:
-            for line in out.splitlines():
-                parts = line.split('\t')
-                if len(parts) < 4:
-                    continue
-                t_owner, t_name, idx_name, uniq = (
-                    parts[0].strip().upper(),
-                    parts[1].strip().upper(),
-                    parts[2].strip().upper(),
-                    parts[3].strip().upper()
-                )
-                key = (t_owner, t_name)
-                indexes.setdefault(key, {})[idx_name] = {
-                    "uniqueness": uniq,
-                    "columns": []
-                }
-
-        # --- 4. DBA_IND_COLUMNS ---
-        sql = f"""
+            WHERE {scope}
+        """, 'TABLE_OWNER')
+        queries['ind_columns'] = _per_table_chunk("""
             SELECT TABLE_OWNER, TABLE_NAME, INDEX_NAME, COLUMN_NAME, COLUMN_POSITION
             FROM DBA_IND_COLUMNS
-            WHERE TABLE_OWNER IN ({owners_in})
-            ORDER BY TABLE_OWNER, TABLE_NAME, INDEX_NAME, COLUMN_POSITION
-        """
-        ok, out, err = obclient_run_sql(ob_cfg, sql)
-        if not ok:
-            log.error("无法从 OB 读取 DBA_IND_COLUMNS，程序退出。")
-            sys.exit(1)
-
-        if out:
-            for line in out.splitlines():
-                parts = line.split('\t')
-                if len(parts) < 5:
-                    continue
-                t_owner, t_name, idx_name, col_name = (
-                    parts[0].strip().upper(),
-                    parts[1].strip().upper(),
-                    parts[2].strip().upper(),
-                    parts[3].strip().upper()
-                )
-                key = (t_owner, t_name)
-                if key not in indexes:
-                    indexes[key] = {}
-                if idx_name not in indexes[key]:
-                    indexes[key][idx_name] = {"uniqueness": "UNKNOWN", "columns": []}
-                indexes[key][idx_name]["columns"].append(col_name)
-
-        # 过滤 OMS_* 自动索引
-        for key in list(indexes.keys()):
-            pruned = {}
-            for idx_name, info in indexes[key].items():
-                cols = info.get("columns") or []
-                if is_oms_index(idx_name, cols):
-                    continue
-                pruned[idx_name] = info
-            if pruned:
-                indexes[key] = pruned
-            else:
-                del indexes[key]
-
-    # --- 5. DBA_CONSTRAINTS (P/U/R) ---
-    constraints: Dict[Tuple[str, str], Dict[str, Dict]] = {}
+            WHERE {scope}
+        """, 'TABLE_OWNER')
     if include_constraints:
-        sql = f"""
+        queries['constraints'] = _per_table_chunk("""
             SELECT OWNER, TABLE_NAME, CONSTRAINT_NAME, CONSTRAINT_TYPE
             FROM DBA_CONSTRAINTS
-            WHERE OWNER IN ({owners_in})
+            WHERE {scope}
               AND CONSTRAINT_TYPE IN ('P','U','R')
               AND STATUS = 'ENABLED'
-        """
-        ok, out, err = obclient_run_sql(ob_cfg, sql)
-        if not ok:
-            log.error("无法从 OB 读取 DBA_CONSTRAINTS，程序退出。")
-            sys.exit(1)
-
-        if out:
-            for line in out.splitlines():
-                parts = line.split('\t')
-                if len(parts) < 4:
-                    continue
-                owner, table, cons_name, ctype = (
-                    parts[0].strip().upper(),
-                    parts[1].strip().upper(),
-                    parts[2].strip().upper(),
-                    parts[3].strip().upper()
-                )
-                key = (owner, table)
-                constraints.setdefault(key, {})[cons_name] = {
-                    "type": ctype,
-                    "columns": []
-                }
-
-        # --- 6. DBA_CONS_COLUMNS ---
-        sql = f"""
+        """, 'OWNER')
+        queries['cons_columns'] = _per_table_chunk("""
             SELECT OWNER, TABLE_NAME, CONSTRAINT_NAME, COLUMN_NAME, POSITION
             FROM DBA_CONS_COLUMNS
-            WHERE OWNER IN ({owners_in})
-            ORDER BY OWNER, TABLE_NAME, CONSTRAINT_NAME, POSITION
-        """
-        ok, out, err = obclient_run_sql(ob_cfg, sql)
-        if not ok:
-            log.error("无法从 OB 读取 DBA_CONS_COLUMNS，程序退出。")
-            sys.exit(1)
-
-        if out:
-            for line in out.splitlines():
-                parts = line.split('\t')
-                if len(parts) < 5:
-                    continue
-                owner, table, cons_name, col_name = (
-                    parts[0].strip().upper(),
-                    parts[1].strip().upper(),
-                    parts[2].strip().upper(),
-                    parts[3].strip().upper()
-                )
-                key = (owner, table)
-                if key not in constraints:
-                    constraints[key] = {}
-                if cons_name not in constraints[key]:
-                    constraints[key][cons_name] = {"type": "UNKNOWN", "columns": []}
-                constraints[key][cons_name]["columns"].append(col_name)
-
-    # --- 7. DBA_TRIGGERS ---
-    triggers: Dict[Tuple[str, str], Dict[str, Dict]] = {}
+            WHERE {scope}
+        """, 'OWNER')
     if include_triggers:
-        sql = f"""
+        queries['triggers'] = _per_table_chunk("""
             SELECT TABLE_OWNER, TABLE_NAME, TRIGGER_NAME, TRIGGERING_EVENT, STATUS
             FROM DBA_TRIGGERS
-            WHERE TABLE_OWNER IN ({owners_in})
-        """
-        ok, out, err = obclient_run_sql(ob_cfg, sql)
-        if not ok:
-            log.error("无法从 OB 读取 DBA_TRIGGERS，程序退出。")
-            sys.exit(1)
-
-        if out:
-            for line in out.splitlines():
-                parts = line.split('\t')
-                if len(parts) < 5:
-                    continue
-                t_owner, t_name, trg_name, ev, status = (
-                    parts[0].strip().upper(),
-                    parts[1].strip().upper(),
-                    parts[2].strip().upper(),
-                    parts[3].strip(),
-                    parts[4].strip()
-                )
-                key = (t_owner, t_name)
-                triggers.setdefault(key, {})[trg_name] = {
-                    "event": ev,
-                    "status": status
-                }
-
-    # --- 8. DBA_SEQUENCES ---
-    sequences: Dict[str, Set[str]] = {}
+            WHERE {scope}
+        """, 'TABLE_OWNER')
     if include_sequences:
-        sql = f"""
+        queries['sequences'] = _per_owner_chunk("""
             SELECT SEQUENCE_OWNER, SEQUENCE_NAME
             FROM DBA_SEQUENCES
             WHERE SEQUENCE_OWNER IN ({owners_in})
-        """
-        ok, out, err = obclient_run_sql(ob_cfg, sql)
-        if not ok:
-            log.error("无法从 OB 读取 DBA_SEQUENCES，程序退出。")
+        """)
+
+    # 同一视图按 owner 分出的多个批次结果列一致，每 OB_SCRIPT_MAX_STATEMENTS 批合并为一个多语句脚本
+    # 在一个 obclient 进程内执行，省去每批一次的 fork + 建连 + 认证；脚本之间（含不同视图）仍由线程池并发。
+    # 脚本内语句串行执行，超时按语句数放大，保证每批仍有与单独执行时相同的时间预算。
+    # DBA_TAB_COLUMNS 结果量最大且有单独的超时，保持每批一个进程，批次间可并行。
+    scripts: Dict[str, List[Tuple[str, int]]] = {
+        name: (
+            [(sql, 1) for sql in statements] if name == 'tab_columns'
+            else group_sql_statements(statements)
+        )
+        for name, statements in queries.items()
+    }
+    base_timeout = ob_cfg.get('timeout', OBC_TIMEOUT)
+
+    # --- 行解析回调：在 obclient 输出到达时逐行解析，每个查询只写自己的结构 ---
+    # 热循环中使用 defaultdict，避免 setdefault 每行都构造一个用完即弃的空 set/dict；
+    # 返回前统一转换为普通 dict，保持 ObMetadata 对外结构不变。
+    objects_by_type: Dict[str, Set[str]] = defaultdict(set)
+    type_objects: Dict[str, Set[str]] = defaultdict(set)
+    tab_columns: Dict[Tuple[str, str], Dict[str, ObColumnInfo]] = defaultdict(dict)
+    table_comments: Dict[Tuple[str, str], Optional[str]] = {}
+    column_comments: Dict[Tuple[str, str], Dict[str, Optional[str]]] = defaultdict(dict)
+    indexes: Dict[Tuple[str, str], Dict[str, IndexInfo]] = defaultdict(dict)
+    index_columns: Dict[Tuple[str, str], Dict[str, List[Tuple[int, str]]]] = defaultdict(lambda: defaultdict(list))
+    constraints: Dict[Tuple[str, str], Dict[str, ConstraintInfo]] = defaultdict(dict)
+    constraint_columns: Dict[Tuple[str, str], Dict[str, List[Tuple[int, str]]]] = defaultdict(lambda: defaultdict(list))
+    triggers: Dict[Tuple[str, str], Dict[str, Dict]] = defaultdict(dict)
+    sequences: Dict[str, Set[str]] = defaultdict(set)
+
+    # obclient 输出按 bytes 逐行到达：标识符字段整行一次 bytes.upper()（纯 ASCII 大小写折叠）
+    # 再 split，只对真正用到的字段解码；含注释/触发事件等需保留大小写的查询只对标识符前缀做 upper()。
+    # 标识符在列/索引列/约束列等结果中成千上万次重复出现（每列一行都带 OWNER/TABLE_NAME），
+    # sys.intern 后同名只保留一份对象，字典键比较也可走指针相等的快速路径。
+    # 行数最多的列/索引/约束类结果全是标识符与数字：整行一次解码后按已知列数 split(maxsplit)，
+    # 字段直接 intern；obclient -ss 输出的字段之间只有制表符，无需逐字段 strip()。
+    _intern = sys.intern
+
+    def _text(raw: bytes) -> str:
+        return raw.strip().decode('utf-8', errors='ignore')
+
+    def _ident(raw: bytes) -> str:
+        return _intern(raw.strip().decode('utf-8', errors='ignore'))
+
+    def _parse_object(line: bytes) -> None:
+        parts = line.upper().split(b'\t')
+        if len(parts) < 3:
+            return
+        owner, name, obj_type = _ident(parts[0]), _text(parts[1]), _ident(parts[2])
+        full = f"{owner}.{name}"
+        objects_by_type[obj_type].add(full)
+
+    def _parse_type(line: bytes) -> None:
+        parts = line.upper().split(b'\t')
+        if len(parts) < 3:
+            return
+        owner, name, typecode = _ident(parts[0]), _text(parts[1]), parts[2].strip()
+        full = f"{owner}.{name}"
+        type_objects['TYPE'].add(full)
+        if typecode == b'OBJECT':
+            type_objects['TYPE BODY'].add(full)
+
+    # 目标端列只参与“列名集合 + VARCHAR 长度”比对，只保留 data_type/char_length，
+    # 不再拉取 NULLABLE/DATA_DEFAULT（默认值可能包含换行/制表符，也会破坏按行解析）。
+    def _parse_tab_column(line: bytes) -> None:
+        parts = line.upper().decode('utf-8', errors='ignore').split('\t', 4)
+        if len(parts) < 5:
+            return
+        owner, table, col, dtype = _intern(parts[0]), _intern(parts[1]), _intern(parts[2]), _intern(parts[3])
+        char_len = parts[4]
+        tab_columns[(owner, table)][col] = ObColumnInfo(dtype, int(char_len) if char_len.isdigit() else None)
+
+    def _parse_tab_comment(line: bytes) -> None:
+        parts = line.split(b'\t', 2)
+        if len(parts) < 3:
+            return
+        owner, table = _ident(parts[0].upper()), _ident(parts[1].upper())
+        table_comments[(owner, table)] = _text(parts[2])
+
+    def _parse_col_comment(line: bytes) -> None:
+        parts = line.split(b'\t', 3)
+        if len(parts) < 4:
+            return
+        owner, table, column = _ident(parts[0].upper()), _ident(parts[1].upper()), _ident(parts[2].upper())
+        column_comments[(owner, table)][column] = _text(parts[3])
+
+    def _parse_index(line: bytes) -> None:
+        parts = line.upper().decode('utf-8', errors='ignore').split('\t', 3)
+        if len(parts) < 4:
+            return
+        t_owner, t_name, idx_name, uniq = _intern(parts[0]), _intern(parts[1]), _intern(parts[2]), _intern(parts[3])
+        indexes[(t_owner, t_name)][idx_name] = IndexInfo(uniq, [])
+
+    def _parse_position(raw: str) -> int:
+        try:
+            return int(raw)
+        except ValueError:
+            return 0
+
+    def _parse_index_column(line: bytes) -> None:
+        parts = line.upper().decode('utf-8', errors='ignore').split('\t', 4)
+        if len(parts) < 5:
+            return
+        t_owner, t_name, idx_name, col_name = _intern(parts[0]), _intern(parts[1]), _intern(parts[2]), _intern(parts[3])
+        index_columns[(t_owner, t_name)][idx_name].append((_parse_position(parts[4]), col_name))
+
+    def _parse_constraint(line: bytes) -> None:
+        parts = line.upper().decode('utf-8', errors='ignore').split('\t', 3)
+        if len(parts) < 4:
+            return
+        owner, table, cons_name, ctype = _intern(parts[0]), _intern(parts[1]), _intern(parts[2]), _intern(parts[3])
+        constraints[(owner, table)][cons_name] = ConstraintInfo(ctype, [])
+
+    def _parse_constraint_column(line: bytes) -> None:
+        parts = line.upper().decode('utf-8', errors='ignore').split('\t', 4)
+        if len(parts) < 5:
+            return
+        owner, table, cons_name, col_name = _intern(parts[0]), _intern(parts[1]), _intern(parts[2]), _intern(parts[3])
+        constraint_columns[(owner, table)][cons_name].append((_parse_position(parts[4]), col_name))
+
+    def _parse_trigger(line: bytes) -> None:
+        parts = line.split(b'\t')
+        if len(parts) < 5:
+            return
+        t_owner, t_name, trg_name = _ident(parts[0].upper()), _ident(parts[1].upper()), _text(parts[2].upper())
+        # 触发事件/状态只有少数几种取值，同样 intern 共享
+        ev, status = _ident(parts[3]), _ident(parts[4])
+        key = (t_owner, t_name)
+        triggers[key][trg_name] = {
+            "event": ev,
+            "status": status
+        }
+
+    def _parse_sequence(line: bytes) -> None:
+        parts = line.upper().split(b'\t')
+        if len(parts) < 2:
+            return
+        owner, seq_name = _ident(parts[0]), _text(parts[1])
+        sequences[owner].add(seq_name)
+
+    parsers: Dict[str, Callable[[bytes], None]] = {
+        'objects': _parse_object,
+        'types': _parse_type,
+        'tab_columns': _parse_tab_column,
+        'indexes': _parse_index,
+        'ind_columns': _parse_index_column,
+        'constraints': _parse_constraint,
+        'cons_columns': _parse_constraint_column,
+        'triggers': _parse_trigger,
+        'sequences': _parse_sequence,
+        'tab_comments': _parse_tab_comment,
+        'col_comments': _parse_col_comment,
+    }
+
+    # 按 owner 分批时多个批次会同时写入按类型分组的集合，预先建好键，解析回调只做 add
+    for obj_type in object_types_filter:
+        objects_by_type[obj_type]
+    type_objects['TYPE']
+    type_objects['TYPE BODY']
+
+    total_scripts = sum(len(entries) for entries in scripts.values())
+    max_workers = max(1, min(max_workers, total_scripts))
+    log.info("正在并发转储 OceanBase 元数据 (%d 个查询, 并发=%d)...", total_scripts, max_workers)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures: Dict[str, List[Future]] = {
+            name: [
+                executor.submit(
+                    obclient_stream_sql, ob_cfg, sql, parsers[name],
+                    columns_timeout if name == 'tab_columns' else base_timeout * statement_count
+                )
+                for sql, statement_count in entries
+            ]
+            for name, entries in scripts.items()
+        }
+
+        def _abort(view: str) -> None:
+            """致命视图读取失败：取消尚未开始的脚本后退出，避免 with 块退出时等待整批跑完。"""
+            for pending in futures.values():
+                for future in pending:
+                    future.cancel()
+            log.error("无法从 OB 读取 %s，程序退出。", view)
             sys.exit(1)
 
-        if out:
-            for line in out.splitlines():
-                parts = line.split('\t')
-                if len(parts) < 2:
-                    continue
-                owner, seq_name = parts[0].strip().upper(), parts[1].strip().upper()
-                sequences.setdefault(owner, set()).add(seq_name)
+        def _query_result(name: str) -> Tuple[bool, str]:
+            """等待某视图的全部批次完成，任一批失败即返回该批的错误。"""
+            for future in futures[name]:
+                ok, err = future.result()
+                if not ok:
+                    return False, err
+            return True, ""
+
+        # --- 1. DBA_OBJECTS ---
+        ok, err = _query_result('objects')
+        if not ok:
+            _abort("DBA_OBJECTS")
+
+        if 'types' in futures:
+            ok, err = _query_result('types')
+            if not ok:
+                log.warning("读取 DBA_TYPES 失败，TYPE / TYPE BODY 检查可能不完整: %s", err)
+            else:
+                for obj_type, names in type_objects.items():
+                    objects_by_type[obj_type].update(names)
+
+        # --- 2. DBA_TAB_COLUMNS ---
+        if include_tab_columns:
+            ok, err = _query_result('tab_columns')
+            if not ok:
+                _abort("DBA_TAB_COLUMNS")
+
+        # --- 2.b 注释 (DBA_TAB_COMMENTS / DBA_COL_COMMENTS) ---
+        comments_complete = False
+        if include_comments:
+            comments_complete = True
+
+            if 'tab_comments' in futures:
+                ok, err = _query_result('tab_comments')
+                if not ok:
+                    log.warning("无法从 OB 读取 DBA_TAB_COMMENTS，注释比对将跳过：%s", err)
+                    comments_complete = False
+
+            if comments_complete and 'col_comments' in futures:
+                ok, err = _query_result('col_comments')
+                if not ok:
+                    log.warning("无法从 OB 读取 DBA_COL_COMMENTS，注释比对将跳过：%s", err)
+                    comments_complete = False
+            if comments_complete and target_pairs and not table_comments and not column_comments:
+                log.warning("OB 端注释查询未返回任何记录，可能缺少权限，注释比对将跳过。")
+                comments_complete = False
+
+        # --- 3. DBA_INDEXES ---
+        if include_indexes:
+            ok, err = _query_result('indexes')
+            if not ok:
+                _abort("DBA_INDEXES")
+
+            # --- 4. DBA_IND_COLUMNS ---
+            ok, err = _query_result('ind_columns')
+            if not ok:
+                _abort("DBA_IND_COLUMNS")
+
+            for key, idx_cols in index_columns.items():
+                table_indexes = indexes[key]
+                for idx_name, cols in idx_cols.items():
+                    table_indexes.setdefault(
+                        idx_name, IndexInfo("UNKNOWN", [])
+                    ).columns.extend([col for _, col in sorted(cols)])
+
+            # 过滤 OMS_* 自动索引
+            for key in list(indexes.keys()):
+                pruned = {}
+                for idx_name, info in indexes[key].items():
+                    if is_oms_index(idx_name, info.columns):
+                        continue
+                    pruned[idx_name] = info
+                if pruned:
+                    indexes[key] = pruned
+                else:
+                    del indexes[key]
+
+        # --- 5. DBA_CONSTRAINTS (P/U/R) ---
+        if include_constraints:
+            ok, err = _query_result('constraints')
+            if not ok:
+                _abort("DBA_CONSTRAINTS")
+
+            # --- 6. DBA_CONS_COLUMNS ---
+            ok, err = _query_result('cons_columns')
+            if not ok:
+                _abort("DBA_CONS_COLUMNS")
+
+            for key, cons_cols in constraint_columns.items():
+                table_constraints = constraints[key]
+                for cons_name, cols in cons_cols.items():
+                    table_constraints.setdefault(
+                        cons_name, ConstraintInfo("UNKNOWN", [])
+                    ).columns.extend([col for _, col in sorted(cols)])
+
+        # --- 7. DBA_TRIGGERS ---
+        if include_triggers:
+            ok, err = _query_result('triggers')
+            if not ok:
+                _abort("DBA_TRIGGERS")
+
+        # --- 8. DBA_SEQUENCES ---
+        if include_sequences:
+            ok, err = _query_result('sequences')
+            if not ok:
+                _abort("DBA_SEQUENCES")
+
+    tables_by_owner: Dict[str, Set[str]] = defaultdict(set)
+    for full in objects_by_type.get('TABLE', ()):
+        owner, table = full.split('.', 1)
+        tables_by_owner[owner].add(table)
 
     log.info("OceanBase 元数据转储完成 (根据开关加载 DBA_OBJECTS/列/索引/约束/触发器/序列/注释)。")
     return ObMetadata(
-        objects_by_type=objects_by_type,
-        tab_columns=tab_columns,
-        indexes=indexes,
-        constraints=constraints,
-        triggers=triggers,
-        sequences=sequences,
+        objects_by_type={obj_type: names for obj_type, names in objects_by_type.items() if names},
+        tab_columns=dict(tab_columns),
+        indexes=dict(indexes),
+        constraints=dict(constraints),
+        triggers=dict(triggers),
+        sequences=dict(sequences),
         table_comments=table_comments,
-        column_comments=column_comments,
-        comments_complete=comments_complete
+        column_comments=dict(column_comments),
+        comments_complete=comments_complete,
+        tables_by_owner={owner: frozenset(tables) for owner, tables in tables_by_owner.items()}
     )
 
 
@@ -1844,322 +2290,352 @@ def dump_oracle_metadata(
 
     log.info("正在批量加载 Oracle 元数据 (DBA_TAB_COLUMNS/DBA_INDEXES/DBA_CONSTRAINTS/DBA_TRIGGERS/DBA_SEQUENCES)...")
     table_columns: Dict[Tuple[str, str], Dict[str, Dict]] = {}
-    indexes: Dict[Tuple[str, str], Dict[str, Dict]] = {}
-    constraints: Dict[Tuple[str, str], Dict[str, Dict]] = {}
+    indexes: Dict[Tuple[str, str], Dict[str, IndexInfo]] = {}
+    constraints: Dict[Tuple[str, str], Dict[str, ConstraintInfo]] = {}
     triggers: Dict[Tuple[str, str], Dict[str, Dict]] = {}
     sequences: Dict[str, Set[str]] = {}
     table_comments: Dict[Tuple[str, str], Optional[str]] = {}
     column_comments: Dict[Tuple[str, str], Dict[str, Optional[str]]] = {}
     comments_complete = False
 
+    # 标识符统一 intern，重复的 OWNER/TABLE_NAME/列名只保留一份对象
     def _safe_upper(value: Optional[str]) -> Optional[str]:
         if value is None:
             return None
         try:
-            return value.upper()
+            return sys.intern(value.upper())
         except AttributeError:
-            return str(value).upper()
+            return sys.intern(str(value).upper())
+
+    # 只校验 schema 中少量表时，把表过滤下推到 SQL，避免拉取整个 owner 的列/索引/约束再丢弃；
+    # 表很多时多批 IN 列表的解析开销反而更大，仍按 owner 拉取。客户端的 table_pairs 过滤两种方式都保留。
+    pair_batches: List[List[Tuple[str, str]]] = []
+    if table_pairs and len(table_pairs) <= ORACLE_TABLE_FILTER_MAX_TABLES:
+        pair_batches = chunk_list(sorted(table_pairs), ORACLE_TABLE_FILTER_BATCH_SIZE)
+
+    def _scoped_statements(select_from: str, owner_col: str, extra_where: str = "") -> List[Tuple[str, object]]:
+        """为表级元数据查询生成按表 (分批) 或按 owner 过滤的 (sql, binds) 列表。"""
+        if not pair_batches:
+            return [(f"{select_from} WHERE {owner_col} IN {ORACLE_OWNER_LIST_FILTER}{extra_where}", {"owners": owners})]
+        statements: List[Tuple[str, object]] = []
+        for batch in pair_batches:
+            pair_clause = ",".join(f"(:{2 * i + 1},:{2 * i + 2})" for i in range(len(batch)))
+            binds = [value for pair in batch for value in pair]
+            statements.append((
+                f"{select_from} WHERE ({owner_col}, TABLE_NAME) IN ({pair_clause}){extra_where}",
+                binds
+            ))
+        return statements
+
+    # 列定义
+    def _load_ora_tab_columns(include_hidden: bool) -> List[Tuple[str, object]]:
+        hidden_col = ", NVL(TO_CHAR(HIDDEN_COLUMN),'NO') AS HIDDEN_COLUMN" if include_hidden else ""
+        return _scoped_statements(
+            f"""
+            SELECT OWNER, TABLE_NAME, COLUMN_NAME, DATA_TYPE,
+                   DATA_LENGTH, DATA_PRECISION, DATA_SCALE,
+                   NULLABLE, DATA_DEFAULT, CHAR_USED, CHAR_LENGTH, COLUMN_ID{hidden_col}
+            FROM DBA_TAB_COLUMNS""",
+            "OWNER",
+            f"\n              AND COLUMN_NAME NOT IN ({IGNORED_OMS_COLUMNS_SQL})"
+        )
 
-    try:
-        with oracledb.connect(
-            user=ora_cfg['user'],
-            password=ora_cfg['password'],
-            dsn=ora_cfg['dsn']
-        ) as ora_conn:
-            if owners:
-                owners_clause = _make_in_clause(owners)
+    def _parse_tab_column_row(row, include_hidden: bool) -> Dict:
+        return {
+            "data_type": row[3],
+            "data_length": row[4],
+            "data_precision": row[5],
+            "data_scale": row[6],
+            "nullable": row[7],
+            "data_default": row[8],
+            "char_used": row[9],
+            "char_length": row[10],
+            "column_id": row[11],
+            "hidden": (row[12] if include_hidden and len(row) > 12 else "NO") == "YES" if include_hidden else False
+        }
 
-                # 检测是否支持 HIDDEN_COLUMN 字段（部分低版本/权限受限环境不存在）
-                support_hidden_col = False
-                try:
-                    with ora_conn.cursor() as cursor:
-                        cursor.execute("""
-                            SELECT COUNT(*)
-                            FROM DBA_TAB_COLUMNS
-                            WHERE OWNER = 'SYS'
-                              AND TABLE_NAME = 'DBA_TAB_COLUMNS'
-                              AND COLUMN_NAME = 'HIDDEN_COLUMN'
-                        """)
-                        count_row = cursor.fetchone()
-                        support_hidden_col = bool(count_row and count_row[0] and int(count_row[0]) > 0)
-                except oracledb.Error as e:
-                    log.info("无法探测 HIDDEN_COLUMN 支持，默认不读取 hidden 标记：%s", e)
-                    support_hidden_col = False
-
-                # 列定义
-                def _load_ora_tab_columns(include_hidden: bool):
-                    hidden_col = ", NVL(TO_CHAR(HIDDEN_COLUMN),'NO') AS HIDDEN_COLUMN" if include_hidden else ""
-                    sql = f"""
-                        SELECT OWNER, TABLE_NAME, COLUMN_NAME, DATA_TYPE,
-                               DATA_LENGTH, DATA_PRECISION, DATA_SCALE,
-                               NULLABLE, DATA_DEFAULT, CHAR_USED, CHAR_LENGTH{hidden_col}
+    # 各查询互不依赖：每个任务在线程池中从 session pool 借用独立会话执行，
+    # 只写入自己的结构；依赖多个结果的合并（索引列、约束列、外键引用）在主线程完成。
+    index_columns: Dict[Tuple[str, str], Dict[str, List[Tuple[int, str]]]] = {}
+    constraint_columns: Dict[Tuple[str, str], Dict[str, List[Tuple[int, str]]]] = {}
+
+    def _run_query(pool, statements: List[Tuple[str, object]], on_row: Callable[[Tuple], None]) -> None:
+        with pool.acquire() as conn:
+            with open_fetch_cursor(conn) as cursor:
+                for sql, binds in statements:
+                    cursor.execute(sql, prepare_list_binds(conn, binds))
+                    for row in iter_cursor_rows(cursor):
+                        on_row(row)
+
+    def _task_tab_columns(pool) -> None:
+        # 检测是否支持 HIDDEN_COLUMN 字段（部分低版本/权限受限环境不存在）
+        support_hidden_col = False
+        try:
+            with pool.acquire() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("""
+                        SELECT COUNT(*)
                         FROM DBA_TAB_COLUMNS
-                        WHERE OWNER IN ({owners_clause})
-                    """
-                    return sql
-
-                def _parse_tab_column_row(row, include_hidden: bool) -> Dict:
-                    return {
-                        "data_type": row[3],
-                        "data_length": row[4],
-                        "data_precision": row[5],
-                        "data_scale": row[6],
-                        "nullable": row[7],
-                        "data_default": row[8],
-                        "char_used": row[9],
-                        "char_length": row[10],
-                        "hidden": (row[11] if include_hidden and len(row) > 11 else "NO") == "YES" if include_hidden else False
-                    }
-
-                sql = _load_ora_tab_columns(include_hidden=support_hidden_col)
-                try:
-                    with ora_conn.cursor() as cursor:
-                        cursor.execute(sql, owners)
-                        for row in cursor:
-                            owner = _safe_upper(row[0])
-                            table = _safe_upper(row[1])
-                            col = _safe_upper(row[2])
-                            if not owner or not table or not col:
-                                continue
-                            key = (owner, table)
-                            if key not in table_pairs:
-                                continue
-                            table_columns.setdefault(key, {})[col] = _parse_tab_column_row(row, support_hidden_col)
-                except oracledb.Error as e:
-                    if support_hidden_col:
-                        log.info("读取 DBA_TAB_COLUMNS(含 hidden) 失败，尝试不含 hidden：%s", e)
-                        support_hidden_col = False
-                        sql = _load_ora_tab_columns(include_hidden=False)
-                        with ora_conn.cursor() as cursor:
-                            cursor.execute(sql, owners)
-                            for row in cursor:
-                                owner = _safe_upper(row[0])
-                                table = _safe_upper(row[1])
-                                col = _safe_upper(row[2])
-                                if not owner or not table or not col:
-                                    continue
-                                key = (owner, table)
-                                if key not in table_pairs:
-                                    continue
-                                table_columns.setdefault(key, {})[col] = _parse_tab_column_row(row, False)
-                    else:
-                        raise
-
-                # 索引
-                if include_indexes:
-                    sql_idx = f"""
-                        SELECT TABLE_OWNER, TABLE_NAME, INDEX_NAME, UNIQUENESS
-                        FROM DBA_INDEXES
-                        WHERE TABLE_OWNER IN ({owners_clause})
-                    """
-                    with ora_conn.cursor() as cursor:
-                        cursor.execute(sql_idx, owners)
-                        for row in cursor:
-                            owner = _safe_upper(row[0])
-                            table = _safe_upper(row[1])
-                            if not owner or not table:
-                                continue
-                            key = (owner, table)
-                            if key not in table_pairs:
-                                continue
-                            idx_name = _safe_upper(row[2])
-                            if not idx_name:
-                                continue
-                            indexes.setdefault(key, {})[idx_name] = {
-                                "uniqueness": (row[3] or "").upper(),
-                                "columns": []
-                            }
-
-                    sql_idx_cols = f"""
-                        SELECT TABLE_OWNER, TABLE_NAME, INDEX_NAME, COLUMN_NAME
-                        FROM DBA_IND_COLUMNS
-                        WHERE TABLE_OWNER IN ({owners_clause})
-                        ORDER BY TABLE_OWNER, TABLE_NAME, INDEX_NAME, COLUMN_POSITION
-                    """
-                    with ora_conn.cursor() as cursor:
-                        cursor.execute(sql_idx_cols, owners)
-                        for row in cursor:
-                            owner = _safe_upper(row[0])
-                            table = _safe_upper(row[1])
-                            if not owner or not table:
-                                continue
-                            key = (owner, table)
-                            if key not in table_pairs:
-                                continue
-                            idx_name = _safe_upper(row[2])
-                            col_name = _safe_upper(row[3])
-                            if not idx_name or not col_name:
-                                continue
-                            indexes.setdefault(key, {}).setdefault(
-                                idx_name, {"uniqueness": "UNKNOWN", "columns": []}
-                            )["columns"].append(col_name)
-
-                # 约束
-                if include_constraints:
-                    sql_cons = f"""
-                        SELECT OWNER, TABLE_NAME, CONSTRAINT_NAME, CONSTRAINT_TYPE, R_OWNER, R_CONSTRAINT_NAME
-                        FROM DBA_CONSTRAINTS
-                        WHERE OWNER IN ({owners_clause})
-                          AND CONSTRAINT_TYPE IN ('P','U','R')
-                          AND STATUS = 'ENABLED'
-                    """
-                    with ora_conn.cursor() as cursor:
-                        cursor.execute(sql_cons, owners)
-                        for row in cursor:
-                            owner = _safe_upper(row[0])
-                            table = _safe_upper(row[1])
-                            if not owner or not table:
-                                continue
-                            key = (owner, table)
-                            if key not in table_pairs:
-                                continue
-                            name = _safe_upper(row[2])
-                            if not name:
-                                continue
-                            constraints.setdefault(key, {})[name] = {
-                                "type": (row[3] or "").upper(),
-                                "columns": [],
-                                "r_owner": _safe_upper(row[4]) if row[4] else None,
-                                "r_constraint": _safe_upper(row[5]) if row[5] else None,
-                            }
-
-                    sql_cons_cols = f"""
-                        SELECT OWNER, TABLE_NAME, CONSTRAINT_NAME, COLUMN_NAME
-                        FROM DBA_CONS_COLUMNS
-                        WHERE OWNER IN ({owners_clause})
-                        ORDER BY OWNER, TABLE_NAME, CONSTRAINT_NAME, POSITION
-                    """
-                    with ora_conn.cursor() as cursor:
-                        cursor.execute(sql_cons_cols, owners)
-                        for row in cursor:
+                        WHERE OWNER = 'SYS'
+                          AND TABLE_NAME = 'DBA_TAB_COLUMNS'
+                          AND COLUMN_NAME = 'HIDDEN_COLUMN'
+                    """)
+                    count_row = cursor.fetchone()
+                    support_hidden_col = bool(count_row and count_row[0] and int(count_row[0]) > 0)
+        except oracledb.Error as e:
+            log.info("无法探测 HIDDEN_COLUMN 支持，默认不读取 hidden 标记：%s", e)
+            support_hidden_col = False
+
+        def _on_row(row, include_hidden: bool) -> None:
+            owner = _safe_upper(row[0])
+            table = _safe_upper(row[1])
+            col = _safe_upper(row[2])
+            if not owner or not table or not col:
+                return
+            key = (owner, table)
+            if key not in table_pairs:
+                return
+            table_columns.setdefault(key, {})[col] = _parse_tab_column_row(row, include_hidden)
+
+        try:
+            _run_query(
+                pool,
+                _load_ora_tab_columns(include_hidden=support_hidden_col),
+                lambda row: _on_row(row, support_hidden_col)
+            )
+        except oracledb.Error as e:
+            if not support_hidden_col:
+                raise
+            log.info("读取 DBA_TAB_COLUMNS(含 hidden) 失败，尝试不含 hidden：%s", e)
+            table_columns.clear()
+            _run_query(
+                pool,
+                _load_ora_tab_columns(include_hidden=False),
+                lambda row: _on_row(row, False)
+            )
+
+    def _on_index_row(row) -> None:
+        owner = _safe_upper(row[0])
+        table = _safe_upper(row[1])
+        if not owner or not table:
+            return
+        key = (owner, table)
+        if key not in table_pairs:
+            return
+        idx_name = _safe_upper(row[2])
+        if not idx_name:
+            return
+        indexes.setdefault(key, {})[idx_name] = IndexInfo((row[3] or "").upper(), [])
+
+    def _on_index_column_row(row) -> None:
+        owner = _safe_upper(row[0])
+        table = _safe_upper(row[1])
+        if not owner or not table:
+            return
+        key = (owner, table)
+        if key not in table_pairs:
+            return
+        idx_name = _safe_upper(row[2])
+        col_name = _safe_upper(row[3])
+        if not idx_name or not col_name:
+            return
+        index_columns.setdefault(key, {}).setdefault(idx_name, []).append((row[4] or 0, col_name))
+
+    def _on_constraint_row(row) -> None:
+        owner = _safe_upper(row[0])
+        table = _safe_upper(row[1])
+        if not owner or not table:
+            return
+        key = (owner, table)
+        if key not in table_pairs:
+            return
+        name = _safe_upper(row[2])
+        if not name:
+            return
+        constraints.setdefault(key, {})[name] = ConstraintInfo(
+            (row[3] or "").upper(),
+            [],
+            r_owner=_safe_upper(row[4]) if row[4] else None,
+            r_constraint=_safe_upper(row[5]) if row[5] else None,
+        )
+
+    def _on_constraint_column_row(row) -> None:
+        owner = _safe_upper(row[0])
+        table = _safe_upper(row[1])
+        if not owner or not table:
+            return
+        key = (owner, table)
+        if key not in table_pairs:
+            return
+        cons_name = _safe_upper(row[2])
+        col_name = _safe_upper(row[3])
+        if not cons_name or not col_name:
+            return
+        constraint_columns.setdefault(key, {}).setdefault(cons_name, []).append((row[4] or 0, col_name))
+
+    def _on_trigger_row(row) -> None:
+        owner = _safe_upper(row[0])
+        table = _safe_upper(row[1])
+        if not owner or not table:
+            return
+        key = (owner, table)
+        if key not in table_pairs:
+            return
+        trg_name = _safe_upper(row[2])
+        if not trg_name:
+            return
+        triggers.setdefault(key, {})[trg_name] = {
+            "event": row[3],
+            "status": row[4]
+        }
+
+    def _task_comments(pool) -> bool:
+        comment_keys = sorted(f"{owner}.{table}" for owner, table in table_pairs)
+        try:
+            with pool.acquire() as conn:
+                with open_fetch_cursor(conn) as cursor:
+                    for chunk in chunk_list(comment_keys, COMMENT_BATCH_SIZE):
+                        if not chunk:
+                            continue
+                        placeholders = _make_in_clause(chunk)
+                        sql_cmt = f"""
+                            SELECT OWNER, TABLE_NAME, COMMENTS
+                            FROM DBA_TAB_COMMENTS
+                            WHERE OWNER||'.'||TABLE_NAME IN ({placeholders})
+                        """
+                        cursor.execute(sql_cmt, chunk)
+                        for row in iter_cursor_rows(cursor):
                             owner = _safe_upper(row[0])
                             table = _safe_upper(row[1])
                             if not owner or not table:
                                 continue
-                            key = (owner, table)
-                            if key not in table_pairs:
-                                continue
-                            cons_name = _safe_upper(row[2])
-                            col_name = _safe_upper(row[3])
-                            if not cons_name or not col_name:
-                                continue
-                            constraints.setdefault(key, {}).setdefault(
-                                cons_name, {"type": "UNKNOWN", "columns": []}
-                            )["columns"].append(col_name)
-
-                    # 为外键补齐被引用表信息 (基于约束引用)
-                    cons_table_lookup: Dict[Tuple[str, str], Tuple[str, str]] = {}
-                    for (owner, table), cons_map in constraints.items():
-                        for cons_name, info in cons_map.items():
-                            ctype = (info.get("type") or "").upper()
-                            if ctype in ('P', 'U'):
-                                cons_table_lookup[(owner, cons_name)] = (owner, table)
-                    for (owner, _), cons_map in constraints.items():
-                        for cons_name, info in cons_map.items():
-                            ctype = (info.get("type") or "").upper()
-                            if ctype != 'R':
-                                continue
-                            r_owner = (info.get("r_owner") or "").upper()
-                            r_cons = (info.get("r_constraint") or "").upper()
-                            if not r_owner or not r_cons:
-                                continue
-                            ref_table = cons_table_lookup.get((r_owner, r_cons))
-                            if ref_table:
-                                info["ref_table_owner"], info["ref_table_name"] = ref_table
-
-                # 触发器
-                if include_triggers:
-                    sql_trg = f"""
-                        SELECT TABLE_OWNER, TABLE_NAME, TRIGGER_NAME, TRIGGERING_EVENT, STATUS
-                        FROM DBA_TRIGGERS
-                        WHERE TABLE_OWNER IN ({owners_clause})
-                    """
-                    with ora_conn.cursor() as cursor:
-                        cursor.execute(sql_trg, owners)
-                        for row in cursor:
+                            table_comments[(owner, table)] = row[2]
+
+                    for chunk in chunk_list(comment_keys, COMMENT_BATCH_SIZE):
+                        if not chunk:
+                            continue
+                        placeholders = _make_in_clause(chunk)
+                        sql_cmt_col = f"""
+                            SELECT OWNER, TABLE_NAME, COLUMN_NAME, COMMENTS
+                            FROM DBA_COL_COMMENTS
+                            WHERE OWNER||'.'||TABLE_NAME IN ({placeholders})
+                        """
+                        cursor.execute(sql_cmt_col, chunk)
+                        for row in iter_cursor_rows(cursor):
                             owner = _safe_upper(row[0])
                             table = _safe_upper(row[1])
-                            if not owner or not table:
+                            column = _safe_upper(row[2])
+                            if not owner or not table or not column:
                                 continue
-                            key = (owner, table)
-                            if key not in table_pairs:
-                                continue
-                            trg_name = _safe_upper(row[2])
-                            if not trg_name:
-                                continue
-                            triggers.setdefault(key, {})[trg_name] = {
-                                "event": row[3],
-                                "status": row[4]
-                            }
-
-                if include_comments:
-                    if not table_pairs:
-                        comments_complete = True
-                    else:
-                        comment_keys = sorted(f"{owner}.{table}" for owner, table in table_pairs)
-                        comments_complete = True
-                        try:
-                            with ora_conn.cursor() as cursor:
-                                for chunk in chunk_list(comment_keys, COMMENT_BATCH_SIZE):
-                                    if not chunk:
-                                        continue
-                                    placeholders = _make_in_clause(chunk)
-                                    sql_cmt = f"""
-                                        SELECT OWNER, TABLE_NAME, COMMENTS
-                                        FROM DBA_TAB_COMMENTS
-                                        WHERE OWNER||'.'||TABLE_NAME IN ({placeholders})
-                                    """
-                                    cursor.execute(sql_cmt, chunk)
-                                    for row in cursor:
-                                        owner = _safe_upper(row[0])
-                                        table = _safe_upper(row[1])
-                                        if not owner or not table:
-                                            continue
-                                        table_comments[(owner, table)] = row[2]
-
-                                for chunk in chunk_list(comment_keys, COMMENT_BATCH_SIZE):
-                                    if not chunk:
-                                        continue
-                                    placeholders = _make_in_clause(chunk)
-                                    sql_cmt_col = f"""
-                                        SELECT OWNER, TABLE_NAME, COLUMN_NAME, COMMENTS
-                                        FROM DBA_COL_COMMENTS
-                                        WHERE OWNER||'.'||TABLE_NAME IN ({placeholders})
-                                    """
-                                    cursor.execute(sql_cmt_col, chunk)
-                                for row in cursor:
-                                    owner = _safe_upper(row[0])
-                                    table = _safe_upper(row[1])
-                                    column = _safe_upper(row[2])
-                                    if not owner or not table or not column:
-                                        continue
-                                    column_comments.setdefault((owner, table), {})[column] = row[3]
-                        except oracledb.Error as e:
-                            comments_complete = False
-                            log.warning("读取 DBA_TAB_COMMENTS/DBA_COL_COMMENTS 失败，将跳过注释比对：%s", e)
-                        if comments_complete and table_pairs and not table_comments and not column_comments:
-                            log.warning("Oracle 端注释查询未返回任何记录，可能缺少权限，注释比对将跳过。")
-                            comments_complete = False
-
-            if seq_owners and include_sequences:
-                seq_clause = _make_in_clause(seq_owners)
-                sql_seq = f"""
-                    SELECT SEQUENCE_OWNER, SEQUENCE_NAME
-                    FROM DBA_SEQUENCES
-                    WHERE SEQUENCE_OWNER IN ({seq_clause})
-                """
-                with ora_conn.cursor() as cursor:
-                    cursor.execute(sql_seq, seq_owners)
-                    for row in cursor:
-                        owner = _safe_upper(row[0])
-                        seq_name = _safe_upper(row[1])
-                        if not owner or not seq_name:
-                            continue
-                        sequences.setdefault(owner, set()).add(seq_name)
+                            column_comments.setdefault((owner, table), {})[column] = row[3]
+        except oracledb.Error as e:
+            log.warning("读取 DBA_TAB_COMMENTS/DBA_COL_COMMENTS 失败，将跳过注释比对：%s", e)
+            return False
+        return True
+
+    def _on_sequence_row(row) -> None:
+        owner = _safe_upper(row[0])
+        seq_name = _safe_upper(row[1])
+        if not owner or not seq_name:
+            return
+        sequences.setdefault(owner, set()).add(seq_name)
+
+    tasks: Dict[str, Tuple] = {}
+    if owners:
+        tasks['tab_columns'] = (_task_tab_columns,)
+        if include_indexes:
+            tasks['indexes'] = (_run_query, _scoped_statements("""
+                SELECT TABLE_OWNER, TABLE_NAME, INDEX_NAME, UNIQUENESS
+                FROM DBA_INDEXES""", "TABLE_OWNER"), _on_index_row)
+            tasks['ind_columns'] = (_run_query, _scoped_statements("""
+                SELECT TABLE_OWNER, TABLE_NAME, INDEX_NAME, COLUMN_NAME, COLUMN_POSITION
+                FROM DBA_IND_COLUMNS""", "TABLE_OWNER"), _on_index_column_row)
+        if include_constraints:
+            tasks['constraints'] = (_run_query, _scoped_statements("""
+                SELECT OWNER, TABLE_NAME, CONSTRAINT_NAME, CONSTRAINT_TYPE, R_OWNER, R_CONSTRAINT_NAME
+                FROM DBA_CONSTRAINTS""", "OWNER", """
+                  AND CONSTRAINT_TYPE IN ('P','U','R')
+                  AND STATUS = 'ENABLED'"""), _on_constraint_row)
+            tasks['cons_columns'] = (_run_query, _scoped_statements("""
+                SELECT OWNER, TABLE_NAME, CONSTRAINT_NAME, COLUMN_NAME, POSITION
+                FROM DBA_CONS_COLUMNS""", "OWNER"), _on_constraint_column_row)
+        if include_triggers:
+            tasks['triggers'] = (_run_query, _scoped_statements("""
+                SELECT TABLE_OWNER, TABLE_NAME, TRIGGER_NAME, TRIGGERING_EVENT, STATUS
+                FROM DBA_TRIGGERS""", "TABLE_OWNER"), _on_trigger_row)
+        if include_comments and table_pairs:
+            tasks['comments'] = (_task_comments,)
+    if seq_owners and include_sequences:
+        tasks['sequences'] = (_run_query, [(f"""
+            SELECT SEQUENCE_OWNER, SEQUENCE_NAME
+            FROM DBA_SEQUENCES
+            WHERE SEQUENCE_OWNER IN {ORACLE_OWNER_LIST_FILTER}
+        """, {"owners": seq_owners})], _on_sequence_row)
 
+    workers = max(1, min(ORACLE_METADATA_MAX_SESSIONS, len(tasks)))
+    results: Dict[str, object] = {}
+    pool = None
+    try:
+        pool = oracledb.create_pool(
+            user=ora_cfg['user'],
+            password=ora_cfg['password'],
+            dsn=ora_cfg['dsn'],
+            min=1,
+            max=workers,
+            increment=1
+        )
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures: Dict[str, Future] = {
+                name: executor.submit(task[0], pool, *task[1:])
+                for name, task in tasks.items()
+            }
+            results = {name: future.result() for name, future in futures.items()}
     except oracledb.Error as e:
         log.error(f"严重错误: 批量获取 Oracle 元数据失败: {e}")
         sys.exit(1)
+    finally:
+        if pool is not None:
+            pool.close(force=True)
+
+    for key, idx_cols in index_columns.items():
+        table_indexes = indexes.setdefault(key, {})
+        for idx_name, cols in idx_cols.items():
+            table_indexes.setdefault(
+                idx_name, IndexInfo("UNKNOWN", [])
+            ).columns.extend([col for _, col in sorted(cols)])
+
+    for key, cons_cols in constraint_columns.items():
+        table_constraints = constraints.setdefault(key, {})
+        for cons_name, cols in cons_cols.items():
+            table_constraints.setdefault(
+                cons_name, ConstraintInfo("UNKNOWN", [])
+            ).columns.extend([col for _, col in sorted(cols)])
+
+    if include_constraints:
+        # 为外键补齐被引用表信息 (基于约束引用)
+        cons_table_lookup: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        for (owner, table), cons_map in constraints.items():
+            for cons_name, info in cons_map.items():
+                if info.type in ('P', 'U'):
+                    cons_table_lookup[(owner, cons_name)] = (owner, table)
+        for (owner, _), cons_map in constraints.items():
+            for cons_name, info in cons_map.items():
+                if info.type != 'R':
+                    continue
+                if not info.r_owner or not info.r_constraint:
+                    continue
+                ref_table = cons_table_lookup.get((info.r_owner, info.r_constraint))
+                if ref_table:
+                    # 只替换已有键的值，不改变字典大小，可在遍历中进行
+                    cons_map[cons_name] = info._replace(
+                        ref_table_owner=ref_table[0], ref_table_name=ref_table[1]
+                    )
+
+    if include_comments and table_pairs:
+        comments_complete = bool(results.get('comments'))
+        if comments_complete and not table_comments and not column_comments:
+            log.warning("Oracle 端注释查询未返回任何记录，可能缺少权限，注释比对将跳过。")
+            comments_complete = False
 
     log.info(
         "Oracle 元数据加载完成：列=%d, 索引表=%d, 约束表=%d, 触发器表=%d, 序列schema=%d, 注释表=%d",
@@ -2188,34 +2664,35 @@ def load_oracle_dependencies(
     if not schemas_list:
         return []
 
-    owners_clause = ','.join([f":{i+1}" for i in range(len(schemas_list))])
     types_clause = ",".join(f"'{t}'" for t in ALL_TRACKED_OBJECT_TYPES)
 
     sql = f"""
         SELECT OWNER, NAME, TYPE, REFERENCED_OWNER, REFERENCED_NAME, REFERENCED_TYPE
         FROM DBA_DEPENDENCIES
-        WHERE OWNER IN ({owners_clause})
-          AND REFERENCED_OWNER IN ({owners_clause})
+        WHERE OWNER IN {ORACLE_OWNER_LIST_FILTER}
+          AND REFERENCED_OWNER IN {ORACLE_OWNER_LIST_FILTER}
           AND TYPE IN ({types_clause})
           AND REFERENCED_TYPE IN ({types_clause})
     """
 
     records: List[DependencyRecord] = []
+    # 标识符在此统一 upper + intern，后续构造期望依赖集合与集合差运算无需再次规范化
+    _intern = sys.intern
     try:
         with oracledb.connect(
             user=ora_cfg['user'],
             password=ora_cfg['password'],
             dsn=ora_cfg['dsn']
         ) as connection:
-            with connection.cursor() as cursor:
-                cursor.execute(sql, schemas_list)
-                for row in cursor:
-                    owner = (row[0] or '').strip().upper()
-                    name = (row[1] or '').strip().upper()
-                    obj_type = (row[2] or '').strip().upper()
-                    ref_owner = (row[3] or '').strip().upper()
-                    ref_name = (row[4] or '').strip().upper()
-                    ref_type = (row[5] or '').strip().upper()
+            with open_fetch_cursor(connection) as cursor:
+                cursor.execute(sql, prepare_list_binds(connection, {"owners": list(schemas_list)}))
+                for row in iter_cursor_rows(cursor):
+                    owner = _intern((row[0] or '').strip().upper())
+                    name = _intern((row[1] or '').strip().upper())
+                    obj_type = _intern((row[2] or '').strip().upper())
+                    ref_owner = _intern((row[3] or '').strip().upper())
+                    ref_name = _intern((row[4] or '').strip().upper())
+                    ref_type = _intern((row[5] or '').strip().upper())
                     if not owner or not name or not ref_owner or not ref_name:
                         continue
                     records.append(DependencyRecord(
@@ -2253,32 +2730,30 @@ def load_ob_dependencies(ob_cfg: ObConfig, target_schemas: Set[str]) -> Set[Tupl
           AND TYPE IN ({types_clause})
           AND REFERENCED_TYPE IN ({types_clause})
     """
-    ok, out, err = obclient_run_sql(ob_cfg, sql)
+    result: Set[Tuple[str, str, str, str]] = set()
+
+    # 依赖行数可能很多：流式逐行解析，不在内存中保留整段 stdout 及其行列表
+    def _on_line(line: bytes) -> None:
+        parts = line.upper().split(b'\t')
+        if len(parts) < 6:
+            return
+        owner, name, obj_type, ref_owner, ref_name, ref_type = (
+            part.strip().decode('utf-8', errors='ignore') for part in parts[:6]
+        )
+        if not owner or not name or not ref_owner or not ref_name:
+            return
+        result.add((
+            f"{owner}.{name}",
+            obj_type,
+            f"{ref_owner}.{ref_name}",
+            ref_type
+        ))
+
+    ok, err = obclient_stream_sql(ob_cfg, sql, _on_line)
     if not ok:
         log.error("无法从 OB 读取 DBA_DEPENDENCIES，程序退出。")
         sys.exit(1)
 
-    result: Set[Tuple[str, str, str, str]] = set()
-    if out:
-        for line in out.splitlines():
-            parts = line.split('\t')
-            if len(parts) < 6:
-                continue
-            owner = parts[0].strip().upper()
-            name = parts[1].strip().upper()
-            obj_type = parts[2].strip().upper()
-            ref_owner = parts[3].strip().upper()
-            ref_name = parts[4].strip().upper()
-            ref_type = parts[5].strip().upper()
-            if not owner or not name or not ref_owner or not ref_name:
-                continue
-            result.add((
-                f"{owner}.{name}",
-                obj_type,
-                f"{ref_owner}.{ref_name}",
-                ref_type
-            ))
-
     log.info("OceanBase 依赖信息加载完成，共 %d 条记录。", len(result))
     return result
 
@@ -2294,37 +2769,38 @@ def build_expected_dependency_pairs(
     expected: Set[Tuple[str, str, str, str]] = set()
     skipped: List[DependencyIssue] = []
 
+    # 同一被依赖对象往往被大量依赖行引用：按 (对象名, 类型) 记忆映射结果，仅在本次调用内有效
+    @functools.lru_cache(maxsize=None)
+    def _mapped_target(src_full_name: str, obj_type: str) -> Optional[str]:
+        return get_mapped_target(full_mapping, src_full_name, obj_type)
+
     for dep in dependencies:
-        dep_key = f"{dep.owner}.{dep.name}".upper()
-        ref_key = f"{dep.referenced_owner}.{dep.referenced_name}".upper()
-        dep_target = get_mapped_target(full_mapping, dep_key, dep.object_type)
-        ref_target = get_mapped_target(full_mapping, ref_key, dep.referenced_type)
+        # load_oracle_dependencies 已完成 upper/intern，映射目标同样为大写
+        dep_key = f"{dep.owner}.{dep.name}"
+        ref_key = f"{dep.referenced_owner}.{dep.referenced_name}"
+        dep_target = _mapped_target(dep_key, dep.object_type)
+        ref_target = _mapped_target(ref_key, dep.referenced_type)
 
         if dep_target is None:
             skipped.append(DependencyIssue(
                 dependent=dep_key,
-                dependent_type=dep.object_type.upper(),
+                dependent_type=dep.object_type,
                 referenced=ref_key,
-                referenced_type=dep.referenced_type.upper(),
+                referenced_type=dep.referenced_type,
                 reason="源对象未纳入受管范围或缺少 remap 规则，无法建立依赖。"
             ))
             continue
         if ref_target is None:
             skipped.append(DependencyIssue(
                 dependent=dep_key,
-                dependent_type=dep.object_type.upper(),
+                dependent_type=dep.object_type,
                 referenced=ref_key,
-                referenced_type=dep.referenced_type.upper(),
+                referenced_type=dep.referenced_type,
                 reason="被依赖对象未纳入受管范围或缺少 remap 规则，无法建立依赖。"
             ))
             continue
 
-        expected.add((
-            dep_target.upper(),
-            dep.object_type.upper(),
-            ref_target.upper(),
-            dep.referenced_type.upper()
-        ))
+        expected.add((dep_target, dep.object_type, ref_target, dep.referenced_type))
 
     return expected, skipped
 
@@ -2344,8 +2820,11 @@ def check_dependencies_against_ob(
         "skipped": skipped
     }
 
+    # 依赖元组中的类型与 objects_by_type 的键均已大写：直接查字典，缺失类型复用共享的空集合
+    objects_by_type = ob_meta.objects_by_type
+
     def object_exists(full_name: str, obj_type: str) -> bool:
-        return full_name in ob_meta.objects_by_type.get(obj_type.upper(), set())
+        return full_name in objects_by_type.get(obj_type, EMPTY_FROZENSET)
 
     def build_missing_reason(dep_name: str, dep_type: str, ref_name: str, ref_type: str) -> str:
         dep_obj = f"{dep_name} ({dep_type})"
@@ -2492,28 +2971,26 @@ def check_primary_objects(
 
     log.info("--- 开始执行主对象批量验证 (TABLE/VIEW/PROC/FUNC/PACKAGE/PACKAGE BODY/SYNONYM) ---")
 
-    allowed_types = enabled_primary_types or set(PRIMARY_OBJECT_TYPES)
+    allowed_types = enabled_primary_types or PRIMARY_OBJECT_TYPE_SET
 
     total = len(master_list)
+    debug_enabled = log.isEnabledFor(logging.DEBUG)
     expected_targets: Dict[str, Set[str]] = defaultdict(set)
     for i, (src_name, tgt_name, obj_type) in enumerate(master_list):
 
         if (i + 1) % 100 == 0:
-            log.info(f"  主对象校验进度: {i+1} / {total} ...")
+            log.info("  主对象校验进度: %d / %d ...", i + 1, total)
 
         obj_type_u = obj_type.upper()
-        try:
-            src_schema, src_obj = src_name.split('.')
-            tgt_schema, tgt_obj = tgt_name.split('.')
-        except ValueError:
-            log.warning(f"  [跳过] 对象名格式不正确: src='{src_name}', tgt='{tgt_name}'")
+        src_parts = split_object_name(src_name)
+        tgt_parts = split_object_name(tgt_name)
+        if src_parts is None or tgt_parts is None:
+            log.warning("  [跳过] 对象名格式不正确: src='%s', tgt='%s'", src_name, tgt_name)
             continue
 
-        src_schema_u = src_schema.upper()
-        src_obj_u = src_obj.upper()
-        tgt_schema_u = tgt_schema.upper()
-        tgt_obj_u = tgt_obj.upper()
-        full_tgt = f"{tgt_schema_u}.{tgt_obj_u}"
+        src_schema_u, src_obj_u = src_parts
+        tgt_schema_u, tgt_obj_u = tgt_parts
+        full_tgt = tgt_name
         expected_targets[obj_type_u].add(full_tgt)
 
         if obj_type_u not in allowed_types:
@@ -2521,8 +2998,7 @@ def check_primary_objects(
 
         if obj_type_u == 'TABLE':
             # 1) OB 是否存在 TABLE
-            ob_tables = ob_meta.objects_by_type.get('TABLE', set())
-            if full_tgt not in ob_tables:
+            if tgt_obj_u not in ob_meta.tables_by_owner.get(tgt_schema_u, EMPTY_FROZENSET):
                 results['missing'].append(('TABLE', full_tgt, src_name))
                 continue
 
@@ -2540,23 +3016,21 @@ def check_primary_objects(
                 ))
                 continue
 
-            src_col_names = {
-                col for col, meta in src_cols_details.items()
-                if not is_ignored_oms_column(col, meta)
-            }
-            tgt_col_names = {
-                col for col, meta in tgt_cols_details.items()
-                if not is_ignored_oms_column(col, meta)
-            }
+            # OMS_* 忽略名单已在两端 DBA_TAB_COLUMNS 查询中过滤；
+            # 直接对 dict 的 keys 视图做集合运算（C 层哈希探测），无需先复制成 set
+            src_col_names = src_cols_details.keys()
+            tgt_col_names = tgt_cols_details.keys()
 
             missing_in_tgt = src_col_names - tgt_col_names
             extra_in_tgt = tgt_col_names - src_col_names
             length_mismatches: List[ColumnLengthIssue] = []
 
-            # 显式提示被忽略名单外的 OMS_* 列属于“多余列”
-            extra_oms = {c for c in extra_in_tgt if c.upper().startswith("OMS_")}
-            if extra_oms:
-                log.debug("表 %s 发现额外 OMS_* 列: %s", full_tgt, sorted(extra_oms))
+            # 显式提示被忽略名单外的 OMS_* 列属于“多余列”；列名在转储时已统一大写，
+            # 直接切片比较前缀，且仅在 DEBUG 日志开启且确有多余列时才扫描
+            if extra_in_tgt and debug_enabled:
+                extra_oms = {c for c in extra_in_tgt if c[:4] == "OMS_"}
+                if extra_oms:
+                    log.debug("表 %s 发现额外 OMS_* 列: %s", full_tgt, sorted(extra_oms))
 
             # 检查公共列的长度
             common_cols = src_col_names & tgt_col_names
@@ -2568,7 +3042,8 @@ def check_primary_objects(
 
                 if src_dtype in ('VARCHAR2', 'VARCHAR'):
                     src_len = src_info.get("char_length") or src_info.get("data_length")
-                    tgt_len = tgt_info.get("char_length") or tgt_info.get("data_length")
+                    # 目标端长度为 0 或缺失时视为无法比较
+                    tgt_len = tgt_info.char_length or None
 
                     try:
                         src_len_int = int(src_len)
@@ -2599,7 +3074,7 @@ def check_primary_objects(
                 ))
 
         elif obj_type_u in PRIMARY_EXISTENCE_ONLY_TYPES:
-            ob_set = ob_meta.objects_by_type.get(obj_type_u, set())
+            ob_set = ob_meta.objects_by_type.get(obj_type_u, EMPTY_FROZENSET)
             if full_tgt in ob_set:
                 results['ok'].append((obj_type_u, full_tgt))
             else:
@@ -2611,7 +3086,7 @@ def check_primary_objects(
 
     # 记录目标端多出的对象（任何受管类型）
     for obj_type in sorted(allowed_types):
-        actual = ob_meta.objects_by_type.get(obj_type, set())
+        actual = ob_meta.objects_by_type.get(obj_type, EMPTY_FROZENSET)
         expected = expected_targets.get(obj_type, set())
         extras = sorted(actual - expected)
         for tgt in extras:
@@ -2630,39 +3105,33 @@ def compare_indexes_for_table(
     tgt_schema: str,
     tgt_table: str
 ) -> Tuple[bool, Optional[IndexMismatch]]:
-    src_key = (src_schema.upper(), src_table.upper())
+    # 各 compare_*_for_table 的 schema/表名来自 master_list，已统一大写并 intern，可直接作为元数据键
+    src_key = (src_schema, src_table)
     src_idx = oracle_meta.indexes.get(src_key)
-    tgt_key = (tgt_schema.upper(), tgt_table.upper())
+    tgt_key = (tgt_schema, tgt_table)
     tgt_idx = ob_meta.indexes.get(tgt_key, {})
 
     if src_idx is None:
-        extra_indexes = set(tgt_idx.keys())
+        extra_indexes = tuple(sorted(tgt_idx.keys()))
         detail = (
             "无法比较：源端 Oracle 未提供该表的索引元数据 (DBA_INDEXES/DBA_IND_COLUMNS dump 为空)。"
         )
         if extra_indexes:
-            detail += f" 目标端当前索引：{', '.join(sorted(extra_indexes))}。"
+            detail += f" 目标端当前索引：{', '.join(extra_indexes)}。"
         return False, IndexMismatch(
             table=f"{tgt_schema}.{tgt_table}",
-            missing_indexes=set(),
+            missing_indexes=(),
             extra_indexes=extra_indexes,
             detail_mismatch=[detail]
         )
 
-    tgt_constraints = ob_meta.constraints.get(tgt_key, {})
-    constraint_index_cols: Set[Tuple[str, ...]] = {
-        normalize_column_sequence(cons.get("columns"))
-        for cons in tgt_constraints.values()
-        if (cons.get("type") or "").upper() in ("P", "U")
-    }
-
-    def build_index_map(entries: Dict[str, Dict]) -> Dict[Tuple[str, ...], Dict[str, Set[str]]]:
+    def build_index_map(entries: Dict[str, IndexInfo]) -> Dict[Tuple[str, ...], Dict[str, Set[str]]]:
         result: Dict[Tuple[str, ...], Dict[str, Set[str]]] = {}
         for name, info in entries.items():
-            cols = normalize_column_sequence(info.get("columns"))
+            cols = normalize_column_sequence(info.columns)
             if not cols:
                 continue
-            uniq = (info.get("uniqueness") or "").upper()
+            uniq = info.uniqueness
             bucket = result.setdefault(cols, {"names": set(), "uniq": set()})
             bucket["names"].add(name)
             bucket["uniq"].add(uniq)
@@ -2675,12 +3144,12 @@ def compare_indexes_for_table(
         names = entry_map.get(cols, {}).get("names") or []
         return next(iter(names), f"{cols}")
 
-    missing_cols = set(src_map.keys()) - set(tgt_map.keys())
-    extra_cols = set(tgt_map.keys()) - set(src_map.keys())
+    missing_cols = src_map.keys() - tgt_map.keys()
+    extra_cols = tgt_map.keys() - src_map.keys()
 
     detail_mismatch: List[str] = []
 
-    for cols in set(src_map.keys()) & set(tgt_map.keys()):
+    for cols in src_map.keys() & tgt_map.keys():
         src_uniq = src_map[cols]["uniq"]
         tgt_uniq = tgt_map[cols]["uniq"]
         if src_uniq != tgt_uniq:
@@ -2689,11 +3158,17 @@ def compare_indexes_for_table(
             )
 
     filtered_missing_cols: Set[Tuple[str, ...]] = set()
-    for cols in missing_cols:
-        # 如果已有 PK/UK 约束覆盖了同一列集，则视为已有唯一性支持，不再要求单独索引
-        if cols in constraint_index_cols:
-            continue
-        filtered_missing_cols.add(cols)
+    if missing_cols:
+        # 如果已有 PK/UK 约束覆盖了同一列集，则视为已有唯一性支持，不再要求单独索引；
+        # 该列集仅在存在缺失索引时才需要，索引一致的表（绝大多数）不再构建
+        constraint_index_cols: Set[Tuple[str, ...]] = {
+            normalize_column_sequence(cons.columns)
+            for cons in ob_meta.constraints.get(tgt_key, {}).values()
+            if cons.type in ("P", "U")
+        }
+        for cols in missing_cols:
+            if cols not in constraint_index_cols:
+                filtered_missing_cols.add(cols)
 
     missing = {rep_name(src_map, cols) for cols in filtered_missing_cols}
     extra = {rep_name(tgt_map, cols) for cols in extra_cols}
@@ -2714,8 +3189,8 @@ def compare_indexes_for_table(
     else:
         return False, IndexMismatch(
             table=f"{tgt_schema}.{tgt_table}",
-            missing_indexes=missing,
-            extra_indexes=extra,
+            missing_indexes=tuple(sorted(missing)),
+            extra_indexes=tuple(sorted(extra)),
             detail_mismatch=detail_mismatch
         )
 
@@ -2728,21 +3203,21 @@ def compare_constraints_for_table(
     tgt_schema: str,
     tgt_table: str
 ) -> Tuple[bool, Optional[ConstraintMismatch]]:
-    src_key = (src_schema.upper(), src_table.upper())
+    src_key = (src_schema, src_table)
     src_cons = oracle_meta.constraints.get(src_key)
-    tgt_key = (tgt_schema.upper(), tgt_table.upper())
+    tgt_key = (tgt_schema, tgt_table)
     tgt_cons = ob_meta.constraints.get(tgt_key, {})
 
     if src_cons is None:
-        extra_cons = {name for name in tgt_cons.keys() if "_OMS_ROWID" not in (name or "")}
+        extra_cons = tuple(sorted(name for name in tgt_cons.keys() if "_OMS_ROWID" not in (name or "")))
         detail = (
             "无法比较：源端 Oracle 未提供该表的约束元数据 (DBA_CONSTRAINTS/DBA_CONS_COLUMNS dump 为空)。"
         )
         if extra_cons:
-            detail += f" 目标端当前约束：{', '.join(sorted(extra_cons))}。"
+            detail += f" 目标端当前约束：{', '.join(extra_cons)}。"
         return False, ConstraintMismatch(
             table=f"{tgt_schema}.{tgt_table}",
-            missing_constraints=set(),
+            missing_constraints=(),
             extra_constraints=extra_cons,
             detail_mismatch=[detail]
         )
@@ -2751,18 +3226,16 @@ def compare_constraints_for_table(
     missing: Set[str] = set()
     extra: Set[str] = set()
 
-    source_all_cols: Set[Tuple[str, ...]] = {
-        normalize_column_sequence(cons.get("columns"))
-        for cons in src_cons.values()
-    }
+    # 源端全部约束的列集只用于过滤目标端多余约束，首次遇到未匹配的目标约束时才构建
+    source_all_cols: Optional[Set[Tuple[str, ...]]] = None
 
-    def bucket_constraints(cons_dict: Dict[str, Dict]) -> Dict[str, List[Tuple[Tuple[str, ...], str]]]:
+    def bucket_constraints(cons_dict: Dict[str, ConstraintInfo]) -> Dict[str, List[Tuple[Tuple[str, ...], str]]]:
         buckets: Dict[str, List[Tuple[Tuple[str, ...], str]]] = {'P': [], 'U': [], 'R': []}
         for name, cons in cons_dict.items():
-            ctype = (cons.get("type") or "").upper()
+            ctype = cons.type
             if ctype not in buckets:
                 continue
-            cols = normalize_column_sequence(cons.get("columns"))
+            cols = normalize_column_sequence(cons.columns)
             buckets[ctype].append((cols, name))
         return buckets
 
@@ -2770,34 +3243,40 @@ def compare_constraints_for_table(
     grouped_tgt = bucket_constraints(tgt_cons)
 
     def match_constraints(label: str, src_list: List[Tuple[Tuple[str, ...], str]], tgt_list: List[Tuple[Tuple[str, ...], str]]):
-        tgt_used = [False] * len(tgt_list)
+        # 目标约束按列序列分桶（桶内保持原顺序），源约束逐个取桶头匹配，避免 O(N*M) 双重循环
+        tgt_by_cols: Dict[Tuple[str, ...], deque] = defaultdict(deque)
+        for idx, (t_cols, _) in enumerate(tgt_list):
+            tgt_by_cols[t_cols].append(idx)
         for cols, name in src_list:
-            found_idx = None
-            for idx, (t_cols, t_name) in enumerate(tgt_list):
-                if tgt_used[idx]:
-                    continue
-                if cols == t_cols:
-                    found_idx = idx
-                    tgt_used[idx] = True
-                    break
-            if found_idx is None:
+            bucket = tgt_by_cols.get(cols)
+            if bucket:
+                bucket.popleft()
+            else:
                 missing.add(name)
                 detail_mismatch.append(
                     f"{label}: 源约束 {name} (列 {list(cols)}) 在目标端未找到。"
                 )
-        for idx, used in enumerate(tgt_used):
-            if not used:
-                extra_name = tgt_list[idx][1]
-                extra_cols = tgt_list[idx][0]
-                if extra_cols in source_all_cols:
-                    continue
-                # 跳过迁移工具生成的 OMS_ROWID 辅助约束
-                if "_OMS_ROWID" in (extra_name or ""):
-                    continue
-                extra.add(extra_name)
-                detail_mismatch.append(
-                    f"{label}: 目标端存在额外约束 {extra_name} (列 {list(extra_cols)})。"
-                )
+        # 桶中剩余的下标即未被匹配的目标约束；按原顺序输出，保持明细稳定
+        leftover = sorted(idx for bucket in tgt_by_cols.values() for idx in bucket)
+        if not leftover:
+            return
+        nonlocal source_all_cols
+        if source_all_cols is None:
+            source_all_cols = {
+                normalize_column_sequence(cons.columns)
+                for cons in src_cons.values()
+            }
+        for idx in leftover:
+            extra_cols, extra_name = tgt_list[idx]
+            if extra_cols in source_all_cols:
+                continue
+            # 跳过迁移工具生成的 OMS_ROWID 辅助约束
+            if "_OMS_ROWID" in (extra_name or ""):
+                continue
+            extra.add(extra_name)
+            detail_mismatch.append(
+                f"{label}: 目标端存在额外约束 {extra_name} (列 {list(extra_cols)})。"
+            )
 
     match_constraints("PRIMARY KEY", grouped_src.get('P', []), grouped_tgt.get('P', []))
     match_constraints("UNIQUE KEY", grouped_src.get('U', []), grouped_tgt.get('U', []))
@@ -2809,57 +3288,12 @@ def compare_constraints_for_table(
     else:
         return False, ConstraintMismatch(
             table=f"{tgt_schema}.{tgt_table}",
-            missing_constraints=missing,
-            extra_constraints=extra,
+            missing_constraints=tuple(sorted(missing)),
+            extra_constraints=tuple(sorted(extra)),
             detail_mismatch=detail_mismatch
         )
 
 
-def compare_sequences_for_schema(
-    oracle_meta: OracleMetadata,
-    ob_meta: ObMetadata,
-    src_schema: str,
-    tgt_schema: str
-) -> Tuple[bool, Optional[SequenceMismatch]]:
-    src_seqs = oracle_meta.sequences.get(src_schema.upper())
-    if src_seqs is None:
-        log.warning(f"[序列检查] 未找到 {src_schema} 的 Oracle 序列元数据。")
-        tgt_seqs_snapshot = ob_meta.sequences.get(tgt_schema.upper(), set())
-        note = (
-            f"Oracle 用户已成功查询，但在 schema {src_schema} 的 DBA_SEQUENCES 未返回任何记录，请检查该 schema 是否确实存在序列。"
-        )
-        if tgt_seqs_snapshot:
-            note += f" 目标端现有序列：{', '.join(sorted(tgt_seqs_snapshot))}。"
-        return False, SequenceMismatch(
-            src_schema=src_schema,
-            tgt_schema=tgt_schema,
-            missing_sequences=set(),
-            extra_sequences=tgt_seqs_snapshot,
-            note=note,
-            missing_mappings=[]
-        )
-
-    tgt_seqs = ob_meta.sequences.get(tgt_schema.upper(), set())
-
-    missing = src_seqs - tgt_seqs
-    extra = tgt_seqs - src_seqs
-    all_good = (not missing) and (not extra)
-    if all_good:
-        return True, None
-    else:
-        return False, SequenceMismatch(
-            src_schema=src_schema,
-            tgt_schema=tgt_schema,
-            missing_sequences=missing,
-            extra_sequences=extra,
-            note=None,
-            missing_mappings=[
-                (f"{src_schema.upper()}.{seq}", f"{tgt_schema.upper()}.{seq}")
-                for seq in sorted(missing)
-            ]
-        )
-
-
 def compare_triggers_for_table(
     oracle_meta: OracleMetadata,
     ob_meta: ObMetadata,
@@ -2869,62 +3303,54 @@ def compare_triggers_for_table(
     tgt_table: str,
     full_object_mapping: FullObjectMapping
 ) -> Tuple[bool, Optional[TriggerMismatch]]:
-    src_key = (src_schema.upper(), src_table.upper())
+    src_key = (src_schema, src_table)
     src_trg = oracle_meta.triggers.get(src_key)
     if not src_trg:
         # 源端未记录任何触发器，视为无需校验，避免把“缺元数据”计入差异
         return False, None
 
-    tgt_key = (tgt_schema.upper(), tgt_table.upper())
+    tgt_key = (tgt_schema, tgt_table)
     tgt_trg = ob_meta.triggers.get(tgt_key, {})
 
     src_names_raw = set(src_trg.keys())
     tgt_names = set(tgt_trg.keys())
 
     src_names: Set[str] = set()
-    missing_mapping_lookup: Dict[str, str] = {}
+    # 目标触发器名 -> 源触发器名 的反向索引，与正向映射在同一循环中建立
+    source_by_target: Dict[str, str] = {}
     for name in src_names_raw:
-        full = f"{src_schema.upper()}.{name.upper()}"
+        full = f"{src_schema}.{name}"
         mapped = get_mapped_target(full_object_mapping, full, 'TRIGGER')
         if mapped and '.' in mapped:
-            _, tgt_name = mapped.split('.', 1)
-            tgt_name_u = tgt_name.upper()
+            _, tgt_name_u = mapped.split('.', 1)
         else:
-            tgt_name_u = name.upper()
+            tgt_name_u = name
             ensure_mapping_entry(
                 full_object_mapping,
                 full,
                 'TRIGGER',
-                f"{tgt_schema.upper()}.{tgt_name_u}"
+                f"{tgt_schema}.{tgt_name_u}"
             )
         src_names.add(tgt_name_u)
-        missing_mapping_lookup[tgt_name_u] = name.upper()
+        source_by_target[tgt_name_u] = name
 
-    missing = src_names - tgt_names
-    extra = tgt_names - src_names
+    missing = tuple(sorted(src_names - tgt_names))
+    extra = tuple(sorted(tgt_names - src_names))
     detail_mismatch: List[str] = []
     missing_mappings: List[Tuple[str, str]] = []
 
-    for tgt_name in sorted(missing):
-        src_name = missing_mapping_lookup.get(tgt_name, tgt_name)
+    for tgt_name in missing:
+        src_name = source_by_target.get(tgt_name, tgt_name)
         missing_mappings.append(
             (
-                f"{src_schema.upper()}.{src_name}",
-                f"{tgt_schema.upper()}.{tgt_name}"
+                f"{src_schema}.{src_name}",
+                f"{tgt_schema}.{tgt_name}"
             )
         )
 
     common = src_names & tgt_names
     for name in common:
-        mapped_source = find_source_by_target(
-            full_object_mapping,
-            f"{tgt_schema.upper()}.{name}",
-            'TRIGGER'
-        )
-        src_info_name = name
-        if mapped_source and '.' in mapped_source:
-            _, src_info_name = mapped_source.split('.', 1)
-        s = src_trg.get(src_info_name) or {}
+        s = src_trg.get(source_by_target[name]) or {}
         t = tgt_trg[name]
         if (s["event"] or "").strip() != (t.get("event") or "").strip():
             detail_mismatch.append(
@@ -2948,6 +3374,68 @@ def compare_triggers_for_table(
         )
 
 
+# (TGT_NAME, 索引结果, 约束结果, 触发器结果)；未启用的检查项为 None
+ExtraTableResult = Tuple[
+    str,
+    Optional[Tuple[bool, Optional[IndexMismatch]]],
+    Optional[Tuple[bool, Optional[ConstraintMismatch]]],
+    Optional[Tuple[bool, Optional[TriggerMismatch]]]
+]
+
+# 多进程扩展校验时由父进程在 fork 前设置，子进程只读
+_EXTRA_CHECK_STATE: Optional[Tuple[OracleMetadata, ObMetadata, FullObjectMapping, Set[str]]] = None
+
+
+def compare_extra_objects_for_table(
+    oracle_meta: OracleMetadata,
+    ob_meta: ObMetadata,
+    full_object_mapping: FullObjectMapping,
+    table_types: Set[str],
+    src_name: str,
+    tgt_name: str
+) -> Optional[ExtraTableResult]:
+    """对单张表执行已启用的索引/约束/触发器比对；表名格式不合法时返回 None。"""
+    src_parts = split_object_name(src_name)
+    tgt_parts = split_object_name(tgt_name)
+    if src_parts is None or tgt_parts is None:
+        return None
+    src_schema, src_table = src_parts
+    tgt_schema, tgt_table = tgt_parts
+
+    idx_res = cons_res = trg_res = None
+    if 'INDEX' in table_types:
+        idx_res = compare_indexes_for_table(
+            oracle_meta, ob_meta,
+            src_schema, src_table,
+            tgt_schema, tgt_table
+        )
+    if 'CONSTRAINT' in table_types:
+        cons_res = compare_constraints_for_table(
+            oracle_meta, ob_meta,
+            src_schema, src_table,
+            tgt_schema, tgt_table
+        )
+    if 'TRIGGER' in table_types:
+        trg_res = compare_triggers_for_table(
+            oracle_meta, ob_meta,
+            src_schema, src_table,
+            tgt_schema, tgt_table,
+            full_object_mapping
+        )
+    return tgt_name, idx_res, cons_res, trg_res
+
+
+def _compare_extra_table_chunk(pairs: List[Tuple[str, str]]) -> List[Optional[ExtraTableResult]]:
+    """子进程入口：使用继承自父进程的 _EXTRA_CHECK_STATE 比对一批表，结果与 pairs 一一对应。"""
+    oracle_meta, ob_meta, full_object_mapping, table_types = _EXTRA_CHECK_STATE
+    return [
+        compare_extra_objects_for_table(
+            oracle_meta, ob_meta, full_object_mapping, table_types, src_name, tgt_name
+        )
+        for src_name, tgt_name in pairs
+    ]
+
+
 def check_extra_objects(
     settings: Dict,
     master_list: MasterCheckList,
@@ -2987,59 +3475,85 @@ def check_extra_objects(
     log.info("--- 开始执行扩展对象校验 (索引/约束/序列/触发器) ---")
 
     # 1) 针对每个 TABLE 做索引/约束/触发器校验
-    total_tables = sum(1 for _, _, t in master_list if t.upper() == 'TABLE')
+    table_pairs: List[Tuple[str, str]] = [
+        (src_name, tgt_name)
+        for src_name, tgt_name, obj_type in master_list
+        if obj_type.upper() == 'TABLE'
+    ]
+    total_tables = len(table_pairs)
     done_tables = 0
 
-    for src_name, tgt_name, obj_type in master_list:
-        if obj_type.upper() != 'TABLE':
-            continue
-
-        done_tables += 1
-        if done_tables % 100 == 0:
-            log.info(f"  扩展校验 (索引/约束/触发器) 进度: {done_tables} / {total_tables} ...")
-
+    def _collect(table_results: List[ExtraTableResult], processed: int) -> None:
+        nonlocal done_tables
+        for tgt_name, idx_res, cons_res, trg_res in table_results:
+            if idx_res is not None:
+                ok_idx, idx_mis = idx_res
+                if ok_idx:
+                    extra_results["index_ok"].append(tgt_name)
+                elif idx_mis:
+                    extra_results["index_mismatched"].append(idx_mis)
+            if cons_res is not None:
+                ok_cons, cons_mis = cons_res
+                if ok_cons:
+                    extra_results["constraint_ok"].append(tgt_name)
+                elif cons_mis:
+                    extra_results["constraint_mismatched"].append(cons_mis)
+            if trg_res is not None:
+                ok_trg, trg_mis = trg_res
+                if ok_trg:
+                    extra_results["trigger_ok"].append(tgt_name)
+                elif trg_mis:
+                    extra_results["trigger_mismatched"].append(trg_mis)
+        prev = done_tables
+        done_tables += processed
+        if done_tables // 100 != prev // 100:
+            log.info("  扩展校验 (索引/约束/触发器) 进度: %d / %d ...", done_tables, total_tables)
+
+    workers = settings.get('extra_check_workers', 1) or (os.cpu_count() or 1)
+    table_types = enabled_types & {'INDEX', 'CONSTRAINT', 'TRIGGER'}
+    # 触发器比对会把缺省映射回写 full_object_mapping（子进程的修改无法带回），始终在父进程执行
+    process_types = table_types - {'TRIGGER'}
+    use_processes = (
+        process_types
+        and workers > 1
+        and total_tables >= EXTRA_CHECK_PARALLEL_MIN_TABLES
+        and 'fork' in multiprocessing.get_all_start_methods()
+    )
+    if use_processes:
+        # 各表比对只读元数据、互不依赖：fork 出的子进程直接继承（写时复制）全局状态，
+        # 只需传递表名分片，结果按提交顺序取回，与串行输出一致
+        global _EXTRA_CHECK_STATE
+        _EXTRA_CHECK_STATE = (oracle_meta, ob_meta, full_object_mapping, process_types)
+        log.info("扩展校验使用 %d 个进程并行比对 %d 张表。", workers, total_tables)
+        chunks = chunk_list(table_pairs, EXTRA_CHECK_CHUNK_SIZE)
+        # 把现有对象移入永久代，避免子进程里的 GC 扫描改写对象头，把继承的元数据页逐页复制
+        gc.freeze()
         try:
-            src_schema, src_table = src_name.split('.')
-            tgt_schema, tgt_table = tgt_name.split('.')
-        except ValueError:
-            continue
-
-        # 索引
-        if 'INDEX' in enabled_types:
-            ok_idx, idx_mis = compare_indexes_for_table(
-                oracle_meta, ob_meta,
-                src_schema, src_table,
-                tgt_schema, tgt_table
-            )
-            if ok_idx:
-                extra_results["index_ok"].append(tgt_name)
-            elif idx_mis:
-                extra_results["index_mismatched"].append(idx_mis)
-
-        # 约束
-        if 'CONSTRAINT' in enabled_types:
-            ok_cons, cons_mis = compare_constraints_for_table(
-                oracle_meta, ob_meta,
-                src_schema, src_table,
-                tgt_schema, tgt_table
-            )
-            if ok_cons:
-                extra_results["constraint_ok"].append(tgt_name)
-            elif cons_mis:
-                extra_results["constraint_mismatched"].append(cons_mis)
-
-        # 触发器
-        if 'TRIGGER' in enabled_types:
-            ok_trg, trg_mis = compare_triggers_for_table(
-                oracle_meta, ob_meta,
-                src_schema, src_table,
-                tgt_schema, tgt_table,
-                full_object_mapping
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('fork')
+            ) as executor:
+                for chunk, chunk_results in zip(chunks, executor.map(_compare_extra_table_chunk, chunks)):
+                    table_results: List[ExtraTableResult] = []
+                    for (src_name, tgt_name), result in zip(chunk, chunk_results):
+                        if result is None:
+                            continue
+                        if 'TRIGGER' in table_types:
+                            trg_result = compare_extra_objects_for_table(
+                                oracle_meta, ob_meta, full_object_mapping, {'TRIGGER'}, src_name, tgt_name
+                            )
+                            result = result[:3] + trg_result[3:]
+                        table_results.append(result)
+                    _collect(table_results, len(chunk))
+        finally:
+            _EXTRA_CHECK_STATE = None
+            gc.unfreeze()
+    elif table_types:
+        for src_name, tgt_name in table_pairs:
+            result = compare_extra_objects_for_table(
+                oracle_meta, ob_meta, full_object_mapping, table_types, src_name, tgt_name
             )
-            if ok_trg:
-                extra_results["trigger_ok"].append(tgt_name)
-            elif trg_mis:
-                extra_results["trigger_mismatched"].append(trg_mis)
+            _collect([result] if result else [], 1)
 
     # 2) 序列校验（考虑 remap 后的目标 schema）
     sequence_groups: Dict[Tuple[str, str], List[Tuple[str, str]]] = defaultdict(list)
@@ -3061,14 +3575,19 @@ def check_extra_objects(
                 sequence_groups[(src_schema_u, tgt_schema_u)].append((seq_name_u, tgt_name_u))
 
         for (src_schema_u, tgt_schema_u), entries in sequence_groups.items():
-            expected_tgt_names = {tgt_name for _, tgt_name in entries}
-            actual_tgt_names = {name.upper() for name in ob_meta.sequences.get(tgt_schema_u, set())}
-
-            missing_src = {
-                src_name for src_name, tgt_name in entries
-                if tgt_name not in actual_tgt_names
-            }
-            extra_tgt = actual_tgt_names - expected_tgt_names
+            # OB 序列名在 dump 时已统一大写，直接使用元数据中的集合，无需再复制一份
+            actual_tgt_names = ob_meta.sequences.get(tgt_schema_u, EMPTY_FROZENSET)
+            if actual_tgt_names:
+                missing_entries = [
+                    (src_name, tgt_name) for src_name, tgt_name in entries
+                    if tgt_name not in actual_tgt_names
+                ]
+                extra_tgt = tuple(sorted(actual_tgt_names - {tgt_name for _, tgt_name in entries}))
+            else:
+                # 目标 schema 没有任何序列：全部缺失且无多余，省去逐个成员判断与差集
+                missing_entries = entries
+                extra_tgt = ()
+            missing_src = tuple(sorted({src_name for src_name, _ in missing_entries}))
 
             mapping_label = f"{src_schema_u}->{tgt_schema_u}"
             if not missing_src and not extra_tgt:
@@ -3076,8 +3595,7 @@ def check_extra_objects(
             else:
                 missing_map = [
                     (f"{src_schema_u}.{src_name}", f"{tgt_schema_u}.{tgt_name}")
-                    for src_name, tgt_name in entries
-                    if tgt_name not in actual_tgt_names
+                    for src_name, tgt_name in missing_entries
                 ]
                 extra_results["sequence_mismatched"].append(SequenceMismatch(
                     src_schema=src_schema_u,
@@ -3128,15 +3646,11 @@ def check_comments(
     for src_name, tgt_name, obj_type in master_list:
         if obj_type.upper() != 'TABLE':
             continue
-        try:
-            src_schema, src_table = src_name.split('.')
-            tgt_schema, tgt_table = tgt_name.split('.')
-        except ValueError:
+        src_key = split_object_name(src_name)
+        tgt_key = split_object_name(tgt_name)
+        if src_key is None or tgt_key is None:
             continue
 
-        src_key = (src_schema.upper(), src_table.upper())
-        tgt_key = (tgt_schema.upper(), tgt_table.upper())
-
         src_table_cmt = normalize_comment_text(oracle_meta.table_comments.get(src_key))
         tgt_table_cmt = normalize_comment_text(ob_meta.table_comments.get(tgt_key))
         table_diff = src_table_cmt != tgt_table_cmt
@@ -3283,7 +3797,7 @@ def collect_ob_env_info(ob_cfg: ObConfig) -> Dict[str, str]:
             text=True,
             encoding="utf-8",
             errors="ignore",
-            timeout=OBC_TIMEOUT
+            timeout=ob_cfg.get("timeout", OBC_TIMEOUT)
         )
         if result.returncode == 0:
             info.update(parse_ob_status_output(result.stdout))
@@ -3534,29 +4048,243 @@ def setup_metadata_session(ora_conn):
         with ora_conn.cursor() as cursor:
             cursor.execute(plsql)
     except oracledb.Error as e:
-        log.warning(f"[DDL] 设置 DBMS_METADATA transform 失败: {e}")
+        log.warning("[DDL] 设置 DBMS_METADATA transform 失败: %s", e)
+
+
+DDL_OBJ_TYPE_MAPPING = {
+    'PACKAGE BODY': 'PACKAGE_BODY',
+    'MATERIALIZED VIEW': 'MATERIALIZED_VIEW',
+    'TYPE BODY': 'TYPE_BODY'
+}
+
+
+def _lob_to_str(value) -> Optional[str]:
+    """GET_DDL 返回 CLOB：读取为 str（None 原样返回）。"""
+    if value is None:
+        return None
+    if hasattr(value, 'read'):
+        return value.read()
+    return str(value)
+
+
+def _clob_as_long_handler(cursor, name, default_type, size, precision, scale):
+    """
+    游标级输出类型处理器：CLOB 列按 LONG 字符串随结果集返回，
+    省去每个 LOB 定位符再单独往返读取一次；只作用于设置了该处理器的游标。
+    """
+    if default_type is oracledb.DB_TYPE_CLOB:
+        return cursor.var(oracledb.DB_TYPE_LONG, arraysize=cursor.arraysize)
+    return None
+
+
+def oracle_get_ddl(ora_conn, obj_type: str, owner: str, name: str) -> Optional[str]:
+    sql = "SELECT DBMS_METADATA.GET_DDL(:1, :2, :3) FROM DUAL"
+    obj_type_norm = DDL_OBJ_TYPE_MAPPING.get(obj_type.upper(), obj_type.upper())
+    try:
+        with ora_conn.cursor() as cursor:
+            cursor.outputtypehandler = _clob_as_long_handler
+            cursor.execute(sql, [obj_type_norm, name.upper(), owner.upper()])
+            row = cursor.fetchone()
+            if not row or row[0] is None:
+                return None
+            return _lob_to_str(row[0])
+    except oracledb.Error as e:
+        log.warning("[DDL] 获取 %s %s.%s DDL 失败: %s", obj_type, owner, name, e)
+        return None
+
+
+def _get_ddl_chunk(
+    ora_conn,
+    chunk: List[Tuple[str, str, str]]
+) -> Optional[Dict[Tuple[str, str, str], Optional[str]]]:
+    """
+    用一条 SQL 获取一批对象的 DDL：WITH FUNCTION 包装 GET_DDL 吞掉单个对象的异常（对象不存在时返回 NULL）。
+    数据库不支持 WITH FUNCTION (12c 以下) 等导致整批失败时返回 None。
+    """
+    selects = " UNION ALL ".join(
+        f"SELECT :{i * 3 + 1} T, :{i * 3 + 2} O, :{i * 3 + 3} N FROM DUAL"
+        for i in range(len(chunk))
+    )
+    sql = f"""
+        WITH FUNCTION safe_get_ddl(p_type VARCHAR2, p_name VARCHAR2, p_owner VARCHAR2) RETURN CLOB IS
+        BEGIN
+            RETURN DBMS_METADATA.GET_DDL(p_type, p_name, p_owner);
+        EXCEPTION
+            WHEN OTHERS THEN RETURN NULL;
+        END;
+        SELECT T, O, N, safe_get_ddl(T, N, O) FROM ({selects})
+    """
+    norm_to_key: Dict[Tuple[str, str, str], Tuple[str, str, str]] = {}
+    binds: List[str] = []
+    for key in chunk:
+        obj_type_norm = DDL_OBJ_TYPE_MAPPING.get(key[0], key[0])
+        norm_to_key[(obj_type_norm, key[1], key[2])] = key
+        binds.extend((obj_type_norm, key[1], key[2]))
+    results: Dict[Tuple[str, str, str], Optional[str]] = {}
+    try:
+        with ora_conn.cursor() as cursor:
+            # 整批结果随 execute 一次返回（默认 prefetchrows=2 时还需再 fetch 一轮）
+            cursor.prefetchrows = len(chunk) + 1
+            cursor.arraysize = len(chunk) + 1
+            cursor.outputtypehandler = _clob_as_long_handler
+            cursor.execute(sql, binds)
+            for obj_type_norm, owner, name, ddl in cursor:
+                key = norm_to_key.get((obj_type_norm, owner, name))
+                if key is not None:
+                    results[key] = _lob_to_str(ddl)
+    except oracledb.Error as e:
+        log.info("[DDL] 批量 DBMS_METADATA.GET_DDL 不可用，改为逐个获取: %s", e)
+        return None
+    for key in chunk:
+        results.setdefault(key, None)
+    return results
+
+
+def _get_ddl_one_by_one(
+    ora_conn,
+    chunk: List[Tuple[str, str, str]]
+) -> Dict[Tuple[str, str, str], Optional[str]]:
+    return {
+        (obj_type, owner, name): oracle_get_ddl(ora_conn, obj_type, owner, name)
+        for obj_type, owner, name in chunk
+    }
+
+
+def _metadata_session_callback(ora_conn, requested_tag) -> None:
+    """连接池新建会话时设置 DBMS_METADATA transform（会话级参数，每个会话只需一次）。"""
+    setup_metadata_session(ora_conn)
+
+
+def oracle_get_ddl_batch(
+    ora_conn,
+    requests: List[Tuple[str, str, str]],
+    ora_cfg: Optional[OraConfig] = None,
+    workers: int = 1
+) -> Dict[Tuple[str, str, str], Optional[str]]:
+    """
+    批量获取 DDL：requests 为 [(OBJ_TYPE, OWNER, NAME)]，每 ORACLE_DDL_BATCH_SIZE 个对象一条 SQL，避免逐个往返。
+    首批在 ora_conn 上执行以探测 WITH FUNCTION 是否可用，不可用时退回 oracle_get_ddl 逐个获取。
+    提供 ora_cfg 且 workers > 1 时，其余批次通过会话池并发获取。
+    返回 {(OBJ_TYPE, OWNER, NAME): DDL 或 None}，键均为大写。
+    """
+    results: Dict[Tuple[str, str, str], Optional[str]] = {}
+    keys = list(dict.fromkeys(
+        (obj_type.upper(), owner.upper(), name.upper()) for obj_type, owner, name in requests
+    ))
+    chunks = chunk_list(keys, ORACLE_DDL_BATCH_SIZE)
+    if not chunks:
+        return results
+
+    def fetch_chunk(conn, chunk: List[Tuple[str, str, str]]) -> Dict[Tuple[str, str, str], Optional[str]]:
+        if batch_supported:
+            fetched = _get_ddl_chunk(conn, chunk)
+            if fetched is not None:
+                return fetched
+        return _get_ddl_one_by_one(conn, chunk)
+
+    first = _get_ddl_chunk(ora_conn, chunks[0])
+    batch_supported = first is not None
+    if batch_supported:
+        results.update(first)
+        pending = chunks[1:]
+    else:
+        pending = chunks
+
+    workers = max(1, min(workers, len(pending)))
+    pool = None
+    if ora_cfg is not None and workers > 1:
+        try:
+            pool = oracledb.create_pool(
+                user=ora_cfg['user'],
+                password=ora_cfg['password'],
+                dsn=ora_cfg['dsn'],
+                min=1,
+                max=workers,
+                increment=1,
+                session_callback=_metadata_session_callback
+            )
+        except oracledb.Error as e:
+            log.warning("[DDL] 创建 Oracle 会话池失败，DDL 将串行获取: %s", e)
+
+    if pool is None:
+        for chunk in pending:
+            results.update(fetch_chunk(ora_conn, chunk))
+    else:
+        def run_chunk(chunk: List[Tuple[str, str, str]]) -> Dict[Tuple[str, str, str], Optional[str]]:
+            with pool.acquire() as conn:
+                return fetch_chunk(conn, chunk)
+
+        log.info("[DDL] 使用 %d 个会话并发获取 %d 批 DDL。", workers, len(pending))
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for part in executor.map(run_chunk, pending):
+                    results.update(part)
+        finally:
+            pool.close(force=True)
 
+    return results
 
-DDL_OBJ_TYPE_MAPPING = {
-    'PACKAGE BODY': 'PACKAGE_BODY',
-    'MATERIALIZED VIEW': 'MATERIALIZED_VIEW',
-    'TYPE BODY': 'TYPE_BODY'
-}
 
+# 通用的限定名匹配：单次扫描 DDL，命中后再查替换表，避免每个依赖对象各扫描一遍
+QUOTED_QUALIFIED_NAME_PATTERN = re.compile(r'"([^"]+)"\."([^"]+)"')
+UNQUOTED_QUALIFIED_NAME_PATTERN = re.compile(r'(?<![\w$#])([\w$#]+)\.([\w$#]+)(?![\w$#])')
+BARE_IDENTIFIER_PATTERN = re.compile(r'(?<![\w$#])[\w$#]+(?![\w$#])')
 
-def oracle_get_ddl(ora_conn, obj_type: str, owner: str, name: str) -> Optional[str]:
-    sql = "SELECT DBMS_METADATA.GET_DDL(:1, :2, :3) FROM DUAL"
-    obj_type_norm = DDL_OBJ_TYPE_MAPPING.get(obj_type.upper(), obj_type.upper())
-    try:
-        with ora_conn.cursor() as cursor:
-            cursor.execute(sql, [obj_type_norm, name.upper(), owner.upper()])
-            row = cursor.fetchone()
-            if not row or row[0] is None:
-                return None
-            return str(row[0])
-    except oracledb.Error as e:
-        log.warning(f"[DDL] 获取 {obj_type} {owner}.{name} DDL 失败: {e}")
-        return None
+def build_replacement_lookups(
+    extra_identifiers: List[Tuple[Tuple[str, str], Tuple[str, str]]]
+) -> ReplacementLookups:
+    """
+    由 extra_identifiers 构建两张查找表（同一源对象出现多次时以首个为准）：
+      - (SRC_SCHEMA, SRC_NAME) -> (TGT_SCHEMA, TGT_NAME)，用于限定名替换
+      - SRC_SCHEMA -> {SRC_NAME: 'TGT_SCHEMA.TGT_NAME'}，用于同 schema 内裸名替换（跳过名称未变化的对象）
+    批量调整 DDL 时由调用方构建一次，经 replacement_lookups 参数传给 adjust_ddl_for_object。
+    """
+    qualified: Dict[Tuple[str, str], Tuple[str, str]] = {}
+    bare_by_schema: Dict[str, Dict[str, str]] = defaultdict(dict)
+    for (src_s, src_n), (tgt_s, tgt_n) in extra_identifiers:
+        if not src_n or not tgt_s or not tgt_n:
+            continue
+        src_key = ((src_s or "").upper(), src_n.upper())
+        tgt_pair = (tgt_s.upper(), tgt_n.upper())
+        if src_key[0]:
+            qualified.setdefault(src_key, tgt_pair)
+        if src_key != tgt_pair:
+            bare_by_schema[src_key[0]].setdefault(src_key[1], f"{tgt_pair[0]}.{tgt_pair[1]}")
+    return qualified, dict(bare_by_schema)
+
+
+def _sub_qualified_names(
+    text: str,
+    pattern: re.Pattern,
+    lookup: Dict[Tuple[str, str], Tuple[str, str]],
+    template: str,
+    restart_shift: int,
+    main_key: Optional[Tuple[str, str]] = None,
+    main_target: Optional[Tuple[str, str]] = None
+) -> str:
+    """
+    单次扫描替换限定名。未命中时从第二段（向前回退 restart_shift 个字符）重新匹配，
+    保证 A.SCHEMA.OBJ 这类连续限定名中的 SCHEMA.OBJ 仍能被识别。
+    main_key 为当前处理的主对象，其目标 main_target 优先于 lookup。
+    """
+    pieces: List[str] = []
+    last = pos = 0
+    while True:
+        match = pattern.search(text, pos)
+        if match is None:
+            break
+        key = (match.group(1).upper(), match.group(2).upper())
+        target = main_target if key == main_key else lookup.get(key)
+        if target is None:
+            pos = match.start(2) - restart_shift
+            continue
+        pieces.append(text[last:match.start()])
+        pieces.append(template.format(*target))
+        last = pos = match.end()
+    if not pieces:
+        return text
+    pieces.append(text[last:])
+    return ''.join(pieces)
 
 
 def adjust_ddl_for_object(
@@ -3565,51 +4293,29 @@ def adjust_ddl_for_object(
     src_name: str,
     tgt_schema: str,
     tgt_name: str,
-    extra_identifiers: Optional[List[Tuple[Tuple[str, str], Tuple[str, str]]]] = None
+    extra_identifiers: Optional[List[Tuple[Tuple[str, str], Tuple[str, str]]]] = None,
+    replacement_lookups: Optional[ReplacementLookups] = None
 ) -> str:
     """
     依据 remap 结果调整 DBMS_METADATA 生成的 DDL：
-      - 先替换主对象 (schema+name)
-      - 再按需替换依赖对象 (如索引/触发器引用的表)
+      - 替换主对象 (schema+name) 及依赖对象 (如索引/触发器引用的表) 的限定名
+      - 再补充同 schema 内无前缀引用的 remap
     extra_identifiers: [ ((src_schema, src_name), (tgt_schema, tgt_name)), ... ]
+    replacement_lookups: build_replacement_lookups 预先构建的查找表，提供时优先于 extra_identifiers
     """
 
-    def replace_identifier(text: str, src_s: str, src_n: str, tgt_s: str, tgt_n: str) -> str:
-        if not src_s or not src_n or not tgt_s or not tgt_n:
-            return text
-        src_s_u = src_s.upper()
-        src_n_u = src_n.upper()
-        tgt_s_u = tgt_s.upper()
-        tgt_n_u = tgt_n.upper()
-
-        pattern_quoted = re.compile(
-            rf'"{re.escape(src_s_u)}"\."{re.escape(src_n_u)}"',
-            re.IGNORECASE
-        )
-        pattern_unquoted = re.compile(
-            rf'\b{re.escape(src_s_u)}\.{re.escape(src_n_u)}\b',
-            re.IGNORECASE
-        )
-
-        text = pattern_quoted.sub(f'"{tgt_s_u}"."{tgt_n_u}"', text)
-        text = pattern_unquoted.sub(f'{tgt_s_u}.{tgt_n_u}', text)
-        return text
-
-    def replace_unqualified_identifier(text: str, src_n: str, tgt_s: str, tgt_n: str) -> str:
+    def replace_unqualified_identifiers(text: str, bare_lookup: Dict[str, str], skip_name: str) -> str:
         """
         当源对象在自身 schema 内被 remap 到其他 schema 时，源 DDL 中的无前缀引用
         会错误地落到当前 schema。这里将裸名替换为目标 schema.对象名。
         """
-        if not src_n or not tgt_s or not tgt_n:
-            return text
-        src_n_u = src_n.upper()
-        tgt_s_u = tgt_s.upper()
-        tgt_n_u = tgt_n.upper()
-        tgt_full = f"{tgt_s_u}.{tgt_n_u}"
-
-        pattern = re.compile(rf'\b{re.escape(src_n_u)}\b', re.IGNORECASE)
 
         def _repl(match: re.Match) -> str:
+            word = match.group(0)
+            word_u = word.upper()
+            tgt_full = bare_lookup.get(word_u)
+            if tgt_full is None or word_u == skip_name:
+                return word
             start = match.start()
             # 向前查找首个非空白字符，若为 '.' 则视为已限定 schema，不替换
             idx = start - 1
@@ -3621,40 +4327,45 @@ def adjust_ddl_for_object(
                 while idx >= 0 and text[idx].isspace():
                     idx -= 1
             if idx >= 0 and text[idx] == '.':
-                return match.group(0)
+                return word
             return tgt_full
 
-        return pattern.sub(_repl, text)
-
-    result = replace_identifier(ddl, src_schema, src_name, tgt_schema, tgt_name)
-
-    if extra_identifiers:
-        # 先替换显式 schema.对象，再处理裸名 remap
-        for (src_pair, tgt_pair) in extra_identifiers:
-            result = replace_identifier(
-                result,
-                src_pair[0],
-                src_pair[1],
-                tgt_pair[0],
-                tgt_pair[1]
+        return BARE_IDENTIFIER_PATTERN.sub(_repl, text)
+
+    # 主对象 (schema+name) 与依赖对象的限定名在同一次扫描中替换，主对象的目标优先
+    main_key: Optional[Tuple[str, str]] = None
+    main_target: Optional[Tuple[str, str]] = None
+    if src_schema and src_name and tgt_schema and tgt_name:
+        main_key = (src_schema.upper(), src_name.upper())
+        main_target = (tgt_schema.upper(), tgt_name.upper())
+        if main_key == main_target:
+            main_key = main_target = None
+
+    if replacement_lookups is not None:
+        qualified_lookup, bare_by_schema = replacement_lookups
+    elif extra_identifiers:
+        qualified_lookup, bare_by_schema = build_replacement_lookups(extra_identifiers)
+    else:
+        qualified_lookup, bare_by_schema = {}, {}
+
+    result = ddl
+    if (main_key or qualified_lookup) and '.' in result:
+        if '"' in result:
+            result = _sub_qualified_names(
+                result, QUOTED_QUALIFIED_NAME_PATTERN, qualified_lookup, '"{0}"."{1}"', 1,
+                main_key, main_target
             )
+        result = _sub_qualified_names(
+            result, UNQUOTED_QUALIFIED_NAME_PATTERN, qualified_lookup, '{0}.{1}', 0,
+            main_key, main_target
+        )
+
+    if bare_by_schema:
         # 针对与当前源 schema 相同的对象，补充无前缀引用的 remap (schema 发生变化或对象名变化)
-        src_schema_u = src_schema.upper()
-        for (src_pair, tgt_pair) in extra_identifiers:
-            if src_pair[0].upper() != src_schema_u:
-                continue
-            # If the dependent object is the main object being processed, skip unqualified replacement.
-            # Its name is already handled by the initial `replace_identifier` call.
-            if src_pair[1].upper() == src_name.upper(): # This check prevents the main object's name from being double-qualified.
-                continue
-            if (src_pair[0].upper(), src_pair[1].upper()) == (tgt_pair[0].upper(), tgt_pair[1].upper()):
-                continue
-            result = replace_unqualified_identifier(
-                result,
-                src_pair[1],
-                tgt_pair[0],
-                tgt_pair[1]
-            )
+        # 主对象自身名称已在限定名替换中处理，跳过以免被重复限定
+        bare_lookup = bare_by_schema.get(src_schema.upper())
+        if bare_lookup:
+            result = replace_unqualified_identifiers(result, bare_lookup, src_name.upper())
 
     return result
 
@@ -3668,6 +4379,9 @@ def cleanup_dbcat_wrappers(ddl: str) -> str:
     dbcat 在导出 PL/SQL 时可能使用 DELIMITER/$$ 包裹。
     这些标记在 OceanBase (Oracle 模式) 中无效，需要移除。
     """
+    # 绝大多数 DDL 不含包裹标记，只需做与下方循环一致的换行规整
+    if '$$' not in ddl and 'DELIMITER' not in ddl.upper():
+        return "\n".join(ddl.splitlines())
     lines = []
     for line in ddl.splitlines():
         if DELIMITER_LINE_PATTERN.match(line):
@@ -3693,12 +4407,9 @@ def prepend_set_schema(ddl: str, schema: str) -> str:
     return "\n".join([prefix, ddl])
 
 
-USING_INDEX_PATTERN_WITH_OPTIONS = re.compile(
-    r'USING\s+INDEX\s*\((?:[^)(]+|\((?:[^)(]+|\([^)(]*\))*\))*\)\s*(ENABLE|DISABLE)',
-    re.IGNORECASE
-)
-USING_INDEX_PATTERN_SIMPLE = re.compile(
-    r'USING\s+INDEX\s+(ENABLE|DISABLE)',
+# USING INDEX [(...)] ENABLE|DISABLE：带存储选项与不带选项两种写法合并为一个模式，一次扫描完成
+USING_INDEX_PATTERN = re.compile(
+    r'USING\s+INDEX(?:\s*\((?:[^)(]+|\((?:[^)(]+|\([^)(]*\))*\))*\)\s*|\s+)(ENABLE|DISABLE)',
     re.IGNORECASE
 )
 MV_REFRESH_ON_DEMAND_PATTERN = re.compile(r'\s+ON\s+DEMAND', re.IGNORECASE)
@@ -3710,9 +4421,12 @@ def normalize_ddl_for_ob(ddl: str) -> str:
       - 移除 "USING INDEX ... ENABLE/DISABLE" 之类 Oracle 专有语法
     未来如有更多不兼容语法，可在此扩展。
     """
-    ddl = USING_INDEX_PATTERN_WITH_OPTIONS.sub(lambda m: m.group(1), ddl)
-    ddl = USING_INDEX_PATTERN_SIMPLE.sub(lambda m: m.group(1), ddl)
-    ddl = MV_REFRESH_ON_DEMAND_PATTERN.sub('', ddl)
+    # 两个模式均忽略大小写、无法走字面量快速查找；多数 DDL 不含相关关键字，先做子串预检
+    ddl_upper = ddl.upper()
+    if 'INDEX' in ddl_upper:
+        ddl = USING_INDEX_PATTERN.sub(r'\1', ddl)
+    if 'DEMAND' in ddl_upper:
+        ddl = MV_REFRESH_ON_DEMAND_PATTERN.sub('', ddl)
     return ddl
 
 
@@ -3750,6 +4464,9 @@ ENABLE_NOVALIDATE_PATTERN = re.compile(
 
 
 def strip_constraint_enable(ddl: str) -> str:
+    # 两个模式都以 ENABLE 为锚点，不含该关键字时原样返回
+    if 'ENABLE' not in ddl.upper():
+        return ddl
     ddl = CONSTRAINT_ENABLE_VALIDATE_PATTERN.sub(' VALIDATE', ddl)
     ddl = CONSTRAINT_ENABLE_PATTERN.sub('', ddl)
     return ddl
@@ -3759,6 +4476,9 @@ def strip_enable_novalidate(ddl: str) -> str:
     """
     移除行内的 ENABLE NOVALIDATE 关键字组合，以适配 OB 的 CREATE TABLE。
     """
+    # 不含 NOVALIDATE 时只需去除行尾空白，跳过逐行正则
+    if 'NOVALIDATE' not in ddl.upper():
+        return "\n".join(line.rstrip() for line in ddl.splitlines())
     cleaned_lines: List[str] = []
     for line in ddl.splitlines():
         cleaned = ENABLE_NOVALIDATE_PATTERN.sub('', line)
@@ -3782,26 +4502,44 @@ def split_ddl_statements(ddl: str) -> List[str]:
     return statements
 
 
+@functools.lru_cache(maxsize=None)
+def _word_pattern(word_u: str) -> re.Pattern:
+    """编译并缓存大写文本中的整词匹配模式。"""
+    return re.compile(rf'\b{re.escape(word_u)}\b')
+
+
+def is_create_index_statement(stmt_upper: str) -> bool:
+    return 'CREATE' in stmt_upper and ' INDEX ' in stmt_upper
+
+
+def is_add_constraint_statement(stmt_upper: str) -> bool:
+    return 'ALTER TABLE' in stmt_upper and 'CONSTRAINT' in stmt_upper
+
+
 def extract_statements_for_names(
     ddl: str,
-    names: Set[str],
+    names: Iterable[str],
     predicate: Callable[[str], bool]
 ) -> Dict[str, List[str]]:
     result: Dict[str, List[str]] = {name.upper(): [] for name in names}
     if not ddl:
         return result
 
+    # 名称大写、引号形式与整词模式在语句循环外准备一次
+    name_checks = [
+        (name_u, f'"{name_u}"', _word_pattern(name_u))
+        for name_u in (name.upper() for name in names)
+    ]
     statements = split_ddl_statements(ddl)
     for stmt in statements:
         stmt_upper = stmt.upper()
         if not predicate(stmt_upper):
             continue
-        for name in names:
-            name_u = name.upper()
-            if (
-                f'"{name_u}"' in stmt_upper
-                or re.search(rf'\b{re.escape(name_u)}\b', stmt_upper)
-            ):
+        for name_u, quoted, pattern in name_checks:
+            # 名称子串都不存在时无需再跑正则
+            if name_u not in stmt_upper:
+                continue
+            if quoted in stmt_upper or pattern.search(stmt_upper):
                 result.setdefault(name_u, []).append(stmt.strip())
     return result
 
@@ -3819,83 +4557,103 @@ def write_fixup_file(
     grants_to_add: Optional[List[str]] = None
 ):
     target_dir = base_dir / subdir
-    ensure_dir(target_dir)
     file_path = target_dir / filename
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(f"-- {header_comment}\n")
-        f.write("-- 本文件由校验工具自动生成，请在 OceanBase 执行前仔细审核。\n\n")
-        
-        body = content.strip()
-        f.write(body)
-        f.write('\n')
-        tail = body.rstrip()
-        if tail and not tail.endswith((';', '/')):
-            f.write(';\n')
-
-        if grants_to_add:
-            f.write('\n-- 自动追加相关授权语句\n')
-            for grant_stmt in sorted(grants_to_add):
-                f.write(f"{grant_stmt}\n")
+    body = content.strip()
+    parts: List[str] = [body, '\n']
+    tail = body.rstrip()
+    if tail and not tail.endswith((';', '/')):
+        parts.append(';\n')
+    if grants_to_add:
+        parts.append('\n-- 自动追加相关授权语句\n')
+        parts.extend(f"{grant_stmt}\n" for grant_stmt in sorted(grants_to_add))
+
+    # 整个文件拼好后一次性编码写出，避免逐段 write + 编码
+    payload = (
+        f"-- {header_comment}\n".encode('utf-8')
+        + FIXUP_HEADER_NOTICE
+        + ''.join(parts).encode('utf-8')
+    )
+    # 子目录只在该类脚本第一次写入时创建，其余文件直接打开，省去每个文件的 mkdir/stat
+    try:
+        f = open(file_path, 'wb')
+    except FileNotFoundError:
+        ensure_dir(target_dir)
+        f = open(file_path, 'wb')
+    with f:
+        f.write(payload)
 
-    log.info(f"[FIXUP] 生成修补脚本: {file_path}")
+    log.info("[FIXUP] 生成修补脚本: %s", file_path)
 
 
-def format_oracle_column_type(
-    info: Dict,
-    *,
-    override_length: Optional[int] = None,
-    prefer_ob_varchar: bool = False
-) -> str:
-    """
-    Render an Oracle column definition using available metadata without dropping
-    precision/scale/length/semantics.
-    """
-    raw_dt = (info.get("data_type") or "").strip()
-    dt = raw_dt.upper()
+def _fmt_numeric_type(dt: str, info: Dict, override_length: Optional[int]) -> str:
     prec = info.get("data_precision")
     scale = info.get("data_scale")
-    data_length = info.get("data_length")
-    char_length = info.get("char_length")
-    char_used = (info.get("char_used") or "").strip().upper()
+    if prec is not None:
+        if scale is not None:
+            return f"{dt}({int(prec)},{int(scale)})"
+        return f"{dt}({int(prec)})"
+    if scale is not None:
+        return f"{dt}({int(scale)})"
+    return dt
 
-    def apply_varchar_pref(type_literal: str) -> str:
-        if prefer_ob_varchar and type_literal.startswith("VARCHAR2"):
-            return "VARCHAR" + type_literal[len("VARCHAR2"):]
-        return type_literal
 
-    # If data_type already carries explicit precision/length (e.g., TIMESTAMP(6)), respect it.
-    if '(' in dt and override_length is None:
-        return apply_varchar_pref(dt)
-
-    # Character semantics helper (only for CHAR/VARCHAR2)
-    def _char_suffix(base_type: str) -> str:
-        if base_type not in ("CHAR", "VARCHAR2"):
-            return ""
-        if char_used == "C":
-            return " CHAR"
-        if char_used == "B":
-            return " BYTE"
-        return ""
+def _fmt_float_type(dt: str, info: Dict, override_length: Optional[int]) -> str:
+    prec = info.get("data_precision")
+    if prec is not None:
+        return f"{dt}({int(prec)})"
+    return dt
 
-    # Choose effective length with optional override
-    def _pick_length(default_len: Optional[int]) -> Optional[int]:
-        return override_length if override_length is not None else default_len
 
-    # NUMBER-like
-    if dt in ("NUMBER", "DECIMAL", "NUMERIC"):
-        if prec is not None:
-            if scale is not None:
-                return f"{dt}({int(prec)},{int(scale)})"
-            return f"{dt}({int(prec)})"
-        if scale is not None:
-            return f"{dt}({int(scale)})"
+def _fmt_char_type(dt: str, info: Dict, override_length: Optional[int]) -> str:
+    # CHAR/VARCHAR2 需保留字符/字节语义后缀
+    char_used = (info.get("char_used") or "").strip().upper()
+    char_length = info.get("char_length")
+    ln = override_length
+    if ln is None:
+        ln = char_length if char_used == "C" else (char_length or info.get("data_length"))
+    if ln is None:
         return dt
+    suffix = " CHAR" if char_used == "C" else (" BYTE" if char_used == "B" else "")
+    return f"{dt}({int(ln)}){suffix}"
 
-    # FLOAT
-    if dt == "FLOAT":
-        if prec is not None:
-            return f"{dt}({int(prec)})"
-        return dt
+
+def _fmt_nchar_type(dt: str, info: Dict, override_length: Optional[int]) -> str:
+    # National character types (length is character-based; no CHAR/BYTE suffix)
+    ln = override_length
+    if ln is None:
+        ln = info.get("char_length") or info.get("data_length")
+    if ln is not None:
+        return f"{dt}({int(ln)})"
+    return dt
+
+
+def _fmt_sized_type(dt: str, info: Dict, override_length: Optional[int]) -> str:
+    # Binary/ROWID with length
+    ln = override_length if override_length is not None else info.get("data_length")
+    if ln is not None:
+        return f"{dt}({int(ln)})"
+    return dt
+
+
+# 按精确类型名分派的格式化函数；TIMESTAMP/INTERVAL 等前缀类类型在 format_oracle_column_type 中单独处理
+COLUMN_TYPE_FORMATTERS: Dict[str, Callable[[str, Dict, Optional[int]], str]] = {
+    "NUMBER": _fmt_numeric_type,
+    "DECIMAL": _fmt_numeric_type,
+    "NUMERIC": _fmt_numeric_type,
+    "FLOAT": _fmt_float_type,
+    "CHAR": _fmt_char_type,
+    "VARCHAR2": _fmt_char_type,
+    "NCHAR": _fmt_nchar_type,
+    "NVARCHAR2": _fmt_nchar_type,
+    "RAW": _fmt_sized_type,
+    "VARBINARY": _fmt_sized_type,
+    "UROWID": _fmt_sized_type,
+}
+
+
+def _format_prefixed_column_type(dt: str, info: Dict) -> str:
+    prec = info.get("data_precision")
+    scale = info.get("data_scale")
 
     # TIMESTAMP family
     if dt.startswith("TIMESTAMP"):
@@ -3923,35 +4681,36 @@ def format_oracle_column_type(
             return f"INTERVAL DAY({day_prec}) TO SECOND({frac_prec})"
         return "INTERVAL DAY TO SECOND"
 
-    # Character types
-    if dt in ("CHAR", "VARCHAR2"):
-        ln = _pick_length(char_length if char_used == "C" else (char_length or data_length))
-        if ln is not None:
-            return apply_varchar_pref(f"{dt}({int(ln)}){_char_suffix(dt)}")
-        return apply_varchar_pref(dt)
+    # Fallback
+    return dt
 
-    # National character types (length is character-based; no CHAR/BYTE suffix)
-    if dt in ("NCHAR", "NVARCHAR2"):
-        ln = _pick_length(char_length or data_length)
-        if ln is not None:
-            return f"{dt}({int(ln)})"
-        return dt
 
-    # Binary/ROWID with length
-    if dt in ("RAW", "VARBINARY"):
-        ln = _pick_length(data_length)
-        if ln is not None:
-            return f"{dt}({int(ln)})"
-        return dt
+def format_oracle_column_type(
+    info: Dict,
+    *,
+    override_length: Optional[int] = None,
+    prefer_ob_varchar: bool = False
+) -> str:
+    """
+    Render an Oracle column definition using available metadata without dropping
+    precision/scale/length/semantics.
+    """
+    dt = (info.get("data_type") or "").strip().upper()
 
-    if dt == "UROWID":
-        ln = _pick_length(data_length)
-        if ln is not None:
-            return f"{dt}({int(ln)})"
-        return dt
+    # If data_type already carries explicit precision/length (e.g., TIMESTAMP(6)), respect it.
+    if '(' in dt and override_length is None:
+        rendered = dt
+    else:
+        formatter = COLUMN_TYPE_FORMATTERS.get(dt)
+        if formatter is not None:
+            rendered = formatter(dt, info, override_length)
+        else:
+            rendered = _format_prefixed_column_type(dt, info)
 
-    # Fallback
-    return apply_varchar_pref(dt)
+    # 只有 VARCHAR2 开头的结果才会被替换，对其它类型无影响
+    if prefer_ob_varchar and rendered.startswith("VARCHAR2"):
+        return "VARCHAR" + rendered[len("VARCHAR2"):]
+    return rendered
 
 
 def generate_alter_for_table_columns(
@@ -3975,7 +4734,7 @@ def generate_alter_for_table_columns(
 
     col_details = oracle_meta.table_columns.get((src_schema.upper(), src_table.upper()))
     if col_details is None:
-        log.warning(f"[ALTER] 未找到 {src_schema}.{src_table} 的列元数据，跳过 ALTER 生成。")
+        log.warning("[ALTER] 未找到 %s.%s 的列元数据，跳过 ALTER 生成。", src_schema, src_table)
         return None
 
     lines: List[str] = []
@@ -3985,7 +4744,15 @@ def generate_alter_for_table_columns(
     # 缺失列：ADD
     if missing_cols:
         lines.append(f"-- 源端存在而目标端缺失的列，将通过 ALTER TABLE ADD 补齐：")
-        for col in sorted(missing_cols):
+        # 按源端列定义顺序 (COLUMN_ID) 补列，与 Oracle 物理列序一致（只对缺失列排序，而非字母序）；
+        # 源端元数据中不存在的列（理论上不会出现）放在最后提示
+        ordered_missing = sorted(
+            missing_cols & col_details.keys(),
+            key=lambda c: col_details[c].get("column_id") or 0
+        )
+        if len(ordered_missing) != len(missing_cols):
+            ordered_missing.extend(sorted(missing_cols - col_details.keys()))
+        for col in ordered_missing:
             info = col_details.get(col)
             if not info:
                 lines.append(f"-- WARNING: 源端未找到列 {col} 的详细定义，需手工补充。")
@@ -4086,30 +4853,47 @@ def generate_fixup_scripts(
             child.unlink()
         elif child.is_dir():
             shutil.rmtree(child, ignore_errors=True)
-    log.info(f"[FIXUP] 修补脚本将生成到目录: {base_dir.resolve()}")
+    log.info("[FIXUP] 修补脚本将生成到目录: %s", base_dir.resolve())
 
-    table_map: Dict[str, str] = {
-        tgt_name: src_name
-        for (src_name, tgt_name, obj_type) in master_list
-        if obj_type.upper() == 'TABLE'
-    }
+    # 目标表全名 -> (源 schema, 源表, 目标 schema, 目标表)；master_list 名称已大写，各段直接查表取用
+    table_map: Dict[str, Tuple[str, str, str, str]] = {}
+    for (src_name, tgt_name, obj_type) in master_list:
+        if obj_type.upper() != 'TABLE':
+            continue
+        src_parts = split_object_name(src_name)
+        tgt_parts = split_object_name(tgt_name)
+        if src_parts is not None and tgt_parts is not None:
+            table_map[tgt_name] = src_parts + tgt_parts
+
+    all_replacements: Optional[List[Tuple[Tuple[str, str], Tuple[str, str]]]] = None
+
+    def get_all_replacements() -> List[Tuple[Tuple[str, str], Tuple[str, str]]]:
+        """依赖对象替换表遍历整个 full_object_mapping，仅在确有 DDL 需要调整时构建一次。"""
+        nonlocal all_replacements
+        if all_replacements is None:
+            # 以 (源 schema, 源对象, 目标 schema, 目标对象) 为键插入即去重，dict 保持首次出现的顺序
+            replacement_map: Dict[Tuple[str, str, str, str], Tuple[Tuple[str, str], Tuple[str, str]]] = {}
+            for src_name, type_map in full_object_mapping.items():
+                for tgt_name in type_map.values():
+                    try:
+                        src_schema, src_object = src_name.split('.')
+                        tgt_schema, tgt_object = tgt_name.split('.')
+                    except ValueError:
+                        continue
+                    src_pair = (src_schema.upper(), src_object.upper())
+                    tgt_pair = (tgt_schema.upper(), tgt_object.upper())
+                    replacement_map.setdefault(src_pair + tgt_pair, (src_pair, tgt_pair))
+            all_replacements = list(replacement_map.values())
+        return all_replacements
 
-    object_replacements: List[Tuple[Tuple[str, str], Tuple[str, str]]] = []
-    replacement_set: Set[Tuple[str, str, str, str]] = set()
-    for src_name, type_map in full_object_mapping.items():
-        for tgt_name in type_map.values():
-            try:
-                src_schema, src_object = src_name.split('.')
-                tgt_schema, tgt_object = tgt_name.split('.')
-            except ValueError:
-                continue
-            key = (src_schema.upper(), src_object.upper(), tgt_schema.upper(), tgt_object.upper())
-            if key in replacement_set:
-                continue
-            object_replacements.append(((key[0], key[1]), (key[2], key[3])))
-            replacement_set.add(key)
+    replacement_lookups: Optional[ReplacementLookups] = None
 
-    all_replacements = list(object_replacements)
+    def get_replacement_lookups() -> ReplacementLookups:
+        """替换表对应的查找表同样只构建一次，供各段 adjust_ddl_for_object 共用。"""
+        nonlocal replacement_lookups
+        if replacement_lookups is None:
+            replacement_lookups = build_replacement_lookups(get_all_replacements())
+        return replacement_lookups
 
     obj_type_to_dir = {
         'TABLE': 'table',
@@ -4158,7 +4942,7 @@ def generate_fixup_scripts(
     sequence_tasks: List[Tuple[str, str, str, str]] = []
     for seq_mis in extra_results.get('sequence_mismatched', []):
         src_schema = seq_mis.src_schema.upper()
-        for seq_name in sorted(seq_mis.missing_sequences):
+        for seq_name in seq_mis.missing_sequences:
             seq_name_u = seq_name.upper()
             queue_request(src_schema, 'SEQUENCE', seq_name_u)
             src_full = f"{src_schema}.{seq_name_u}"
@@ -4170,42 +4954,31 @@ def generate_fixup_scripts(
                 tgt_name = seq_name_u
             sequence_tasks.append((src_schema, seq_name_u, tgt_schema, tgt_name))
 
+    # 扩展校验结果的 table 字段统一为 "目标SCHEMA.表名"，直接作为 table_map 的键
     index_tasks: List[Tuple[IndexMismatch, str, str, str, str]] = []
     for item in extra_results.get('index_mismatched', []):
-        table_str = item.table.split()[0]
-        if '.' not in table_str:
+        table_entry = table_map.get(item.table)
+        if table_entry is None:
             continue
-        src_name = table_map.get(table_str)
-        if not src_name or '.' not in src_name:
-            continue
-        src_schema, src_table = src_name.split('.')
-        tgt_schema, tgt_table = table_str.split('.')
+        src_schema, src_table, tgt_schema, tgt_table = table_entry
         queue_request(src_schema, 'TABLE', src_table)
-        index_tasks.append((item, src_schema, src_table, tgt_schema.upper(), tgt_table.upper()))
+        index_tasks.append((item, src_schema, src_table, tgt_schema, tgt_table))
 
     constraint_tasks: List[Tuple[ConstraintMismatch, str, str, str, str]] = []
     for item in extra_results.get('constraint_mismatched', []):
-        table_str = item.table.split()[0]
-        if '.' not in table_str:
-            continue
-        src_name = table_map.get(table_str)
-        if not src_name or '.' not in src_name:
+        table_entry = table_map.get(item.table)
+        if table_entry is None:
             continue
-        src_schema, src_table = src_name.split('.')
-        tgt_schema, tgt_table = table_str.split('.')
+        src_schema, src_table, tgt_schema, tgt_table = table_entry
         queue_request(src_schema, 'TABLE', src_table)
-        constraint_tasks.append((item, src_schema, src_table, tgt_schema.upper(), tgt_table.upper()))
+        constraint_tasks.append((item, src_schema, src_table, tgt_schema, tgt_table))
 
     trigger_tasks: List[Tuple[str, str, str, str]] = []
     for item in extra_results.get('trigger_mismatched', []):
-        table_str = item.table.split()[0]
-        if '.' not in table_str:
+        table_entry = table_map.get(item.table)
+        if table_entry is None:
             continue
-        src_name = table_map.get(table_str)
-        if not src_name or '.' not in src_name:
-            continue
-        src_schema, _ = src_name.split('.')
-        tgt_schema, _ = table_str.split('.')
+        src_schema, _, tgt_schema, _ = table_entry
         # 优先使用缺失映射对（源->目标），确保 dbcat 按源名导出
         if item.missing_mappings:
             for src_full, tgt_full in item.missing_mappings:
@@ -4216,7 +4989,7 @@ def generate_fixup_scripts(
                 queue_request(src_schema_u, 'TRIGGER', src_trg)
                 trigger_tasks.append((src_schema_u, src_trg, tgt_schema_final, tgt_obj))
         else:
-            for trg_name in sorted(item.missing_triggers):
+            for trg_name in item.missing_triggers:
                 trg_name_u = trg_name.upper()
                 queue_request(src_schema, 'TRIGGER', trg_name_u)
                 src_full = f"{src_schema.upper()}.{trg_name_u}"
@@ -4228,6 +5001,13 @@ def generate_fixup_scripts(
                     tgt_obj = trg_name_u
                 trigger_tasks.append((src_schema, trg_name_u, tgt_schema_final, tgt_obj))
 
+    # fetch_dbcat_schema_objects 会消费 schema_requests（命中缓存的 schema 被移除），先记下全部请求
+    requested_objects: List[Tuple[str, str, str]] = [
+        (schema, obj_type, name)
+        for schema, type_map in schema_requests.items()
+        for obj_type, names in type_map.items()
+        for name in names
+    ]
     dbcat_data = fetch_dbcat_schema_objects(ora_cfg, settings, schema_requests)
 
     def get_dbcat_ddl(schema: str, obj_type: str, obj_name: str) -> Optional[str]:
@@ -4239,19 +5019,50 @@ def generate_fixup_scripts(
         )
 
     oracle_conn = None
+    fallback_types = {
+        'TABLE', 'VIEW', 'MATERIALIZED VIEW',
+        'PROCEDURE', 'FUNCTION', 'PACKAGE', 'PACKAGE BODY',
+        'SYNONYM', 'SEQUENCE', 'TRIGGER',
+        'TYPE', 'TYPE BODY'
+    }
+    # 预取的兜底 DDL：{(OBJ_TYPE, SCHEMA, NAME): DDL 或 None(已尝试但无结果)}
+    fallback_ddl_cache: Dict[Tuple[str, str, str], Optional[str]] = {}
+
+    fallback_conn_lock = threading.Lock()
+    # 并行生成各段脚本时，每段在首次需要兜底 DDL 时从会话池取一个独立会话，段结束后归还
+    fallback_pool = None
+    fallback_local = threading.local()
+
+    def get_fallback_pool():
+        nonlocal fallback_pool
+        with fallback_conn_lock:
+            if fallback_pool is None:
+                fallback_pool = oracledb.create_pool(
+                    user=ora_cfg['user'],
+                    password=ora_cfg['password'],
+                    dsn=ora_cfg['dsn'],
+                    min=1,
+                    max=max(1, section_workers),
+                    increment=1,
+                    session_callback=_metadata_session_callback
+                )
+        return fallback_pool
 
-    def get_fallback_ddl(schema: str, obj_type: str, obj_name: str) -> Optional[str]:
-        """当 dbcat 缺失 DDL 时尝试使用 DBMS_METADATA 兜底。"""
+    def get_fallback_conn():
         nonlocal oracle_conn
-        allowed_types = {
-            'TABLE', 'VIEW', 'MATERIALIZED VIEW',
-            'PROCEDURE', 'FUNCTION', 'PACKAGE', 'PACKAGE BODY',
-            'SYNONYM', 'SEQUENCE', 'TRIGGER',
-            'TYPE', 'TYPE BODY'
-        }
-        if obj_type.upper() not in allowed_types:
-            return None
-        try:
+        if getattr(fallback_local, 'use_pool', False):
+            section_conn = getattr(fallback_local, 'conn', None)
+            if section_conn is None:
+                try:
+                    section_conn = get_fallback_pool().acquire()
+                    fallback_local.conn = section_conn
+                except oracledb.Error as exc:
+                    log.warning("[DDL] 获取兜底会话失败，改用共享连接: %s", exc)
+                    fallback_local.use_pool = False
+            if section_conn is not None:
+                return section_conn
+        # 串行生成或会话池不可用时使用共享连接，只建立一次
+        with fallback_conn_lock:
             if oracle_conn is None:
                 oracle_conn = oracledb.connect(
                     user=ora_cfg['user'],
@@ -4259,261 +5070,329 @@ def generate_fixup_scripts(
                     dsn=ora_cfg['dsn']
                 )
                 setup_metadata_session(oracle_conn)
-            return oracle_get_ddl(oracle_conn, obj_type, schema, obj_name)
+        return oracle_conn
+
+    def get_fallback_ddl(schema: str, obj_type: str, obj_name: str) -> Optional[str]:
+        """当 dbcat 缺失 DDL 时尝试使用 DBMS_METADATA 兜底。"""
+        obj_type_u = obj_type.upper()
+        if obj_type_u not in fallback_types:
+            return None
+        key = (obj_type_u, schema.upper(), obj_name.upper())
+        if key in fallback_ddl_cache:
+            return fallback_ddl_cache[key]
+        try:
+            return oracle_get_ddl(get_fallback_conn(), obj_type, schema, obj_name)
         except Exception as exc:
             log.warning("[DDL] DBMS_METADATA 获取 %s.%s (%s) 失败: %s", schema, obj_name, obj_type, exc)
             return None
 
+    # dbcat 未导出的对象统一批量走 DBMS_METADATA，避免在各段生成时逐个往返 Oracle
+    dbcat_missing = [
+        (obj_type, schema, name)
+        for schema, obj_type, name in requested_objects
+        if obj_type in fallback_types and not get_dbcat_ddl(schema, obj_type, name)
+    ]
+    if dbcat_missing:
+        log.info("[DDL] dbcat 未导出 %d 个对象，批量使用 DBMS_METADATA 兜底获取。", len(dbcat_missing))
+        try:
+            fallback_ddl_cache.update(oracle_get_ddl_batch(
+                get_fallback_conn(),
+                dbcat_missing,
+                ora_cfg=ora_cfg,
+                workers=ORACLE_METADATA_MAX_SESSIONS
+            ))
+        except Exception as exc:
+            log.warning("[DDL] 批量 DBMS_METADATA 兜底失败，将在生成时逐个获取: %s", exc)
+
     table_ddl_cache: Dict[Tuple[str, str], str] = {}
     for schema, type_map in dbcat_data.items():
         for table_name, ddl in type_map.get('TABLE', {}).items():
             table_ddl_cache[(schema, table_name)] = ddl
 
-    log.info("[FIXUP] (1/9) 正在生成 SEQUENCE 脚本...")
-    for src_schema, seq_name, tgt_schema, tgt_name in sequence_tasks:
-        ddl = get_dbcat_ddl(src_schema, 'SEQUENCE', seq_name)
-        if not ddl:
-            ddl = get_fallback_ddl(src_schema, 'SEQUENCE', seq_name)
-            if ddl:
-                log.info("[FIXUP] 使用 DBMS_METADATA 兜底导出 SEQUENCE %s.%s。", src_schema, seq_name)
-        if not ddl:
-            log.warning("[FIXUP] 未找到 SEQUENCE %s.%s 的 dbcat DDL。", src_schema, seq_name)
-            continue
-        ddl_adj = adjust_ddl_for_object(
-            ddl,
-            src_schema,
-            seq_name,
-            tgt_schema,
-            tgt_name,
-            extra_identifiers=all_replacements
-        )
-        ddl_adj = cleanup_dbcat_wrappers(ddl_adj)
-        ddl_adj = prepend_set_schema(ddl_adj, tgt_schema)
-        ddl_adj = normalize_ddl_for_ob(ddl_adj)
-        ddl_adj = strip_constraint_enable(ddl_adj)
-        filename = f"{tgt_schema}.{tgt_name}.sql"
-        header = f"修补缺失的 SEQUENCE {tgt_schema}.{tgt_name} (源: {src_schema}.{seq_name})"
-        write_fixup_file(base_dir, 'sequence', filename, ddl_adj, header)
-
-    log.info("[FIXUP] (2/9) 正在生成缺失的 TABLE CREATE 脚本...")
-    for src_schema, src_table, tgt_schema, tgt_table in missing_tables:
-        ddl = get_dbcat_ddl(src_schema, 'TABLE', src_table)
-        if not ddl:
-            ddl = get_fallback_ddl(src_schema, 'TABLE', src_table)
-            if ddl:
-                log.info("[FIXUP] 使用 DBMS_METADATA 兜底导出 TABLE %s.%s。", src_schema, src_table)
-        if not ddl:
-            log.warning("[FIXUP] 未找到 TABLE %s.%s 的 dbcat DDL。", src_schema, src_table)
-            continue
-        ddl_adj = adjust_ddl_for_object(
-            ddl,
-            src_schema,
-            src_table,
-            tgt_schema,
-            tgt_table,
-            extra_identifiers=all_replacements
-        )
-        ddl_adj = cleanup_dbcat_wrappers(ddl_adj)
-        ddl_adj = prepend_set_schema(ddl_adj, tgt_schema)
-        ddl_adj = normalize_ddl_for_ob(ddl_adj)
-        ddl_adj = strip_constraint_enable(ddl_adj)
-        ddl_adj = strip_enable_novalidate(ddl_adj)
-        filename = f"{tgt_schema}.{tgt_table}.sql"
-        header = f"修补缺失的 TABLE {tgt_schema}.{tgt_table} (源: {src_schema}.{src_table})"
-        write_fixup_file(base_dir, 'table', filename, ddl_adj, header)
-
-    log.info("[FIXUP] (3/9) 正在生成 TABLE ALTER 脚本...")
-    for (obj_type, tgt_name, missing_cols, extra_cols, length_mismatches) in tv_results.get('mismatched', []):
-        if obj_type.upper() != 'TABLE' or "获取失败" in tgt_name:
-            continue
-        src_name = table_map.get(tgt_name)
-        if not src_name:
-            continue
-        src_schema, src_table = src_name.split('.')
-        tgt_schema, tgt_table = tgt_name.split('.')
-        alter_sql = generate_alter_for_table_columns(
-            oracle_meta,
-            src_schema,
-            src_table,
-            tgt_schema,
-            tgt_table,
-            missing_cols,
-            extra_cols,
-            length_mismatches
-        )
-        if alter_sql:
-            alter_sql = prepend_set_schema(alter_sql, tgt_schema)
-            filename = f"{tgt_schema}.{tgt_table}.alter_columns.sql"
-            header = f"基于列差异的 ALTER TABLE 修补脚本: {tgt_schema}.{tgt_table} (源: {src_schema}.{src_table})"
-            write_fixup_file(base_dir, 'table_alter', filename, alter_sql, header)
-
-    log.info("[FIXUP] (4/9) 正在生成 VIEW / MATERIALIZED VIEW / 其他对象脚本...")
-    for (obj_type, src_schema, src_obj, tgt_schema, tgt_obj) in other_missing_objects:
-        ddl = get_dbcat_ddl(src_schema, obj_type, src_obj)
-        if not ddl:
-            ddl = get_fallback_ddl(src_schema, obj_type, src_obj)
-            if ddl:
-                log.info("[DDL] 使用 DBMS_METADATA 兜底导出 %s %s.%s。", obj_type, src_schema, src_obj)
-        if not ddl:
-            log.warning("[FIXUP] 未找到 %s %s.%s 的 dbcat DDL。", obj_type, src_schema, src_obj)
-            continue
-        ddl_adj = adjust_ddl_for_object(
-            ddl,
-            src_schema,
-            src_obj,
-            tgt_schema,
-            tgt_obj,
-            extra_identifiers=all_replacements
-        )
-        ddl_adj = cleanup_dbcat_wrappers(ddl_adj)
-        ddl_adj = prepend_set_schema(ddl_adj, tgt_schema)
-        ddl_adj = normalize_ddl_for_ob(ddl_adj)
-        ddl_adj = strip_constraint_enable(ddl_adj)
-        ddl_adj = enforce_schema_for_ddl(ddl_adj, tgt_schema, obj_type)
-        
-        # --- Find and prepare grants for this object ---
-        grants_for_this_object = []
-        full_target_object_name = f"{tgt_schema}.{tgt_obj}".upper()
-        for grantee, entries in grants_map.items():
-            for priv, obj_granted_on in entries:
-                if obj_granted_on.upper() == full_target_object_name:
-                    grant_stmt = f"GRANT {priv} ON {full_target_object_name} TO {grantee};"
-                    grants_for_this_object.append(grant_stmt)
-
-        subdir = obj_type_to_dir.get(obj_type, obj_type.lower())
-        filename = f"{tgt_schema}.{tgt_obj}.sql"
-        header = f"修补缺失的 {obj_type} {tgt_schema}.{tgt_obj} (源: {src_schema}.{src_obj})"
-        write_fixup_file(base_dir, subdir, filename, ddl_adj, header, grants_to_add=grants_for_this_object)
-
-    log.info("[FIXUP] (5/9) 正在生成 INDEX 脚本...")
-    for item, src_schema, src_table, tgt_schema, tgt_table in index_tasks:
-        table_ddl = table_ddl_cache.get((src_schema.upper(), src_table.upper()))
-        if not table_ddl:
-            log.warning("[FIXUP] 未找到 TABLE %s.%s 的 dbcat DDL，无法生成索引。", src_schema, src_table)
-            continue
-
-        def index_predicate(stmt_upper: str) -> bool:
-            return 'CREATE' in stmt_upper and ' INDEX ' in stmt_upper
-
-        extracted = extract_statements_for_names(table_ddl, item.missing_indexes, index_predicate)
-        for idx_name in sorted(item.missing_indexes):
-            idx_name_u = idx_name.upper()
-            statements = extracted.get(idx_name_u) or []
-            if not statements:
-                log.warning("[FIXUP] 未在 TABLE %s.%s 的 DDL 中找到索引 %s。", src_schema, src_table, idx_name_u)
+    # 授权按被授权对象预先分桶，避免每个对象都遍历一遍全部授权；须在约束段向 grants_map 追加 REFERENCES 授权之前完成
+    grants_by_object: Dict[str, List[str]] = defaultdict(list)
+    for grantee, entries in grants_map.items():
+        for priv, obj_granted_on in entries:
+            obj_granted_u = obj_granted_on.upper()
+            grants_by_object[obj_granted_u].append(f"GRANT {priv} ON {obj_granted_u} TO {grantee};")
+
+    def _generate_sequence_scripts() -> None:
+        log.info("[FIXUP] (1/9) 正在生成 SEQUENCE 脚本...")
+        for src_schema, seq_name, tgt_schema, tgt_name in sequence_tasks:
+            ddl = get_dbcat_ddl(src_schema, 'SEQUENCE', seq_name)
+            if not ddl:
+                ddl = get_fallback_ddl(src_schema, 'SEQUENCE', seq_name)
+                if ddl:
+                    log.info("[FIXUP] 使用 DBMS_METADATA 兜底导出 SEQUENCE %s.%s。", src_schema, seq_name)
+            if not ddl:
+                log.warning("[FIXUP] 未找到 SEQUENCE %s.%s 的 dbcat DDL。", src_schema, seq_name)
+                continue
+            ddl_adj = adjust_ddl_for_object(
+                ddl,
+                src_schema,
+                seq_name,
+                tgt_schema,
+                tgt_name,
+                replacement_lookups=get_replacement_lookups()
+            )
+            ddl_adj = cleanup_dbcat_wrappers(ddl_adj)
+            ddl_adj = prepend_set_schema(ddl_adj, tgt_schema)
+            ddl_adj = normalize_ddl_for_ob(ddl_adj)
+            ddl_adj = strip_constraint_enable(ddl_adj)
+            filename = f"{tgt_schema}.{tgt_name}.sql"
+            header = f"修补缺失的 SEQUENCE {tgt_schema}.{tgt_name} (源: {src_schema}.{seq_name})"
+            write_fixup_file(base_dir, 'sequence', filename, ddl_adj, header)
+
+    def _generate_table_scripts() -> None:
+        log.info("[FIXUP] (2/9) 正在生成缺失的 TABLE CREATE 脚本...")
+        for src_schema, src_table, tgt_schema, tgt_table in missing_tables:
+            ddl = get_dbcat_ddl(src_schema, 'TABLE', src_table)
+            if not ddl:
+                ddl = get_fallback_ddl(src_schema, 'TABLE', src_table)
+                if ddl:
+                    log.info("[FIXUP] 使用 DBMS_METADATA 兜底导出 TABLE %s.%s。", src_schema, src_table)
+            if not ddl:
+                log.warning("[FIXUP] 未找到 TABLE %s.%s 的 dbcat DDL。", src_schema, src_table)
+                continue
+            ddl_adj = adjust_ddl_for_object(
+                ddl,
+                src_schema,
+                src_table,
+                tgt_schema,
+                tgt_table,
+                replacement_lookups=get_replacement_lookups()
+            )
+            ddl_adj = cleanup_dbcat_wrappers(ddl_adj)
+            ddl_adj = prepend_set_schema(ddl_adj, tgt_schema)
+            ddl_adj = normalize_ddl_for_ob(ddl_adj)
+            ddl_adj = strip_constraint_enable(ddl_adj)
+            ddl_adj = strip_enable_novalidate(ddl_adj)
+            filename = f"{tgt_schema}.{tgt_table}.sql"
+            header = f"修补缺失的 TABLE {tgt_schema}.{tgt_table} (源: {src_schema}.{src_table})"
+            write_fixup_file(base_dir, 'table', filename, ddl_adj, header)
+
+    def _generate_table_alter_scripts() -> None:
+        log.info("[FIXUP] (3/9) 正在生成 TABLE ALTER 脚本...")
+        for (obj_type, tgt_name, missing_cols, extra_cols, length_mismatches) in tv_results.get('mismatched', []):
+            if obj_type.upper() != 'TABLE' or "获取失败" in tgt_name:
+                continue
+            table_entry = table_map.get(tgt_name)
+            if table_entry is None:
+                continue
+            src_schema, src_table, tgt_schema, tgt_table = table_entry
+            alter_sql = generate_alter_for_table_columns(
+                oracle_meta,
+                src_schema,
+                src_table,
+                tgt_schema,
+                tgt_table,
+                missing_cols,
+                extra_cols,
+                length_mismatches
+            )
+            if alter_sql:
+                alter_sql = prepend_set_schema(alter_sql, tgt_schema)
+                filename = f"{tgt_schema}.{tgt_table}.alter_columns.sql"
+                header = f"基于列差异的 ALTER TABLE 修补脚本: {tgt_schema}.{tgt_table} (源: {src_schema}.{src_table})"
+                write_fixup_file(base_dir, 'table_alter', filename, alter_sql, header)
+
+    def _generate_other_object_scripts() -> None:
+        log.info("[FIXUP] (4/9) 正在生成 VIEW / MATERIALIZED VIEW / 其他对象脚本...")
+        for (obj_type, src_schema, src_obj, tgt_schema, tgt_obj) in other_missing_objects:
+            ddl = get_dbcat_ddl(src_schema, obj_type, src_obj)
+            if not ddl:
+                ddl = get_fallback_ddl(src_schema, obj_type, src_obj)
+                if ddl:
+                    log.info("[DDL] 使用 DBMS_METADATA 兜底导出 %s %s.%s。", obj_type, src_schema, src_obj)
+            if not ddl:
+                log.warning("[FIXUP] 未找到 %s %s.%s 的 dbcat DDL。", obj_type, src_schema, src_obj)
+                continue
+            ddl_adj = adjust_ddl_for_object(
+                ddl,
+                src_schema,
+                src_obj,
+                tgt_schema,
+                tgt_obj,
+                replacement_lookups=get_replacement_lookups()
+            )
+            ddl_adj = cleanup_dbcat_wrappers(ddl_adj)
+            ddl_adj = prepend_set_schema(ddl_adj, tgt_schema)
+            ddl_adj = normalize_ddl_for_ob(ddl_adj)
+            ddl_adj = strip_constraint_enable(ddl_adj)
+            ddl_adj = enforce_schema_for_ddl(ddl_adj, tgt_schema, obj_type)
+
+            # --- Find and prepare grants for this object ---
+            grants_for_this_object = grants_by_object.get(f"{tgt_schema}.{tgt_obj}".upper(), [])
+
+            subdir = obj_type_to_dir.get(obj_type, obj_type.lower())
+            filename = f"{tgt_schema}.{tgt_obj}.sql"
+            header = f"修补缺失的 {obj_type} {tgt_schema}.{tgt_obj} (源: {src_schema}.{src_obj})"
+            write_fixup_file(base_dir, subdir, filename, ddl_adj, header, grants_to_add=grants_for_this_object)
+
+    def _generate_index_scripts() -> None:
+        log.info("[FIXUP] (5/9) 正在生成 INDEX 脚本...")
+        for item, src_schema, src_table, tgt_schema, tgt_table in index_tasks:
+            table_ddl = table_ddl_cache.get((src_schema, src_table))
+            if not table_ddl:
+                log.warning("[FIXUP] 未找到 TABLE %s.%s 的 dbcat DDL，无法生成索引。", src_schema, src_table)
                 continue
-            ddl_lines: List[str] = []
-            for stmt in statements:
-                ddl_adj = adjust_ddl_for_object(
-                    stmt,
-                    src_schema,
-                    src_table,
-                    tgt_schema,
-                    tgt_table,
-                    extra_identifiers=all_replacements
-                )
-                ddl_adj = normalize_ddl_for_ob(ddl_adj)
-                ddl_lines.append(ddl_adj if ddl_adj.endswith(';') else ddl_adj + ';')
-            content = prepend_set_schema("\n".join(ddl_lines), tgt_schema)
-            filename = f"{tgt_schema}.{idx_name_u}.sql"
-            header = f"修补缺失的 INDEX {idx_name_u} (表: {tgt_schema}.{tgt_table})"
-            write_fixup_file(base_dir, 'index', filename, content, header)
-
-    log.info("[FIXUP] (6/9) 正在生成 CONSTRAINT 脚本...")
-    for item, src_schema, src_table, tgt_schema, tgt_table in constraint_tasks:
-        table_ddl = table_ddl_cache.get((src_schema.upper(), src_table.upper()))
-        if not table_ddl:
-            log.warning("[FIXUP] 未找到 TABLE %s.%s 的 dbcat DDL，无法生成约束。", src_schema, src_table)
-            continue
 
-        def constraint_predicate(stmt_upper: str) -> bool:
-            return 'ALTER TABLE' in stmt_upper and 'CONSTRAINT' in stmt_upper
-
-        extracted = extract_statements_for_names(table_ddl, item.missing_constraints, constraint_predicate)
-        for cons_name in sorted(item.missing_constraints):
-            cons_name_u = cons_name.upper()
-            statements = extracted.get(cons_name_u) or []
-            cons_meta = oracle_meta.constraints.get((src_schema.upper(), src_table.upper()), {}).get(cons_name_u)
-            ctype = (cons_meta or {}).get("type", "").upper()
-            cols = cons_meta.get("columns") if cons_meta else []
-            # 针对跨 schema 的外键，准备 REFERENCES 授权
-            if cons_meta and ctype == 'R':
-                ref_owner = cons_meta.get("ref_table_owner") or cons_meta.get("r_owner")
-                ref_table = cons_meta.get("ref_table_name")
-                if ref_owner and ref_table and ref_owner.upper() != tgt_schema.upper():
-                    ref_src_full = f"{ref_owner}.{ref_table}"
-                    ref_tgt_full = get_mapped_target(full_object_mapping, ref_src_full, 'TABLE') or ref_src_full
-                    grants_map.setdefault(tgt_schema.upper(), set()).add(('REFERENCES', ref_tgt_full.upper()))
-            # Fallback: PK/UK 可能内联在 CREATE TABLE 中，尝试用元数据重建
-            if not statements:
-                cols_join = ", ".join(c for c in cols if c)
-                if cols_join and ctype in ('P', 'U'):
-                    add_clause = "PRIMARY KEY" if ctype == 'P' else "UNIQUE"
-                    stmt = (
-                        f"ALTER TABLE {tgt_schema}.{tgt_table} "
-                        f"ADD CONSTRAINT {cons_name_u} {add_clause} ({cols_join})"
+            extracted = extract_statements_for_names(table_ddl, item.missing_indexes, is_create_index_statement)
+            for idx_name in item.missing_indexes:
+                idx_name_u = idx_name.upper()
+                statements = extracted.get(idx_name_u) or []
+                if not statements:
+                    log.warning("[FIXUP] 未在 TABLE %s.%s 的 DDL 中找到索引 %s。", src_schema, src_table, idx_name_u)
+                    continue
+                ddl_lines: List[str] = []
+                for stmt in statements:
+                    ddl_adj = adjust_ddl_for_object(
+                        stmt,
+                        src_schema,
+                        src_table,
+                        tgt_schema,
+                        tgt_table,
+                        replacement_lookups=get_replacement_lookups()
                     )
-                    statements = [stmt]
-                elif cons_meta:
-                    log.warning(
-                        "[FIXUP] 约束 %s 类型为 %s，无内联 DDL 可用，无法自动重建。",
-                        cons_name_u, ctype or "UNKNOWN"
+                    ddl_adj = normalize_ddl_for_ob(ddl_adj)
+                    ddl_lines.append(ddl_adj if ddl_adj.endswith(';') else ddl_adj + ';')
+                content = prepend_set_schema("\n".join(ddl_lines), tgt_schema)
+                filename = f"{tgt_schema}.{idx_name_u}.sql"
+                header = f"修补缺失的 INDEX {idx_name_u} (表: {tgt_schema}.{tgt_table})"
+                write_fixup_file(base_dir, 'index', filename, content, header)
+
+    def _generate_constraint_scripts() -> None:
+        log.info("[FIXUP] (6/9) 正在生成 CONSTRAINT 脚本...")
+        for item, src_schema, src_table, tgt_schema, tgt_table in constraint_tasks:
+            table_ddl = table_ddl_cache.get((src_schema, src_table))
+            if not table_ddl:
+                log.warning("[FIXUP] 未找到 TABLE %s.%s 的 dbcat DDL，无法生成约束。", src_schema, src_table)
+                continue
+
+            extracted = extract_statements_for_names(table_ddl, item.missing_constraints, is_add_constraint_statement)
+            # 同一张表的约束元数据只取一次，供下面逐个约束使用；
+            # 约束元数据在 dump 时已按大写的 (owner, table) / 约束名 / 类型建键，此处直接查找
+            table_constraints = oracle_meta.constraints.get((src_schema, src_table), {})
+            for cons_name in item.missing_constraints:
+                statements = extracted.get(cons_name) or []
+                cons_meta = table_constraints.get(cons_name)
+                ctype = cons_meta.type if cons_meta else ""
+                cols = cons_meta.columns if cons_meta else []
+                # 针对跨 schema 的外键，准备 REFERENCES 授权
+                if cons_meta and ctype == 'R':
+                    ref_owner = cons_meta.ref_table_owner or cons_meta.r_owner
+                    ref_table = cons_meta.ref_table_name
+                    if ref_owner and ref_table and ref_owner != tgt_schema:
+                        ref_src_full = f"{ref_owner}.{ref_table}"
+                        ref_tgt_full = get_mapped_target(full_object_mapping, ref_src_full, 'TABLE') or ref_src_full
+                        grants_map.setdefault(tgt_schema, set()).add(('REFERENCES', ref_tgt_full.upper()))
+                # Fallback: PK/UK 可能内联在 CREATE TABLE 中，尝试用元数据重建
+                if not statements:
+                    cols_join = ", ".join(c for c in cols if c)
+                    if cols_join and ctype in ('P', 'U'):
+                        add_clause = "PRIMARY KEY" if ctype == 'P' else "UNIQUE"
+                        stmt = (
+                            f"ALTER TABLE {tgt_schema}.{tgt_table} "
+                            f"ADD CONSTRAINT {cons_name} {add_clause} ({cols_join})"
+                        )
+                        statements = [stmt]
+                    elif cons_meta:
+                        log.warning(
+                            "[FIXUP] 约束 %s 类型为 %s，无内联 DDL 可用，无法自动重建。",
+                            cons_name, ctype or "UNKNOWN"
+                        )
+                if not statements:
+                    log.warning("[FIXUP] 未在 TABLE %s.%s 的 DDL 中找到约束 %s。", src_schema, src_table, cons_name)
+                    continue
+                ddl_lines: List[str] = []
+                for stmt in statements:
+                    ddl_adj = adjust_ddl_for_object(
+                        stmt,
+                        src_schema,
+                        src_table,
+                        tgt_schema,
+                        tgt_table,
+                        replacement_lookups=get_replacement_lookups()
                     )
-            if not statements:
-                log.warning("[FIXUP] 未在 TABLE %s.%s 的 DDL 中找到约束 %s。", src_schema, src_table, cons_name_u)
+                    ddl_adj = normalize_ddl_for_ob(ddl_adj)
+                    ddl_adj = strip_constraint_enable(ddl_adj)
+                    ddl_adj = strip_enable_novalidate(ddl_adj)
+                    ddl_lines.append(ddl_adj if ddl_adj.endswith(';') else ddl_adj + ';')
+                content = prepend_set_schema("\n".join(ddl_lines), tgt_schema)
+                filename = f"{tgt_schema}.{cons_name}.sql"
+                header = f"修补缺失的约束 {cons_name} (表: {tgt_schema}.{tgt_table})"
+                write_fixup_file(base_dir, 'constraint', filename, content, header)
+
+    def _generate_trigger_scripts() -> None:
+        log.info("[FIXUP] (7/9) 正在生成 TRIGGER 脚本...")
+        for src_schema, trg_name, tgt_schema, tgt_obj in trigger_tasks:
+            ddl = get_dbcat_ddl(src_schema, 'TRIGGER', trg_name)
+            if not ddl:
+                ddl = get_fallback_ddl(src_schema, 'TRIGGER', trg_name)
+                if ddl:
+                    log.info("[FIXUP] 使用 DBMS_METADATA 兜底导出 TRIGGER %s.%s。", src_schema, trg_name)
+            if not ddl:
+                log.warning("[FIXUP] 未找到 TRIGGER %s.%s 的 dbcat DDL。", src_schema, trg_name)
                 continue
-            ddl_lines: List[str] = []
-            for stmt in statements:
-                ddl_adj = adjust_ddl_for_object(
-                    stmt,
-                    src_schema,
-                    src_table,
-                    tgt_schema,
-                    tgt_table,
-                    extra_identifiers=all_replacements
-                )
-                ddl_adj = normalize_ddl_for_ob(ddl_adj)
-                ddl_adj = strip_constraint_enable(ddl_adj)
-                ddl_adj = strip_enable_novalidate(ddl_adj)
-                ddl_lines.append(ddl_adj if ddl_adj.endswith(';') else ddl_adj + ';')
-            content = prepend_set_schema("\n".join(ddl_lines), tgt_schema)
-            filename = f"{tgt_schema}.{cons_name_u}.sql"
-            header = f"修补缺失的约束 {cons_name_u} (表: {tgt_schema}.{tgt_table})"
-            write_fixup_file(base_dir, 'constraint', filename, content, header)
-
-    log.info("[FIXUP] (7/9) 正在生成 TRIGGER 脚本...")
-    for src_schema, trg_name, tgt_schema, tgt_obj in trigger_tasks:
-        ddl = get_dbcat_ddl(src_schema, 'TRIGGER', trg_name)
-        if not ddl:
-            ddl = get_fallback_ddl(src_schema, 'TRIGGER', trg_name)
-            if ddl:
-                log.info("[FIXUP] 使用 DBMS_METADATA 兜底导出 TRIGGER %s.%s。", src_schema, trg_name)
-        if not ddl:
-            log.warning("[FIXUP] 未找到 TRIGGER %s.%s 的 dbcat DDL。", src_schema, trg_name)
-            continue
-        ddl_adj = adjust_ddl_for_object(
-            ddl,
-            src_schema,
-            trg_name,
-            tgt_schema,
-            tgt_obj,
-            extra_identifiers=all_replacements
-        )
-        ddl_adj = cleanup_dbcat_wrappers(ddl_adj)
-        ddl_adj = prepend_set_schema(ddl_adj, tgt_schema)
-        ddl_adj = strip_constraint_enable(ddl_adj)
-        ddl_adj = enforce_schema_for_ddl(ddl_adj, tgt_schema, 'TRIGGER')
-        filename = f"{tgt_schema}.{tgt_obj}.sql"
-        header = f"修补缺失的触发器 {tgt_obj} (源: {src_schema}.{trg_name})"
-        write_fixup_file(base_dir, 'trigger', filename, ddl_adj, header)
+            ddl_adj = adjust_ddl_for_object(
+                ddl,
+                src_schema,
+                trg_name,
+                tgt_schema,
+                tgt_obj,
+                replacement_lookups=get_replacement_lookups()
+            )
+            ddl_adj = cleanup_dbcat_wrappers(ddl_adj)
+            ddl_adj = prepend_set_schema(ddl_adj, tgt_schema)
+            ddl_adj = strip_constraint_enable(ddl_adj)
+            ddl_adj = enforce_schema_for_ddl(ddl_adj, tgt_schema, 'TRIGGER')
+            filename = f"{tgt_schema}.{tgt_obj}.sql"
+            header = f"修补缺失的触发器 {tgt_obj} (源: {src_schema}.{trg_name})"
+            write_fixup_file(base_dir, 'trigger', filename, ddl_adj, header)
+
+    # 1~7 段各自写入不同子目录、互不依赖（约束段追加的 REFERENCES 授权由第 9 段在全部完成后统一消费），可并行生成
+    section_jobs = [
+        _generate_sequence_scripts,
+        _generate_table_scripts,
+        _generate_table_alter_scripts,
+        _generate_other_object_scripts,
+        _generate_index_scripts,
+        _generate_constraint_scripts,
+        _generate_trigger_scripts,
+    ]
+    section_workers = min(settings.get('fixup_workers', 1) or len(section_jobs), len(section_jobs))
+    if section_workers > 1:
+        if sequence_tasks or missing_tables or other_missing_objects or index_tasks or constraint_tasks or trigger_tasks:
+            # 替换表及其查找表在分发前构建一次，避免多个线程各自重复构建
+            get_replacement_lookups()
+
+        def _run_section(job: Callable[[], None]) -> None:
+            fallback_local.use_pool = True
+            try:
+                job()
+            finally:
+                fallback_local.use_pool = False
+                section_conn = fallback_local.__dict__.pop('conn', None)
+                if section_conn is not None:
+                    fallback_pool.release(section_conn)
+
+        log.info("[FIXUP] 使用 %d 个线程并行生成 (1~7/9) 各段脚本。", section_workers)
+        with ThreadPoolExecutor(max_workers=section_workers) as executor:
+            futures = [executor.submit(_run_section, job) for job in section_jobs]
+            for future in futures:
+                future.result()
+    else:
+        for job in section_jobs:
+            job()
 
     dep_report = dependency_report or {}
     compile_tasks: Dict[Tuple[str, str, str], Set[str]] = defaultdict(set)
 
+    # 依赖报告中的名称/类型已大写（见 check_dependencies_against_ob），直接查字典，缺失类型复用共享空集合
     def _ob_object_exists(full_name: str, obj_type: str) -> bool:
         if ob_meta is None:
             return True
-        return full_name.upper() in ob_meta.objects_by_type.get(obj_type.upper(), set())
+        return full_name in ob_meta.objects_by_type.get(obj_type, EMPTY_FROZENSET)
 
     def _compile_statements(obj_type: str, obj_name: str) -> List[str]:
         obj_type_u = obj_type.upper()
@@ -4598,6 +5477,11 @@ def generate_fixup_scripts(
             oracle_conn.close()
         except Exception:
             pass
+    if fallback_pool is not None:
+        try:
+            fallback_pool.close(force=True)
+        except Exception:
+            pass
 
     if unsupported_types:
         log.warning(
@@ -4619,6 +5503,44 @@ except ImportError:
     sys.exit(1)
 
 
+# 报告中的固定面板与主题与本次结果无关，在模块加载时构建一次
+REPORT_THEME = Theme({
+    "ok": "green",
+    "missing": "red",
+    "mismatch": "yellow",
+    "info": "cyan",
+    "header": "bold magenta",
+    "title": "bold white on blue"
+})
+REPORT_TITLE_PANEL = Panel.fit("[bold]数据库对象迁移校验报告 (V0.8 - Rich)[/bold]", style="title")
+REPORT_END_PANEL = Panel.fit("[bold]报告结束[/bold]", style="title")
+FIXUP_DIR_PANEL = Panel.fit(
+    "[bold]Fixup 脚本生成目录[/bold]\n\n"
+    "fixup_scripts/table         : 缺失 TABLE 的 CREATE 脚本\n"
+    "fixup_scripts/view          : 缺失 VIEW 的 CREATE 脚本\n"
+    "fixup_scripts/materialized_view : 缺失 MATERIALIZED VIEW 的 CREATE 脚本\n"
+    "fixup_scripts/procedure     : 缺失 PROCEDURE 的 CREATE 脚本\n"
+    "fixup_scripts/function      : 缺失 FUNCTION 的 CREATE 脚本\n"
+    "fixup_scripts/package       : 缺失 PACKAGE 的 CREATE 脚本\n"
+    "fixup_scripts/package_body  : 缺失 PACKAGE BODY 的 CREATE 脚本\n"
+    "fixup_scripts/synonym       : 缺失 SYNONYM 的 CREATE 脚本\n"
+    "fixup_scripts/job           : 缺失 JOB 的 CREATE 脚本\n"
+    "fixup_scripts/schedule      : 缺失 SCHEDULE 的 CREATE 脚本\n"
+    "fixup_scripts/type          : 缺失 TYPE 的 CREATE 脚本\n"
+    "fixup_scripts/type_body     : 缺失 TYPE BODY 的 CREATE 脚本\n"
+    "fixup_scripts/index         : 缺失 INDEX 的 CREATE 脚本\n"
+    "fixup_scripts/constraint    : 缺失约束的 CREATE 脚本\n"
+    "fixup_scripts/sequence      : 缺失 SEQUENCE 的 CREATE 脚本\n"
+    "fixup_scripts/trigger       : 缺失 TRIGGER 的 CREATE 脚本\n"
+    "fixup_scripts/compile       : 依赖重编译脚本 (ALTER ... COMPILE)\n"
+    "fixup_scripts/grants        : 依赖对象所需的授权脚本\n"
+    "fixup_scripts/table_alter   : 列不匹配 TABLE 的 ALTER 修补脚本\n\n"
+    "[bold]请在 OceanBase 执行前逐一人工审核上述脚本。[/bold]",
+    title="[info]提示",
+    border_style="info"
+)
+
+
 def export_missing_table_view_mappings(
     tv_results: ReportResults,
     report_dir: Path
@@ -4673,15 +5595,7 @@ def print_final_report(
     endpoint_info: Optional[Dict[str, Dict[str, str]]] = None,
     schema_summary: Optional[Dict[str, List[str]]] = None
 ):
-    custom_theme = Theme({
-        "ok": "green",
-        "missing": "red",
-        "mismatch": "yellow",
-        "info": "cyan",
-        "header": "bold magenta",
-        "title": "bold white on blue"
-    })
-    console = Console(theme=custom_theme, record=report_file is not None)
+    console = Console(theme=REPORT_THEME, record=report_file is not None)
 
     if extra_results is None:
         extra_results = {
@@ -4712,489 +5626,477 @@ def print_final_report(
 
     log.info("所有校验已完成。正在生成最终报告...")
 
-    ok_count = len(tv_results['ok'])
-    missing_count = len(tv_results['missing'])
-    mismatched_count = len(tv_results['mismatched'])
-    extraneous_count = len(tv_results['extraneous'])
-    idx_ok_cnt = len(extra_results.get("index_ok", []))
-    idx_mis_cnt = len(extra_results.get("index_mismatched", []))
-    cons_ok_cnt = len(extra_results.get("constraint_ok", []))
-    cons_mis_cnt = len(extra_results.get("constraint_mismatched", []))
-    seq_ok_cnt = len(extra_results.get("sequence_ok", []))
-    seq_mis_cnt = len(extra_results.get("sequence_mismatched", []))
-    trg_ok_cnt = len(extra_results.get("trigger_ok", []))
-    trg_mis_cnt = len(extra_results.get("trigger_mismatched", []))
-    comment_ok_cnt = len(comment_results.get("ok", []))
-    comment_mis_cnt = len(comment_results.get("mismatched", []))
-    comment_skip_reason = comment_results.get("skipped_reason")
-    extra_target_cnt = len(tv_results.get('extra_targets', []))
-    dep_missing_cnt = len(dependency_report.get("missing", []))
-    dep_unexpected_cnt = len(dependency_report.get("unexpected", []))
-    dep_skipped_cnt = len(dependency_report.get("skipped", []))
-    grant_stmt_cnt = sum(len(entries) for entries in required_grants.values())
-    source_missing_schema_cnt = len(schema_summary.get("source_missing", []))
-
-    console.print(Panel.fit("[bold]数据库对象迁移校验报告 (V0.8 - Rich)[/bold]", style="title"))
-
-    section_width = 140
-    count_table_kwargs: Dict[str, object] = {"width": section_width, "expand": False}
-    TYPE_COL_WIDTH = 16
-    OBJECT_COL_WIDTH = 42
-    DETAIL_COL_WIDTH = 90
-
-    def format_endpoint_block(info: Dict[str, str], is_oracle: bool) -> str:
-        lines: List[str] = []
-        if not info:
-            return "无可用信息"
-        if info.get("version"):
-            lines.append(f"版本: {info['version']}")
-        if is_oracle:
-            if info.get("cdb_mode"):
-                lines.append(f"CDB/PDB: {info['cdb_mode']}")
-            if info.get("container"):
-                lines.append(f"容器: {info['container']}")
-            if info.get("service_name"):
-                lines.append(f"服务名: {info['service_name']}")
-        else:
-            if info.get("current_database"):
-                lines.append(f"当前库: {info['current_database']}")
-            if info.get("connection_id"):
-                lines.append(f"连接 ID: {info['connection_id']}")
-            if info.get("ssl"):
-                lines.append(f"SSL: {info['ssl']}")
-        host = info.get("host")
-        port = info.get("port")
-        if host or port:
-            lines.append(f"地址: {host or ''}:{port or ''}")
-        user_label = "连接用户" if is_oracle else "当前用户"
-        user_value = info.get("current_user") or info.get("user") or info.get("configured_user", "")
-        if is_oracle and user_value:
-            user_value = str(user_value).upper()
-        lines.append(f"{user_label}: {user_value}")
-        if is_oracle and info.get("dsn"):
-            lines.append(f"DSN: {info['dsn']}")
-        return "\n".join([line for line in lines if line.strip()]) or "无可用信息"
-
-    if endpoint_info:
-        src_info = endpoint_info.get("oracle", {})
-        tgt_info = endpoint_info.get("oceanbase", {})
-        env_table = Table(title="[header]源/目标环境", width=section_width)
-        env_table.add_column("源 (Oracle)", width=section_width // 2)
-        env_table.add_column("目标 (OceanBase)", width=section_width // 2)
-        env_table.add_row(
-            format_endpoint_block(src_info, True),
-            format_endpoint_block(tgt_info, False)
+    # 缺失 TABLE/VIEW 映射只依赖 tv_results，交给后台线程写盘，与下面的 Rich 渲染/终端输出重叠
+    export_executor: Optional[ThreadPoolExecutor] = None
+    export_future: Optional[Future] = None
+    if report_file:
+        export_executor = ThreadPoolExecutor(max_workers=1)
+        export_future = export_executor.submit(
+            export_missing_table_view_mappings, tv_results, Path(report_file).parent
         )
-        console.print(env_table)
-        console.print("")
-
-    # --- 综合概要 ---
-    summary_table = Table(
-        title="[header]综合概要",
-        show_header=False,
-        box=None,
-        width=section_width,
-        pad_edge=False,
-        padding=(0, 1)
-    )
-    summary_table.add_column("Category", justify="left", width=24, no_wrap=True)
-    summary_table.add_column("Details", justify="left", width=section_width - 28)
-
-    schema_text = Text()
-    schema_text.append("源 schema 未获取到对象: ", style="mismatch")
-    schema_text.append(f"{source_missing_schema_cnt}")
-    summary_table.add_row("[bold]Schema 覆盖[/bold]", schema_text)
-
-    primary_text = Text()
-    primary_text.append(f"总计校验对象 (来自源库): {total_checked}\n")
-    primary_text.append("一致: ", style="ok")
-    primary_text.append(f"{ok_count}\n")
-    primary_text.append("缺失: ", style="missing")
-    primary_text.append(f"{missing_count}\n")
-    primary_text.append("不匹配 (表列/长度): ", style="mismatch")
-    primary_text.append(f"{mismatched_count}\n")
-    primary_text.append("多余: ", style="mismatch")
-    primary_text.append(f"{extra_target_cnt}\n")
-    primary_text.append("无效规则: ", style="mismatch")
-    primary_text.append(f"{extraneous_count}")
-    summary_table.add_row("[bold]主对象 (TABLE/VIEW/etc.)[/bold]", primary_text)
-
-    comment_text = Text()
-    if comment_skip_reason:
-        comment_text.append(str(comment_skip_reason), style="info")
-    else:
-        comment_text.append("一致: ", style="ok")
-        comment_text.append(f"{comment_ok_cnt}\n")
-        comment_text.append("差异: ", style="mismatch")
-        comment_text.append(f"{comment_mis_cnt}")
-    summary_table.add_row("[bold]注释一致性[/bold]", comment_text)
-
-    ext_text = Text()
-    ext_text.append("索引: ", style="info")
-    ext_text.append(f"一致 {idx_ok_cnt} / ", style="ok")
-    ext_text.append(f"差异 {idx_mis_cnt}\n", style="mismatch")
-    ext_text.append("约束: ", style="info")
-    ext_text.append(f"一致 {cons_ok_cnt} / ", style="ok")
-    ext_text.append(f"差异 {cons_mis_cnt}\n", style="mismatch")
-    ext_text.append("序列: ", style="info")
-    ext_text.append(f"一致 {seq_ok_cnt} / ", style="ok")
-    ext_text.append(f"差异 {seq_mis_cnt}\n", style="mismatch")
-    ext_text.append("触发器: ", style="info")
-    ext_text.append(f"一致 {trg_ok_cnt} / ", style="ok")
-    ext_text.append(f"差异 {trg_mis_cnt}", style="mismatch")
-    summary_table.add_row("[bold]扩展对象 (INDEX/SEQ/etc.)[/bold]", ext_text)
-
-    dep_text = Text()
-    dep_text.append("缺失依赖: ", style="missing")
-    dep_text.append(f"{dep_missing_cnt}  ")
-    dep_text.append("额外依赖: ", style="mismatch")
-    dep_text.append(f"{dep_unexpected_cnt}  ")
-    dep_text.append("跳过: ", style="info")
-    dep_text.append(f"{dep_skipped_cnt}")
-    summary_table.add_row("[bold]依赖关系[/bold]", dep_text)
-
-    grant_text = Text()
-    grant_text.append("GRANT 语句数: ", style="info")
-    grant_text.append(str(grant_stmt_cnt))
-    summary_table.add_row("[bold]授权建议[/bold]", grant_text)
-    console.print(summary_table)
-    console.print("")
-    console.print("")
-
-    def summarize_actions() -> Panel:
-        modify_counts = OrderedDict()
-        modify_counts["TABLE (列差异修补)"] = len(tv_results.get('mismatched', []))
-
-        addition_counts: Dict[str, int] = defaultdict(int)
-        for obj_type, _, _ in tv_results.get('missing', []):
-            addition_counts[obj_type.upper()] += 1
-        for item in extra_results.get("index_mismatched", []):
-            addition_counts["INDEX"] += len(item.missing_indexes)
-        for item in extra_results.get("constraint_mismatched", []):
-            addition_counts["CONSTRAINT"] += len(item.missing_constraints)
-        for item in extra_results.get("sequence_mismatched", []):
-            addition_counts["SEQUENCE"] += len(item.missing_sequences)
-        for item in extra_results.get("trigger_mismatched", []):
-            addition_counts["TRIGGER"] += len(item.missing_triggers)
-
-        def format_block(title: str, data: OrderedDict) -> str:
-            lines = [f"[bold]{title}[/bold]"]
-            entries = [(k, v) for k, v in data.items() if v > 0]
-            if not entries:
-                lines.append("  - 无")
-            else:
-                for k, v in entries:
-                    lines.append(f"  - {k}: {v}")
-            return "\n".join(lines)
 
-        def format_add_block(title: str, data_map: Dict[str, int]) -> str:
-            lines = [f"[bold]{title}[/bold]"]
-            entries = [(k, v) for k, v in sorted(data_map.items()) if v > 0]
-            if not entries:
-                lines.append("  - 无")
-            else:
-                for k, v in entries:
-                    lines.append(f"  - {k}: {v}")
-            return "\n".join(lines)
-
-        text = "\n\n".join([
-            format_block("需要在目标端修改的对象", modify_counts),
-            format_add_block("需要在目标端新增的对象", addition_counts)
-        ])
-        return Panel.fit(text, title="[info]执行摘要", border_style="info", width=section_width)
-
-    console.print(summarize_actions())
-
-    if schema_summary:
-        schema_table = Table(title="[header]0.a Schema 覆盖详情", width=section_width)
-        schema_table.add_column("类别", style="info", width=36)
-        schema_table.add_column("Schema 列表", style="info")
-        has_row = False
-        if schema_summary.get("source_missing"):
-            schema_table.add_row(
-                "源端未获取到对象",
-                ", ".join(schema_summary["source_missing"])
-            )
-            has_row = True
-        if has_row:
-            console.print(schema_table)
-
-    if object_counts_summary:
-        count_table = Table(title="[header]0.b 检查汇总", **count_table_kwargs)
-        count_table.add_column("对象类型", style="info", width=TYPE_COL_WIDTH)
-        count_table.add_column("Oracle (应校验)", justify="right", width=18)
-        count_table.add_column("OceanBase (命中)", justify="right", width=18)
-        count_table.add_column("缺失", justify="right", width=8)
-        count_table.add_column("多余", justify="right", width=8)
-        oracle_counts = object_counts_summary.get("oracle", {})
-        ob_counts = object_counts_summary.get("oceanbase", {})
-        missing_counts = object_counts_summary.get("missing", {})
-        extra_counts = object_counts_summary.get("extra", {})
-        for obj_type in OBJECT_COUNT_TYPES:
-            ora_val = oracle_counts.get(obj_type, 0)
-            ob_val = ob_counts.get(obj_type, 0)
-            miss_val = missing_counts.get(obj_type, 0)
-            extra_val = extra_counts.get(obj_type, 0)
-            count_table.add_row(
-                obj_type,
-                str(ora_val),
-                str(ob_val),
-                f"[missing]{miss_val}[/missing]" if miss_val else "0",
-                f"[mismatch]{extra_val}[/mismatch]" if extra_val else "0"
-            )
-        console.print(count_table)
-
-    # --- 1. 缺失的主对象 ---
-    if tv_results['missing']:
-        table = Table(title=f"[header]1. 缺失的主对象 (共 {missing_count} 个) — 按目标 schema 分组[/header]", width=section_width)
-        SCHEMA_COL_WIDTH = 18
-        table.add_column("目标 Schema", style="info", width=SCHEMA_COL_WIDTH)
-        table.add_column("类型", style="info", width=TYPE_COL_WIDTH)
-        table.add_column("源对象=目标对象(应存在)", style="info")
-
-        grouped_missing: Dict[str, List[Tuple[str, str, str]]] = defaultdict(list)
-        for obj_type, tgt_name, src_name in tv_results['missing']:
-            tgt_schema = tgt_name.split('.')[0] if '.' in tgt_name else tgt_name
-            grouped_missing[tgt_schema.upper()].append((obj_type, tgt_name, src_name))
-
-        grouped_items = sorted(grouped_missing.items())
-        for tgt_schema, items in grouped_items:
-            sorted_items = sorted(items, key=lambda x: (x[0], x[1], x[2]))
-            for idx, (obj_type, tgt_name, src_name) in enumerate(sorted_items):
-                table.add_row(
-                    tgt_schema if idx == 0 else "",
-                    f"[{obj_type}]",
-                    f"{src_name}={tgt_name}",
-                    end_section=(idx == len(sorted_items) - 1)
+    try:
+        ok_count = len(tv_results['ok'])
+        missing_count = len(tv_results['missing'])
+        mismatched_count = len(tv_results['mismatched'])
+        extraneous_count = len(tv_results['extraneous'])
+        idx_ok_cnt = len(extra_results.get("index_ok", []))
+        idx_mis_cnt = len(extra_results.get("index_mismatched", []))
+        cons_ok_cnt = len(extra_results.get("constraint_ok", []))
+        cons_mis_cnt = len(extra_results.get("constraint_mismatched", []))
+        seq_ok_cnt = len(extra_results.get("sequence_ok", []))
+        seq_mis_cnt = len(extra_results.get("sequence_mismatched", []))
+        trg_ok_cnt = len(extra_results.get("trigger_ok", []))
+        trg_mis_cnt = len(extra_results.get("trigger_mismatched", []))
+        comment_ok_cnt = len(comment_results.get("ok", []))
+        comment_mis_cnt = len(comment_results.get("mismatched", []))
+        comment_skip_reason = comment_results.get("skipped_reason")
+        extra_target_cnt = len(tv_results.get('extra_targets', []))
+        dep_missing_cnt = len(dependency_report.get("missing", []))
+        dep_unexpected_cnt = len(dependency_report.get("unexpected", []))
+        dep_skipped_cnt = len(dependency_report.get("skipped", []))
+        grant_stmt_cnt = sum(len(entries) for entries in required_grants.values())
+        source_missing_schema_cnt = len(schema_summary.get("source_missing", []))
+
+        # 整份报告先写入 Console 缓冲区，退出时一次性输出（并同步写入 record 缓冲）
+        with console:
+            console.print(REPORT_TITLE_PANEL)
+
+            section_width = 140
+            count_table_kwargs: Dict[str, object] = {"width": section_width, "expand": False}
+            TYPE_COL_WIDTH = 16
+            OBJECT_COL_WIDTH = 42
+            DETAIL_COL_WIDTH = 90
+
+            def format_endpoint_block(info: Dict[str, str], is_oracle: bool) -> str:
+                lines: List[str] = []
+                if not info:
+                    return "无可用信息"
+                if info.get("version"):
+                    lines.append(f"版本: {info['version']}")
+                if is_oracle:
+                    if info.get("cdb_mode"):
+                        lines.append(f"CDB/PDB: {info['cdb_mode']}")
+                    if info.get("container"):
+                        lines.append(f"容器: {info['container']}")
+                    if info.get("service_name"):
+                        lines.append(f"服务名: {info['service_name']}")
+                else:
+                    if info.get("current_database"):
+                        lines.append(f"当前库: {info['current_database']}")
+                    if info.get("connection_id"):
+                        lines.append(f"连接 ID: {info['connection_id']}")
+                    if info.get("ssl"):
+                        lines.append(f"SSL: {info['ssl']}")
+                host = info.get("host")
+                port = info.get("port")
+                if host or port:
+                    lines.append(f"地址: {host or ''}:{port or ''}")
+                user_label = "连接用户" if is_oracle else "当前用户"
+                user_value = info.get("current_user") or info.get("user") or info.get("configured_user", "")
+                if is_oracle and user_value:
+                    user_value = str(user_value).upper()
+                lines.append(f"{user_label}: {user_value}")
+                if is_oracle and info.get("dsn"):
+                    lines.append(f"DSN: {info['dsn']}")
+                return "\n".join([line for line in lines if line.strip()]) or "无可用信息"
+
+            if endpoint_info:
+                src_info = endpoint_info.get("oracle", {})
+                tgt_info = endpoint_info.get("oceanbase", {})
+                env_table = Table(title="[header]源/目标环境", width=section_width)
+                env_table.add_column("源 (Oracle)", width=section_width // 2)
+                env_table.add_column("目标 (OceanBase)", width=section_width // 2)
+                env_table.add_row(
+                    format_endpoint_block(src_info, True),
+                    format_endpoint_block(tgt_info, False)
                 )
-        console.print(table)
-
-    if tv_results.get('extra_targets'):
-        extra_target_count = len(tv_results['extra_targets'])
-        table = Table(title=f"[header]1.b 目标端多出的对象 (共 {extra_target_count} 个)", width=section_width)
-        table.add_column("类型", style="info", width=TYPE_COL_WIDTH)
-        table.add_column("目标对象(多余)", style="info")
-        for obj_type, tgt_name in tv_results['extra_targets']:
-            table.add_row(f"[{obj_type}]", tgt_name)
-        console.print(table)
-
-    # --- 2. 列不匹配的表 ---
-    if tv_results['mismatched']:
-        table = Table(title=f"[header]2. 不匹配的表 (共 {mismatched_count} 个)", width=section_width)
-        table.add_column("表名", style="info", width=OBJECT_COL_WIDTH)
-        table.add_column("差异详情", width=DETAIL_COL_WIDTH)
-        for obj_type, tgt_name, missing, extra, length_mismatches in tv_results['mismatched']:
-            details = Text()
-            if "获取失败" in tgt_name:
-                details.append(f"源端列信息获取失败", style="missing")
+                console.print(env_table)
+                console.print("")
+
+            # --- 综合概要 ---
+            summary_table = Table(
+                title="[header]综合概要",
+                show_header=False,
+                box=None,
+                width=section_width,
+                pad_edge=False,
+                padding=(0, 1)
+            )
+            summary_table.add_column("Category", justify="left", width=24, no_wrap=True)
+            summary_table.add_column("Details", justify="left", width=section_width - 28)
+
+            schema_text = Text()
+            schema_text.append("源 schema 未获取到对象: ", style="mismatch")
+            schema_text.append(f"{source_missing_schema_cnt}")
+            summary_table.add_row("[bold]Schema 覆盖[/bold]", schema_text)
+
+            primary_text = Text()
+            primary_text.append(f"总计校验对象 (来自源库): {total_checked}\n")
+            primary_text.append("一致: ", style="ok")
+            primary_text.append(f"{ok_count}\n")
+            primary_text.append("缺失: ", style="missing")
+            primary_text.append(f"{missing_count}\n")
+            primary_text.append("不匹配 (表列/长度): ", style="mismatch")
+            primary_text.append(f"{mismatched_count}\n")
+            primary_text.append("多余: ", style="mismatch")
+            primary_text.append(f"{extra_target_cnt}\n")
+            primary_text.append("无效规则: ", style="mismatch")
+            primary_text.append(f"{extraneous_count}")
+            summary_table.add_row("[bold]主对象 (TABLE/VIEW/etc.)[/bold]", primary_text)
+
+            comment_text = Text()
+            if comment_skip_reason:
+                comment_text.append(str(comment_skip_reason), style="info")
             else:
-                if missing:
-                    details.append(f"- 缺失列: {sorted(list(missing))}\n", style="missing")
-                if extra:
-                    details.append(f"+ 多余列: {sorted(list(extra))}\n", style="mismatch")
-                if length_mismatches:
-                    details.append("* 长度不匹配 (VARCHAR/2):\n", style="mismatch")
-                    for issue in length_mismatches:
-                        col, src_len, tgt_len, limit_len, issue_type = issue
-                        if issue_type == 'short':
-                            details.append(
-                                f"    - {col}: 源={src_len}, 目标={tgt_len}, 期望下限={limit_len}\n"
-                            )
-                        else:
-                            details.append(
-                                f"    - {col}: 源={src_len}, 目标={tgt_len}, 上限允许={limit_len}\n"
-                            )
-            table.add_row(tgt_name, details)
-        console.print(table)
-
-    comment_mismatches = comment_results.get("mismatched", [])
-    if comment_skip_reason:
-        console.print(Panel.fit(str(comment_skip_reason), style="info", width=section_width))
-    if comment_mismatches:
-        table = Table(title=f"[header]3. 表/列注释一致性检查 (共 {len(comment_mismatches)} 张表差异)", width=section_width)
-        table.add_column("表名", style="info", width=OBJECT_COL_WIDTH)
-        table.add_column("差异详情", width=DETAIL_COL_WIDTH)
-        for item in comment_mismatches:
-            details = Text()
-            if item.table_comment:
-                src_cmt, tgt_cmt = item.table_comment
-                details.append(
-                    f"* 表注释不一致: src={shorten_comment_preview(src_cmt)}, "
-                    f"tgt={shorten_comment_preview(tgt_cmt)}\n",
-                    style="mismatch"
-                )
-            if item.missing_columns:
-                details.append(f"- 缺失列注释: {sorted(item.missing_columns)}\n", style="missing")
-            if item.extra_columns:
-                details.append(f"+ 额外列注释: {sorted(item.extra_columns)}\n", style="mismatch")
-            for col, src_cmt, tgt_cmt in item.column_comment_diffs:
-                details.append(
-                    f"  - {col}: src={shorten_comment_preview(src_cmt)}, "
-                    f"tgt={shorten_comment_preview(tgt_cmt)}\n"
-                )
-            table.add_row(item.table, details)
-        console.print(table)
-
-    # --- 3. 扩展对象差异 ---
-    def print_ext_mismatch_table(title, items, headers, render_func):
-        if not items:
-            return
-        table = Table(title=f"[header]{title} (共 {len(items)} 项差异)", width=section_width)
-        table.add_column(headers[0], style="info", width=OBJECT_COL_WIDTH)
-        table.add_column(headers[1], width=DETAIL_COL_WIDTH)
-        for item in items:
-            table.add_row(*render_func(item))
-        console.print(table)
-
-    print_ext_mismatch_table(
-        "5. 索引一致性检查", extra_results["index_mismatched"], ["表名", "差异详情"],
-        lambda item: (
-            Text(item.table),
-            Text(f"- 缺失: {sorted(item.missing_indexes)}\n" if item.missing_indexes else "", style="missing") +
-            Text(f"+ 多余: {sorted(item.extra_indexes)}\n" if item.extra_indexes else "", style="mismatch") +
-            Text('\n'.join([f"* {d}" for d in item.detail_mismatch]))
-        )
-    )
-    print_ext_mismatch_table(
-        "6. 约束 (PK/UK/FK) 一致性检查", extra_results["constraint_mismatched"], ["表名", "差异详情"],
-        lambda item: (
-            Text(item.table),
-            Text(f"- 缺失: {sorted(item.missing_constraints)}\n" if item.missing_constraints else "", style="missing") +
-            Text(f"+ 多余: {sorted(item.extra_constraints)}\n" if item.extra_constraints else "", style="mismatch") +
-            Text('\n'.join([f"* {d}" for d in item.detail_mismatch]))
-        )
-    )
-    print_ext_mismatch_table(
-        "7. 序列 (SEQUENCE) 一致性检查", extra_results["sequence_mismatched"], ["Schema 映射", "差异详情"],
-        lambda item: (
-            Text(f"{item.src_schema}->{item.tgt_schema}"),
-            (
-                Text("- 缺失:\n", style="missing") +
-                Text(
-                    "\n".join([f"{src}={tgt}" for src, tgt in item.missing_mappings]) + ("\n" if item.missing_mappings else ""),
-                    style="missing"
+                comment_text.append("一致: ", style="ok")
+                comment_text.append(f"{comment_ok_cnt}\n")
+                comment_text.append("差异: ", style="mismatch")
+                comment_text.append(f"{comment_mis_cnt}")
+            summary_table.add_row("[bold]注释一致性[/bold]", comment_text)
+
+            ext_text = Text()
+            ext_text.append("索引: ", style="info")
+            ext_text.append(f"一致 {idx_ok_cnt} / ", style="ok")
+            ext_text.append(f"差异 {idx_mis_cnt}\n", style="mismatch")
+            ext_text.append("约束: ", style="info")
+            ext_text.append(f"一致 {cons_ok_cnt} / ", style="ok")
+            ext_text.append(f"差异 {cons_mis_cnt}\n", style="mismatch")
+            ext_text.append("序列: ", style="info")
+            ext_text.append(f"一致 {seq_ok_cnt} / ", style="ok")
+            ext_text.append(f"差异 {seq_mis_cnt}\n", style="mismatch")
+            ext_text.append("触发器: ", style="info")
+            ext_text.append(f"一致 {trg_ok_cnt} / ", style="ok")
+            ext_text.append(f"差异 {trg_mis_cnt}", style="mismatch")
+            summary_table.add_row("[bold]扩展对象 (INDEX/SEQ/etc.)[/bold]", ext_text)
+
+            dep_text = Text()
+            dep_text.append("缺失依赖: ", style="missing")
+            dep_text.append(f"{dep_missing_cnt}  ")
+            dep_text.append("额外依赖: ", style="mismatch")
+            dep_text.append(f"{dep_unexpected_cnt}  ")
+            dep_text.append("跳过: ", style="info")
+            dep_text.append(f"{dep_skipped_cnt}")
+            summary_table.add_row("[bold]依赖关系[/bold]", dep_text)
+
+            grant_text = Text()
+            grant_text.append("GRANT 语句数: ", style="info")
+            grant_text.append(str(grant_stmt_cnt))
+            summary_table.add_row("[bold]授权建议[/bold]", grant_text)
+            console.print(summary_table)
+            console.print("")
+            console.print("")
+
+            def summarize_actions() -> Panel:
+                modify_counts = OrderedDict()
+                modify_counts["TABLE (列差异修补)"] = len(tv_results.get('mismatched', []))
+
+                addition_counts: Dict[str, int] = defaultdict(int)
+                for obj_type, _, _ in tv_results.get('missing', []):
+                    addition_counts[obj_type.upper()] += 1
+                for item in extra_results.get("index_mismatched", []):
+                    addition_counts["INDEX"] += len(item.missing_indexes)
+                for item in extra_results.get("constraint_mismatched", []):
+                    addition_counts["CONSTRAINT"] += len(item.missing_constraints)
+                for item in extra_results.get("sequence_mismatched", []):
+                    addition_counts["SEQUENCE"] += len(item.missing_sequences)
+                for item in extra_results.get("trigger_mismatched", []):
+                    addition_counts["TRIGGER"] += len(item.missing_triggers)
+
+                def format_block(title: str, data: OrderedDict) -> str:
+                    lines = [f"[bold]{title}[/bold]"]
+                    entries = [(k, v) for k, v in data.items() if v > 0]
+                    if not entries:
+                        lines.append("  - 无")
+                    else:
+                        for k, v in entries:
+                            lines.append(f"  - {k}: {v}")
+                    return "\n".join(lines)
+
+                def format_add_block(title: str, data_map: Dict[str, int]) -> str:
+                    lines = [f"[bold]{title}[/bold]"]
+                    entries = [(k, v) for k, v in sorted(data_map.items()) if v > 0]
+                    if not entries:
+                        lines.append("  - 无")
+                    else:
+                        for k, v in entries:
+                            lines.append(f"  - {k}: {v}")
+                    return "\n".join(lines)
+
+                text = "\n\n".join([
+                    format_block("需要在目标端修改的对象", modify_counts),
+                    format_add_block("需要在目标端新增的对象", addition_counts)
+                ])
+                return Panel.fit(text, title="[info]执行摘要", border_style="info", width=section_width)
+
+            console.print(summarize_actions())
+
+            if schema_summary:
+                schema_table = Table(title="[header]0.a Schema 覆盖详情", width=section_width)
+                schema_table.add_column("类别", style="info", width=36)
+                schema_table.add_column("Schema 列表", style="info")
+                has_row = False
+                if schema_summary.get("source_missing"):
+                    schema_table.add_row(
+                        "源端未获取到对象",
+                        ", ".join(schema_summary["source_missing"])
+                    )
+                    has_row = True
+                if has_row:
+                    console.print(schema_table)
+
+            if object_counts_summary:
+                count_table = Table(title="[header]0.b 检查汇总", **count_table_kwargs)
+                count_table.add_column("对象类型", style="info", width=TYPE_COL_WIDTH)
+                count_table.add_column("Oracle (应校验)", justify="right", width=18)
+                count_table.add_column("OceanBase (命中)", justify="right", width=18)
+                count_table.add_column("缺失", justify="right", width=8)
+                count_table.add_column("多余", justify="right", width=8)
+                oracle_counts = object_counts_summary.get("oracle", {})
+                ob_counts = object_counts_summary.get("oceanbase", {})
+                missing_counts = object_counts_summary.get("missing", {})
+                extra_counts = object_counts_summary.get("extra", {})
+                for obj_type in OBJECT_COUNT_TYPES:
+                    ora_val = oracle_counts.get(obj_type, 0)
+                    ob_val = ob_counts.get(obj_type, 0)
+                    miss_val = missing_counts.get(obj_type, 0)
+                    extra_val = extra_counts.get(obj_type, 0)
+                    count_table.add_row(
+                        obj_type,
+                        str(ora_val),
+                        str(ob_val),
+                        f"[missing]{miss_val}[/missing]" if miss_val else "0",
+                        f"[mismatch]{extra_val}[/mismatch]" if extra_val else "0"
+                    )
+                console.print(count_table)
+
+            # --- 1. 缺失的主对象 ---
+            if tv_results['missing']:
+                table = Table(title=f"[header]1. 缺失的主对象 (共 {missing_count} 个) — 按目标 schema 分组[/header]", width=section_width)
+                SCHEMA_COL_WIDTH = 18
+                table.add_column("目标 Schema", style="info", width=SCHEMA_COL_WIDTH)
+                table.add_column("类型", style="info", width=TYPE_COL_WIDTH)
+                table.add_column("源对象=目标对象(应存在)", style="info")
+
+                grouped_missing: Dict[str, List[Tuple[str, str, str]]] = defaultdict(list)
+                for obj_type, tgt_name, src_name in tv_results['missing']:
+                    tgt_schema = tgt_name.split('.')[0] if '.' in tgt_name else tgt_name
+                    grouped_missing[tgt_schema.upper()].append((obj_type, tgt_name, src_name))
+
+                grouped_items = sorted(grouped_missing.items())
+                for tgt_schema, items in grouped_items:
+                    sorted_items = sorted(items, key=lambda x: (x[0], x[1], x[2]))
+                    for idx, (obj_type, tgt_name, src_name) in enumerate(sorted_items):
+                        table.add_row(
+                            tgt_schema if idx == 0 else "",
+                            f"[{obj_type}]",
+                            f"{src_name}={tgt_name}",
+                            end_section=(idx == len(sorted_items) - 1)
+                        )
+                console.print(table)
+
+            if tv_results.get('extra_targets'):
+                extra_target_count = len(tv_results['extra_targets'])
+                table = Table(title=f"[header]1.b 目标端多出的对象 (共 {extra_target_count} 个)", width=section_width)
+                table.add_column("类型", style="info", width=TYPE_COL_WIDTH)
+                table.add_column("目标对象(多余)", style="info")
+                for obj_type, tgt_name in tv_results['extra_targets']:
+                    table.add_row(f"[{obj_type}]", tgt_name)
+                console.print(table)
+
+            # --- 2. 列不匹配的表 ---
+            if tv_results['mismatched']:
+                table = Table(title=f"[header]2. 不匹配的表 (共 {mismatched_count} 个)", width=section_width)
+                table.add_column("表名", style="info", width=OBJECT_COL_WIDTH)
+                table.add_column("差异详情", width=DETAIL_COL_WIDTH)
+                for obj_type, tgt_name, missing, extra, length_mismatches in tv_results['mismatched']:
+                    details = Text()
+                    if "获取失败" in tgt_name:
+                        details.append(f"源端列信息获取失败", style="missing")
+                    else:
+                        if missing:
+                            details.append(f"- 缺失列: {sorted(list(missing))}\n", style="missing")
+                        if extra:
+                            details.append(f"+ 多余列: {sorted(list(extra))}\n", style="mismatch")
+                        if length_mismatches:
+                            details.append("* 长度不匹配 (VARCHAR/2):\n", style="mismatch")
+                            for issue in length_mismatches:
+                                col, src_len, tgt_len, limit_len, issue_type = issue
+                                if issue_type == 'short':
+                                    details.append(
+                                        f"    - {col}: 源={src_len}, 目标={tgt_len}, 期望下限={limit_len}\n"
+                                    )
+                                else:
+                                    details.append(
+                                        f"    - {col}: 源={src_len}, 目标={tgt_len}, 上限允许={limit_len}\n"
+                                    )
+                    table.add_row(tgt_name, details)
+                console.print(table)
+
+            comment_mismatches = comment_results.get("mismatched", [])
+            if comment_skip_reason:
+                console.print(Panel.fit(str(comment_skip_reason), style="info", width=section_width))
+            if comment_mismatches:
+                table = Table(title=f"[header]3. 表/列注释一致性检查 (共 {len(comment_mismatches)} 张表差异)", width=section_width)
+                table.add_column("表名", style="info", width=OBJECT_COL_WIDTH)
+                table.add_column("差异详情", width=DETAIL_COL_WIDTH)
+                for item in comment_mismatches:
+                    details = Text()
+                    if item.table_comment:
+                        src_cmt, tgt_cmt = item.table_comment
+                        details.append(
+                            f"* 表注释不一致: src={shorten_comment_preview(src_cmt)}, "
+                            f"tgt={shorten_comment_preview(tgt_cmt)}\n",
+                            style="mismatch"
+                        )
+                    if item.missing_columns:
+                        details.append(f"- 缺失列注释: {sorted(item.missing_columns)}\n", style="missing")
+                    if item.extra_columns:
+                        details.append(f"+ 额外列注释: {sorted(item.extra_columns)}\n", style="mismatch")
+                    for col, src_cmt, tgt_cmt in item.column_comment_diffs:
+                        details.append(
+                            f"  - {col}: src={shorten_comment_preview(src_cmt)}, "
+                            f"tgt={shorten_comment_preview(tgt_cmt)}\n"
+                        )
+                    table.add_row(item.table, details)
+                console.print(table)
+
+            # --- 3. 扩展对象差异 ---
+            def print_ext_mismatch_table(title, items, headers, render_func):
+                if not items:
+                    return
+                table = Table(title=f"[header]{title} (共 {len(items)} 项差异)", width=section_width)
+                table.add_column(headers[0], style="info", width=OBJECT_COL_WIDTH)
+                table.add_column(headers[1], width=DETAIL_COL_WIDTH)
+                for item in items:
+                    table.add_row(*render_func(item))
+                console.print(table)
+
+            # 各段 (文本, 样式) 由 Text.assemble 一次拼装，避免 Text + Text 逐步生成中间对象
+            print_ext_mismatch_table(
+                "5. 索引一致性检查", extra_results["index_mismatched"], ["表名", "差异详情"],
+                lambda item: (
+                    Text(item.table),
+                    Text.assemble(
+                        (f"- 缺失: {list(item.missing_indexes)}\n" if item.missing_indexes else "", "missing"),
+                        (f"+ 多余: {list(item.extra_indexes)}\n" if item.extra_indexes else "", "mismatch"),
+                        '\n'.join([f"* {d}" for d in item.detail_mismatch])
+                    )
                 )
-                if item.missing_sequences else Text("")
-            )
-            + (
-                Text(f"+ 多余: {sorted(item.extra_sequences)}\n", style="mismatch")
-                if item.extra_sequences else Text("")
-            )
-            + (Text(f"* {item.note}\n", style="missing") if item.note else Text(""))
-        )
-    )
-    print_ext_mismatch_table(
-        "8. 触发器 (TRIGGER) 一致性检查", extra_results["trigger_mismatched"], ["表名", "差异详情"],
-        lambda item: (
-            Text(item.table),
-            (
-                Text("- 缺失:\n", style="missing")
-                if item.missing_triggers else Text("")
             )
-            + (
-                Text(
-                    "\n".join([f"{src}={tgt}" for src, tgt in item.missing_mappings]) + ("\n" if item.missing_mappings else ""),
-                    style="missing"
+            print_ext_mismatch_table(
+                "6. 约束 (PK/UK/FK) 一致性检查", extra_results["constraint_mismatched"], ["表名", "差异详情"],
+                lambda item: (
+                    Text(item.table),
+                    Text.assemble(
+                        (f"- 缺失: {list(item.missing_constraints)}\n" if item.missing_constraints else "", "missing"),
+                        (f"+ 多余: {list(item.extra_constraints)}\n" if item.extra_constraints else "", "mismatch"),
+                        '\n'.join([f"* {d}" for d in item.detail_mismatch])
+                    )
                 )
-                if item.missing_mappings else Text("")
             )
-            + (
-                Text(f"+ 多余: {sorted(item.extra_triggers)}\n", style="mismatch")
-                if item.extra_triggers else Text("")
+            print_ext_mismatch_table(
+                "7. 序列 (SEQUENCE) 一致性检查", extra_results["sequence_mismatched"], ["Schema 映射", "差异详情"],
+                lambda item: (
+                    Text(f"{item.src_schema}->{item.tgt_schema}"),
+                    Text.assemble(
+                        (
+                            "- 缺失:\n"
+                            + "\n".join([f"{src}={tgt}" for src, tgt in item.missing_mappings])
+                            + ("\n" if item.missing_mappings else "")
+                            if item.missing_sequences else "",
+                            "missing"
+                        ),
+                        (f"+ 多余: {list(item.extra_sequences)}\n" if item.extra_sequences else "", "mismatch"),
+                        (f"* {item.note}\n" if item.note else "", "missing")
+                    )
+                )
             )
-            + Text('\n'.join([f"* {d}" for d in item.detail_mismatch]))
-        )
-    )
-
-    dep_total = dep_missing_cnt + dep_unexpected_cnt + dep_skipped_cnt
-    if dep_total:
-        dep_table = Table(title=f"[header]9. 依赖关系校验 (共 {dep_total} 项)", width=section_width)
-        dep_table.add_column("类别", style="info", width=12)
-        dep_table.add_column("依赖对象", style="info", width=OBJECT_COL_WIDTH)
-        dep_table.add_column("依赖类型", style="info", width=TYPE_COL_WIDTH)
-        dep_table.add_column("被依赖对象", style="info", width=OBJECT_COL_WIDTH)
-        dep_table.add_column("被依赖类型", style="info", width=TYPE_COL_WIDTH)
-        dep_table.add_column("修复建议", width=DETAIL_COL_WIDTH)
-
-        def render_dep_rows(label: str, entries: List[DependencyIssue], style: str) -> None:
-            for issue in entries:
-                dep_table.add_row(
-                    f"[{style}]{label}[/{style}]",
-                    issue.dependent,
-                    issue.dependent_type,
-                    issue.referenced,
-                    issue.referenced_type,
-                    issue.reason
+            print_ext_mismatch_table(
+                "8. 触发器 (TRIGGER) 一致性检查", extra_results["trigger_mismatched"], ["表名", "差异详情"],
+                lambda item: (
+                    Text(item.table),
+                    Text.assemble(
+                        ("- 缺失:\n" if item.missing_triggers else "", "missing"),
+                        (
+                            "\n".join([f"{src}={tgt}" for src, tgt in item.missing_mappings]) + "\n"
+                            if item.missing_mappings else "",
+                            "missing"
+                        ),
+                        (f"+ 多余: {list(item.extra_triggers)}\n" if item.extra_triggers else "", "mismatch"),
+                        '\n'.join([f"* {d}" for d in item.detail_mismatch])
+                    )
                 )
+            )
 
-        render_dep_rows("缺失", dependency_report.get("missing", []), "missing")
-        render_dep_rows("额外", dependency_report.get("unexpected", []), "mismatch")
-        render_dep_rows("跳过", dependency_report.get("skipped", []), "info")
-        console.print(dep_table)
-
-    if required_grants:
-        grant_table = Table(title=f"[header]10. 授权建议 (共 {grant_stmt_cnt} 条)", width=section_width)
-        grant_table.add_column("授权对象", style="info", width=OBJECT_COL_WIDTH)
-        grant_table.add_column("语句", width=DETAIL_COL_WIDTH)
-        for grantee, entries in sorted(required_grants.items()):
-            lines = [
-                f"GRANT {priv} ON {obj} TO {grantee};"
-                for priv, obj in sorted(entries)
-            ]
-            grant_table.add_row(grantee, "\n".join(lines))
-        console.print(grant_table)
-
-    # --- 4. 无效 Remap 规则 ---
-    if tv_results['extraneous']:
-        table = Table(title=f"[header]4. 无效的 Remap 规则 (共 {extraneous_count} 个)", width=section_width)
-        table.add_column("在 remap_rules.txt 中定义, 但在源端 Oracle 中未找到的对象", style="info", width=section_width - 6)
-        for item in tv_results['extraneous']:
-            table.add_row(item, style="mismatch")
-        console.print(table)
-
-    # --- 提示 ---
-    fixup_panel = Panel.fit(
-        "[bold]Fixup 脚本生成目录[/bold]\n\n"
-        "fixup_scripts/table         : 缺失 TABLE 的 CREATE 脚本\n"
-        "fixup_scripts/view          : 缺失 VIEW 的 CREATE 脚本\n"
-        "fixup_scripts/materialized_view : 缺失 MATERIALIZED VIEW 的 CREATE 脚本\n"
-        "fixup_scripts/procedure     : 缺失 PROCEDURE 的 CREATE 脚本\n"
-        "fixup_scripts/function      : 缺失 FUNCTION 的 CREATE 脚本\n"
-        "fixup_scripts/package       : 缺失 PACKAGE 的 CREATE 脚本\n"
-        "fixup_scripts/package_body  : 缺失 PACKAGE BODY 的 CREATE 脚本\n"
-        "fixup_scripts/synonym       : 缺失 SYNONYM 的 CREATE 脚本\n"
-        "fixup_scripts/job           : 缺失 JOB 的 CREATE 脚本\n"
-        "fixup_scripts/schedule      : 缺失 SCHEDULE 的 CREATE 脚本\n"
-        "fixup_scripts/type          : 缺失 TYPE 的 CREATE 脚本\n"
-        "fixup_scripts/type_body     : 缺失 TYPE BODY 的 CREATE 脚本\n"
-        "fixup_scripts/index         : 缺失 INDEX 的 CREATE 脚本\n"
-        "fixup_scripts/constraint    : 缺失约束的 CREATE 脚本\n"
-        "fixup_scripts/sequence      : 缺失 SEQUENCE 的 CREATE 脚本\n"
-        "fixup_scripts/trigger       : 缺失 TRIGGER 的 CREATE 脚本\n"
-        "fixup_scripts/compile       : 依赖重编译脚本 (ALTER ... COMPILE)\n"
-        "fixup_scripts/grants        : 依赖对象所需的授权脚本\n"
-        "fixup_scripts/table_alter   : 列不匹配 TABLE 的 ALTER 修补脚本\n\n"
-        "[bold]请在 OceanBase 执行前逐一人工审核上述脚本。[/bold]",
-        title="[info]提示",
-        border_style="info"
-    )
-    console.print(fixup_panel)
-    console.print(Panel.fit("[bold]报告结束[/bold]", style="title"))
+            dep_total = dep_missing_cnt + dep_unexpected_cnt + dep_skipped_cnt
+            if dep_total:
+                dep_table = Table(title=f"[header]9. 依赖关系校验 (共 {dep_total} 项)", width=section_width)
+                dep_table.add_column("类别", style="info", width=12)
+                dep_table.add_column("依赖对象", style="info", width=OBJECT_COL_WIDTH)
+                dep_table.add_column("依赖类型", style="info", width=TYPE_COL_WIDTH)
+                dep_table.add_column("被依赖对象", style="info", width=OBJECT_COL_WIDTH)
+                dep_table.add_column("被依赖类型", style="info", width=TYPE_COL_WIDTH)
+                dep_table.add_column("修复建议", width=DETAIL_COL_WIDTH)
+
+                def render_dep_rows(label: str, entries: List[DependencyIssue], style: str) -> None:
+                    for issue in entries:
+                        dep_table.add_row(
+                            f"[{style}]{label}[/{style}]",
+                            issue.dependent,
+                            issue.dependent_type,
+                            issue.referenced,
+                            issue.referenced_type,
+                            issue.reason
+                        )
 
-    if report_file:
-        report_path = Path(report_file)
-        export_dir = export_missing_table_view_mappings(tv_results, report_path.parent)
-        try:
-            report_path.parent.mkdir(parents=True, exist_ok=True)
-            report_text = console.export_text(clear=False)
-            # 生成便于 vi/less 查看且无颜色/框线的纯文本报告
-            plain_text = strip_ansi_text(report_text).translate(BOX_ASCII_TRANS)
-            report_path.write_text(plain_text, encoding='utf-8')
-            console.print(f"[info]报告已保存(纯文本): {report_path}")
-            if export_dir:
-                log.info("缺失 TABLE/VIEW 映射已输出到: %s", export_dir)
-        except OSError as exc:
-            console.print(f"[missing]报告写入失败: {exc}")
+                render_dep_rows("缺失", dependency_report.get("missing", []), "missing")
+                render_dep_rows("额外", dependency_report.get("unexpected", []), "mismatch")
+                render_dep_rows("跳过", dependency_report.get("skipped", []), "info")
+                console.print(dep_table)
+
+            if required_grants:
+                grant_table = Table(title=f"[header]10. 授权建议 (共 {grant_stmt_cnt} 条)", width=section_width)
+                grant_table.add_column("授权对象", style="info", width=OBJECT_COL_WIDTH)
+                grant_table.add_column("语句", width=DETAIL_COL_WIDTH)
+                for grantee, entries in sorted(required_grants.items()):
+                    lines = [
+                        f"GRANT {priv} ON {obj} TO {grantee};"
+                        for priv, obj in sorted(entries)
+                    ]
+                    grant_table.add_row(grantee, "\n".join(lines))
+                console.print(grant_table)
+
+            # --- 4. 无效 Remap 规则 ---
+            if tv_results['extraneous']:
+                table = Table(title=f"[header]4. 无效的 Remap 规则 (共 {extraneous_count} 个)", width=section_width)
+                table.add_column("在 remap_rules.txt 中定义, 但在源端 Oracle 中未找到的对象", style="info", width=section_width - 6)
+                for item in tv_results['extraneous']:
+                    table.add_row(item, style="mismatch")
+                console.print(table)
+
+            # --- 提示 ---
+            console.print(FIXUP_DIR_PANEL)
+            console.print(REPORT_END_PANEL)
+
+        if report_file:
+            report_path = Path(report_file)
+            export_dir = export_future.result()
+            try:
+                report_path.parent.mkdir(parents=True, exist_ok=True)
+                report_text = console.export_text(clear=False)
+                # 生成便于 vi/less 查看且无颜色/框线的纯文本报告
+                plain_text = strip_ansi_text(report_text).translate(BOX_ASCII_TRANS)
+                report_path.write_text(plain_text, encoding='utf-8')
+                console.print(f"[info]报告已保存(纯文本): {report_path}")
+                if export_dir:
+                    log.info("缺失 TABLE/VIEW 映射已输出到: %s", export_dir)
+            except OSError as exc:
+                console.print(f"[missing]报告写入失败: {exc}")
+    finally:
+        # 渲染过程中出现异常时也要回收后台线程；正常路径下导出结果已在上面 result() 取回（其异常也由此抛出）
+        if export_executor is not None:
+            export_executor.shutdown()
 
 
 # ====================== 主函数 ======================
@@ -5248,6 +6150,11 @@ def parse_cli_args() -> argparse.Namespace:
         action="store_true",
         help="启动交互式配置向导：缺失/无效项时提示输入并写回配置，然后继续运行主流程。",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="忽略本地 OB 元数据与 Oracle 源对象缓存，强制重新查询（结果仍会写回缓存）。",
+    )
     return parser.parse_args()
 
 
@@ -5296,7 +6203,13 @@ def main():
     remap_rules = load_remap_rules(settings['remap_file'])
 
     # 3) 加载源端主对象 (TABLE/VIEW/PROC/FUNC/PACKAGE/PACKAGE BODY/SYNONYM)
-    source_objects = get_source_objects(ora_cfg, settings['source_schemas_list'])
+    source_objects = load_source_objects_cached(
+        ora_cfg,
+        settings['source_schemas_list'],
+        settings['metadata_cache_dir'],
+        settings.get('source_objects_cache_ttl', 0),
+        refresh=args.no_cache
+    )
 
     # 4) 验证 Remap 规则
     extraneous_rules = validate_remap_rules(remap_rules, source_objects, settings.get("remap_file"))
@@ -5411,9 +6324,7 @@ def main():
     if not tracked_types:
         tracked_types = {'TABLE'}
 
-    ob_meta = dump_ob_metadata(
-        ob_cfg,
-        target_schemas,
+    ob_dump_options = dict(
         tracked_object_types=tracked_types,
         include_tab_columns='TABLE' in enabled_primary_types,
         include_indexes='INDEX' in enabled_extra_types,
@@ -5421,8 +6332,30 @@ def main():
         include_triggers='TRIGGER' in enabled_extra_types,
         include_sequences='SEQUENCE' in enabled_extra_types,
         include_comments=enable_comment_check,
-        target_table_pairs=target_table_pairs if enable_comment_check else set()
+        target_table_pairs=target_table_pairs,
+        columns_timeout=settings['obclient_timeout_columns'],
+        max_workers=settings['ob_dump_parallelism']
     )
+    # OB 元数据缓存：键包含连接目标、schema 集合与全部转储开关，任一变化即失效
+    ob_cache_ttl = settings.get('ob_meta_cache_ttl', 0)
+    ob_cache_path: Optional[Path] = None
+    ob_meta: Optional[ObMetadata] = None
+    if ob_cache_ttl > 0:
+        cache_key = make_cache_key(
+            OB_META_CACHE_FORMAT,
+            ob_cfg.get('host'), ob_cfg.get('port'), ob_cfg.get('user_string'),
+            sorted(target_schemas),
+            sorted(tracked_types),
+            sorted(target_table_pairs),
+            sorted((k, v) for k, v in ob_dump_options.items() if isinstance(v, bool))
+        )
+        ob_cache_path = Path(settings['metadata_cache_dir']) / f"ob_meta_{cache_key}.pkl"
+        if not args.no_cache:
+            ob_meta = load_pickle_cache(ob_cache_path, ob_cache_ttl)
+    if ob_meta is None:
+        ob_meta = dump_ob_metadata(ob_cfg, target_schemas, **ob_dump_options)
+        if ob_cache_path is not None:
+            save_pickle_cache(ob_cache_path, ob_meta)
     ob_dependencies: Set[Tuple[str, str, str, str]] = set()
     if enable_dependencies_check:
         ob_dependencies = load_ob_dependencies(ob_cfg, target_schemas)